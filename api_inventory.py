@@ -0,0 +1,139 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Author : sgeary
+Created On : Sun Oct 18 2026
+File : api_inventory.py
+'''
+import logging, threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+#  Query options for the inventory summary endpoint.  These match the options
+#  used by common.api.project.get_inventory_summary for each report variant
+inventorySummaryOptions = {
+    True : "&includeVulnerabilities=true&cvssVersion=3.0&published=true&includeFiles=false",
+    False : "&includeVulnerabilities=false&published=true&includeFiles=false",
+}
+
+#----------------------------------------------------------------------#
+class PageExecutor(ThreadPoolExecutor):
+    # Thread pool for the inventory pages that keeps track of the pages still to
+    # be fetched so they can be cancelled if the report fails part way through
+    def __init__(self, max_workers):
+        super().__init__(max_workers=max_workers)
+        self.pageLock = threading.Lock()
+        self.pendingPages = set()
+
+    def submit(self, *args, **kwargs):
+        pendingPage = super().submit(*args, **kwargs)
+        with self.pageLock:
+            self.pendingPages.add(pendingPage)
+        pendingPage.add_done_callback(self.page_done)
+        return pendingPage
+
+    def page_done(self, pendingPage):
+        with self.pageLock:
+            self.pendingPages.discard(pendingPage)
+
+    def cancel_pages(self):
+        with self.pageLock:
+            pendingPages = list(self.pendingPages)
+        for pendingPage in pendingPages:
+            pendingPage.cancel()
+
+#----------------------------------------------------------------------#
+class InventoryPages(object):
+    # Iterates over a project's inventory summary one page at a time while the
+    # following pages are fetched concurrently by the page executor.  Only a
+    # few pages are requested ahead of the page being processed
+    def __init__(self, baseURL, projectID, authToken, includeVulnerabilities, pageSize, pageExecutor, pagesAhead):
+        self.baseURL = baseURL
+        self.projectID = projectID
+        self.authToken = authToken
+        self.includeVulnerabilities = includeVulnerabilities
+        self.pageSize = pageSize
+        self.pageExecutor = pageExecutor
+        self.pagesAhead = max(1, pagesAhead)
+
+        # The first page is fetched straight away so any problem with the
+        # endpoint shows up before the report starts to use the pages
+        firstPage, self.numberOfPages = get_inventory_page(baseURL, projectID, includeVulnerabilities, 1, pageSize, authToken)
+
+        self.pendingPages = deque()
+        self.nextPageNumber = 2
+        self.firstPage = firstPage
+
+        if not self.is_last_page(1, firstPage):
+            self.request_pages()
+
+    def request_pages(self):
+        while len(self.pendingPages) < self.pagesAhead and not self.is_past_last_page(self.nextPageNumber):
+            self.pendingPages.append(self.pageExecutor.submit(get_inventory_page, self.baseURL, self.projectID, self.includeVulnerabilities, self.nextPageNumber, self.pageSize, self.authToken))
+            self.nextPageNumber += 1
+
+    def is_past_last_page(self, pageNumber):
+        # Without a page count the pages are requested until one is not full
+        return self.numberOfPages is not None and pageNumber > self.numberOfPages
+
+    def is_last_page(self, pageNumber, inventoryPage):
+        # The page count is used when the server supplies it since the server
+        # may return fewer items per page than were asked for
+        if self.numberOfPages is not None:
+            return pageNumber >= self.numberOfPages
+        return len(inventoryPage) < self.pageSize
+
+    def __iter__(self):
+        # A failure fetching any page after the first fails the report since the
+        # items already processed can't be matched up with a single request
+        inventoryPage = self.firstPage
+        self.firstPage = None
+        pageNumber = 1
+        itemCount = 0
+
+        try:
+            while True:
+                itemCount += len(inventoryPage)
+                yield from inventoryPage
+
+                if self.is_last_page(pageNumber, inventoryPage) or not self.pendingPages:
+                    break
+
+                inventoryPage = self.pendingPages.popleft().result()[0]
+                pageNumber += 1
+                self.request_pages()
+        finally:
+            # Anything requested past the end of the inventory (or not read
+            # because the processing failed) is not needed
+            self.cancel_pages()
+
+        if self.numberOfPages is not None and not (self.numberOfPages - 1) * self.pageSize < itemCount <= self.numberOfPages * self.pageSize:
+            logger.warning("    Project %s returned %s inventory items in %s pages of %s items.  The server may limit the page size" %(self.projectID, itemCount, self.numberOfPages, self.pageSize))
+
+    def cancel_pages(self):
+        for pendingPage in self.pendingPages:
+            pendingPage.cancel()
+        self.pendingPages.clear()
+
+#----------------------------------------------------------------------#
+def get_inventory_page(baseURL, projectID, includeVulnerabilities, pageNumber, pageSize, authToken):
+    logger.debug("Fetching inventory page %s for project %s", pageNumber, projectID)
+
+    # The offset is the page number for the Code Insight REST API
+    inventoryURL = baseURL + "/codeinsight/api/projects/" + str(projectID) + "/inventorySummary?offset=" + str(pageNumber) + "&limit=" + str(pageSize) + inventorySummaryOptions[includeVulnerabilities]
+    response = requests.get(inventoryURL, headers={"Content-Type" : "application/json", "Authorization" : "Bearer " + authToken})
+
+    if response.status_code != 200:
+        raise RuntimeError("Unable to get inventory page %s for project %s.  Response code %s" %(pageNumber, projectID, response.status_code))
+
+    numberOfPages = response.headers.get("Number-of-pages")
+    if numberOfPages is not None:
+        numberOfPages = int(numberOfPages)
+
+    return response.json()["data"], numberOfPages
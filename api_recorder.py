@@ -0,0 +1,143 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Author : sgeary
+Created On : Sun Oct 18 2026
+File : api_recorder.py
+'''
+import logging, importlib, json, os, threading
+from urllib.parse import quote
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+#  The API calls made by the report.  Each is called with the baseURL
+#  first and the authToken last so the arguments in between (if any) identify
+#  the response i.e. get_license_details(baseURL, licenseID, authToken)
+recordedFunctions = [
+    ("common.api.system.release", "get_release_details"),
+    ("common.api.project.get_child_projects", "get_child_projects_recursively"),
+    ("common.api.project.get_project_information", "get_project_information_summary"),
+    ("common.api.project.get_inventory_summary", "get_project_inventory_with_v3_summary"),
+    ("common.api.project.get_inventory_summary", "get_project_inventory_without_vulns_summary"),
+    ("common.api.license.license_lookup", "get_license_details"),
+    ("common.api.component.get_component_details", "get_component_details_v3_summary"),
+    ("report_data", "get_all_projects"),
+    ("api_inventory", "get_inventory_page"),
+]
+
+uploadFunction = ("common.api.project.upload_reports", "upload_project_report_data")
+
+# Path served by the replay server (benchmarks/replay_server.py)
+replayPath = "/replay/"
+
+recordedResponses = {}
+recordingFile = None
+recordingLock = threading.Lock()
+originalFunctions = {}
+
+#----------------------------------------------------------------------#
+def get_response_key(args):
+    return "|".join(str(arg) for arg in args[1:-1])
+
+#----------------------------------------------------------------------#
+def start_recording(recordFile):
+    global recordingFile
+    logger.info("Entering start_recording")
+
+    recordingFile = recordFile
+
+    for moduleName, functionName in recordedFunctions:
+        replace_function(moduleName, functionName, create_recording_function(functionName, get_original_function(moduleName, functionName)))
+
+    logger.info("    Recording API responses to %s" %recordingFile)
+
+#----------------------------------------------------------------------#
+def create_recording_function(functionName, originalFunction):
+
+    def record_response(*args):
+        response = originalFunction(*args)
+
+        with recordingLock:
+            recordedResponses.setdefault(functionName, {})[get_response_key(args)] = response
+
+        return response
+
+    return record_response
+
+#----------------------------------------------------------------------#
+def stop_recording():
+    global recordingFile
+    logger.info("Entering stop_recording")
+
+    if recordingFile is None:
+        return
+
+    with recordingLock:
+        try:
+            with open(recordingFile, "w") as recording_ptr:
+                json.dump(recordedResponses, recording_ptr)
+        except OSError as e:
+            logger.error("Unable to write API recording %s: %s" %(recordingFile, e))
+        else:
+            logger.info("    %s API responses written to %s" %(sum(len(responses) for responses in recordedResponses.values()), recordingFile))
+
+    recordingFile = None
+
+#----------------------------------------------------------------------#
+def start_replay():
+    logger.info("Entering start_replay")
+
+    # The recorded responses are fetched from the replay server at the baseURL
+    # so the shared session, retries and endpoint timings are all exercised
+    for moduleName, functionName in recordedFunctions:
+        replace_function(moduleName, functionName, create_replay_function(functionName))
+
+    replace_function(uploadFunction[0], uploadFunction[1], replay_upload)
+
+    logger.info("    Replaying API responses from the replay server")
+
+#----------------------------------------------------------------------#
+def create_replay_function(functionName):
+
+    def replay_response(*args):
+        baseURL = args[0]
+        authToken = args[-1]
+
+        replayURL = baseURL + replayPath + functionName + "?key=" + quote(get_response_key(args), safe="")
+        response = requests.get(replayURL, headers={"Authorization" : "Bearer " + authToken})
+
+        if response.status_code != 200:
+            raise RuntimeError("No recorded response for %s %s" %(functionName, get_response_key(args)))
+
+        return response.json()
+
+    return replay_response
+
+#----------------------------------------------------------------------#
+def replay_upload(baseURL, projectID, reportID, authToken, uploadZipfile):
+
+    replayURL = baseURL + replayPath + uploadFunction[1]
+
+    with open(uploadZipfile, "rb") as upload_ptr:
+        response = requests.post(replayURL, headers={"Authorization" : "Bearer " + authToken}, files={"file" : (os.path.basename(uploadZipfile), upload_ptr, "application/zip")})
+
+    if response.status_code not in [200, 201]:
+        raise RuntimeError("Report upload failed with response code %s" %response.status_code)
+
+#----------------------------------------------------------------------#
+def get_original_function(moduleName, functionName):
+
+    if (moduleName, functionName) not in originalFunctions:
+        originalFunctions[(moduleName, functionName)] = getattr(importlib.import_module(moduleName), functionName)
+
+    return originalFunctions[(moduleName, functionName)]
+
+#----------------------------------------------------------------------#
+def replace_function(moduleName, functionName, newFunction):
+    # The report calls these via the module attribute so this is all that is needed
+    get_original_function(moduleName, functionName)
+    setattr(importlib.import_module(moduleName), functionName, newFunction)
@@ -0,0 +1,85 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Author : sgeary
+Created On : Sun Oct 18 2026
+File : api_session.py
+'''
+import logging, re, time
+from urllib.parse import urlsplit
+
+import requests
+import requests.adapters
+from urllib3.util.retry import Retry
+
+import report_metrics
+
+logger = logging.getLogger(__name__)
+
+sharedSession = None
+originalRequest = requests.api.request
+
+#----------------------------------------------------------------------#
+def open_session(poolSize, maxRetries, backoffFactor):
+    global sharedSession
+    logger.info("Entering open_session")
+
+    if sharedSession is not None:
+        return sharedSession
+
+    # Retry idempotent requests that are throttled or hit a server side error
+    retryStrategy = Retry(total=maxRetries, backoff_factor=backoffFactor, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False)
+    httpAdapter = requests.adapters.HTTPAdapter(pool_connections=poolSize, pool_maxsize=poolSize, max_retries=retryStrategy)
+
+    session = requests.Session()
+    session.mount("http://", httpAdapter)
+    session.mount("https://", httpAdapter)
+
+    sharedSession = session
+
+    # The common.api modules make their calls via requests.get/post etc. so
+    # route those through the shared session to reuse the pooled connections
+    requests.api.request = session_request
+    requests.request = session_request
+
+    logger.info("    Shared session created with pool size %s and %s retries" %(poolSize, maxRetries))
+
+    return sharedSession
+
+#----------------------------------------------------------------------#
+def close_session():
+    global sharedSession
+    logger.info("Entering close_session")
+
+    if sharedSession is None:
+        return
+
+    requests.api.request = originalRequest
+    requests.request = originalRequest
+
+    sharedSession.close()
+    sharedSession = None
+
+#----------------------------------------------------------------------#
+def session_request(method, url, **kwargs):
+
+    startTime = time.perf_counter()
+    try:
+        return sharedSession.request(method=method, url=url, **kwargs)
+    finally:
+        record_endpoint_latency(method, url, time.perf_counter() - startTime)
+
+#----------------------------------------------------------------------#
+def get_endpoint_name(method, url):
+    # Group the calls by endpoint by removing the query and any IDs from the path
+    urlPath = urlsplit(url).path
+    urlPath = re.sub(r"/\d+(?=/|$)", "/{id}", urlPath)
+
+    return method.upper() + " " + urlPath
+
+#----------------------------------------------------------------------#
+def record_endpoint_latency(method, url, latency):
+    # Per endpoint counts and latency percentiles are part of the report metrics
+    report_metrics.record_timing("endpoints", get_endpoint_name(method, url), latency)
@@ -0,0 +1,133 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Author : sgeary
+Created On : Sun Oct 18 2026
+File : bench_html_rows.py
+'''
+import sys, os, argparse, logging, random, tempfile, time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import report_artifacts_html
+from report_inventory import ProjectDetails, InventoryRecord
+
+logger = logging.getLogger(__name__)
+logging.disable(logging.CRITICAL)  # Only interested in the cost of writing the rows
+
+parser = argparse.ArgumentParser(description="Compare the original and templated HTML inventory row writers")
+parser.add_argument("-rows", "--rows", type=int, nargs="+", default=[10000, 100000], help="Number of inventory rows to write")
+parser.add_argument("-seed", "--seed", type=int, default=1, help="Random seed for the synthetic data")
+
+#----------------------------------------------------------------------#
+def create_synthetic_inventory(numberOfRows, seed):
+
+    randomizer = random.Random(seed)
+
+    projects = []
+    for projectNumber in range(20):
+        projects.append(ProjectDetails(projectNumber, "Project %s" %projectNumber, "https://example.com/project/%s" %projectNumber, "Application %s - 1.0" %projectNumber))
+
+    inventoryData = {}
+    for inventoryID in range(numberOfRows):
+        componentName = "component-%s" %randomizer.randint(0, 5000)
+        inventoryData[inventoryID] = InventoryRecord(
+            project = randomizer.choice(projects),
+            inventoryID = inventoryID,
+            inventoryItemName = componentName + " (1.0)",
+            componentName = componentName,
+            componentVersionName = "1.%s" %randomizer.randint(0, 20),
+            selectedLicenseName = randomizer.choice(["MIT", "Apache-2.0", "GPL-2.0-only", ""]),
+            selectedLicenseUrl = randomizer.choice(["", "https://spdx.org/licenses/MIT.html"]),
+            componentUrl = randomizer.choice(["N/A", "https://example.com/" + componentName]),
+            hasVulnerabilities = randomizer.choice([True, False]),
+            purlString = "pkg:npm/%s@1.0" %componentName
+        )
+
+    return inventoryData
+
+#----------------------------------------------------------------------#
+def write_inventory_rows_original(html_ptr, inventoryItems, includeProjectColumn, includeVulnerabilities):
+    # The per cell writes used by generate_html_report prior to the templated rows
+    for inventoryID, inventoryItem in inventoryItems:
+
+        logger.debug("        Reporting for inventory item %s" %inventoryID)
+        projectName = inventoryItem.projectName
+        inventoryItemName = inventoryItem.inventoryItemName
+        componentName = inventoryItem.componentName
+        componentUrl = inventoryItem.componentUrl
+        componentVersionName = inventoryItem.componentVersionName
+        selectedLicenseName = inventoryItem.selectedLicenseName
+        selectedLicenseUrl = inventoryItem.selectedLicenseUrl
+        hasVulnerabilities = inventoryItem.hasVulnerabilities
+        purlString = inventoryItem.purlString
+
+        applicationNameVersion = inventoryItem.applicationNameVersion
+
+        logger.debug("            Project Name:  %s   Inventory Name %s" %(projectName, inventoryItemName))
+
+        html_ptr.write("        <tr> \n")
+        if includeProjectColumn:
+            html_ptr.write("            <td class='text-left'>%s</td>\n" %(applicationNameVersion))
+
+        if componentUrl == "N/A":
+            html_ptr.write("            <td class='text-left'>%s</td>\n" %(componentName))
+        else:
+            html_ptr.write("            <td class='text-left'><a href='%s' target='_blank'>%s</a></td>\n" %(componentUrl, componentName))
+
+        html_ptr.write("            <td class='text-left'>%s</td>\n" %(componentVersionName))
+
+        if selectedLicenseUrl == "":
+            html_ptr.write("            <td class='text-left'>%s</td>\n" %(selectedLicenseName))
+        else:
+            html_ptr.write("            <td class='text-left'><a href='%s' target='_blank'>%s</a></td>\n" %(selectedLicenseUrl, selectedLicenseName))
+
+        html_ptr.write("            </td>\n")
+
+        html_ptr.write("            <td class='text-left'>%s</td>\n" %(purlString))
+
+        if includeVulnerabilities:
+            if hasVulnerabilities:
+                html_ptr.write("            <td class='text-left'>Yes</td>\n")
+            else:
+                html_ptr.write("            <td class='text-left'>&nbsp</td>\n")
+
+        html_ptr.write("        </tr>\n")
+
+#----------------------------------------------------------------------#
+def time_writer(rowWriter, htmlFile, bufferSize, inventoryData):
+
+    startTime = time.perf_counter()
+    with open(htmlFile, "w", buffering=bufferSize) as html_ptr:
+        rowWriter(html_ptr, inventoryData.items(), True, True)
+    return time.perf_counter() - startTime
+
+#----------------------------------------------------------------------#
+def main():
+
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as outputDirectory:
+        originalFile = os.path.join(outputDirectory, "original.html")
+        templatedFile = os.path.join(outputDirectory, "templated.html")
+
+        for numberOfRows in args.rows:
+            inventoryData = create_synthetic_inventory(numberOfRows, args.seed)
+
+            originalTime = time_writer(write_inventory_rows_original, originalFile, -1, inventoryData)
+            templatedTime = time_writer(report_artifacts_html.write_inventory_rows, templatedFile, report_artifacts_html.htmlWriteBufferSize, inventoryData)
+
+            with open(originalFile, "rb") as original_ptr, open(templatedFile, "rb") as templated_ptr:
+                identicalOutput = original_ptr.read() == templated_ptr.read()
+
+            print("Rows: %-8s  original: %.3f s  templated: %.3f s  speedup: %.2fx  identical: %s" %(numberOfRows, originalTime, templatedTime, originalTime / templatedTime, identicalOutput))
+
+            if not identicalOutput:
+                sys.exit(1)
+
+
+#----------------------------------------------------------------------#
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Author : sgeary
+Created On : Sun Oct 18 2026
+File : bench_inventory_memory.py
+'''
+import sys, os, argparse, random, time, tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from report_inventory import ProjectDetails, InventoryRecord
+
+parser = argparse.ArgumentParser(description="Compare the memory used by dictionary and slotted inventory records")
+parser.add_argument("-rows", "--rows", type=int, nargs="+", default=[100000, 500000], help="Number of inventory items to create")
+parser.add_argument("-projects", "--projects", type=int, default=200, help="Number of projects the inventory is spread across")
+parser.add_argument("-seed", "--seed", type=int, default=1, help="Random seed for the synthetic data")
+
+#----------------------------------------------------------------------#
+def create_synthetic_values(numberOfRows, numberOfProjects, seed):
+
+    # The raw values are created up front so only the records are measured.
+    # Strings are built per item as they would be when decoded from the API
+    randomizer = random.Random(seed)
+
+    inventoryValues = []
+    for inventoryID in range(numberOfRows):
+        projectNumber = randomizer.randint(0, numberOfProjects - 1)
+        componentName = "component-%s" %randomizer.randint(0, 5000)
+        inventoryValues.append((
+            projectNumber,
+            inventoryID,
+            componentName + " (1.0)",
+            "".join(componentName),
+            "1.%s" %randomizer.randint(0, 20),
+            "".join(randomizer.choice(["MIT", "Apache-2.0", "GPL-2.0-only", ""])),
+            "".join(randomizer.choice(["", "https://spdx.org/licenses/MIT.html"])),
+            randomizer.choice(["N/A", "https://example.com/" + componentName]),
+            randomizer.choice([True, False]),
+            "pkg:npm/%s@1.0" %componentName
+        ))
+
+    return inventoryValues
+
+#----------------------------------------------------------------------#
+def create_dictionary_inventory(inventoryValues):
+    # The dict of dicts used by gather_data_for_report prior to InventoryRecord.
+    # The project values were shared by the items of each project there too
+    projects = {}
+    inventoryData = {}
+    for projectNumber, inventoryID, inventoryItemName, componentName, componentVersionName, selectedLicenseName, selectedLicenseUrl, componentUrl, hasVulnerabilities, purlString in inventoryValues:
+        if projectNumber not in projects:
+            projectName = "Project %s" %projectNumber
+            projectLink = "https://example.com/codeinsight/FNCI#myprojectdetails/?id=" + str(projectNumber) + "&tab=projectInventory"
+            projects[projectNumber] = (projectName, projectLink, projectName + " - 1.0")
+
+        projectName, projectLink, applicationNameVersion = projects[projectNumber]
+        inventoryData[inventoryID] = {
+            "projectName" : projectName,
+            "inventoryItemName" : inventoryItemName,
+            "componentName" : componentName,
+            "componentVersionName" : componentVersionName,
+            "selectedLicenseName" : selectedLicenseName,
+            "componentUrl" : componentUrl,
+            "selectedLicenseUrl" : selectedLicenseUrl,
+            "inventoryLink" : projectLink + "&pinv=" + str(inventoryID),
+            "projectLink" : projectLink,
+            "hasVulnerabilities" : hasVulnerabilities,
+            "applicationNameVersion" : applicationNameVersion,
+            "purlString" : purlString
+        }
+
+    return inventoryData
+
+#----------------------------------------------------------------------#
+def create_record_inventory(inventoryValues):
+
+    projects = {}
+    inventoryData = {}
+    for projectNumber, inventoryID, inventoryItemName, componentName, componentVersionName, selectedLicenseName, selectedLicenseUrl, componentUrl, hasVulnerabilities, purlString in inventoryValues:
+        if projectNumber not in projects:
+            projectName = "Project %s" %projectNumber
+            projectLink = "https://example.com/codeinsight/FNCI#myprojectdetails/?id=" + str(projectNumber) + "&tab=projectInventory"
+            projects[projectNumber] = ProjectDetails(projectNumber, projectName, projectLink, projectName + " - 1.0")
+
+        inventoryData[inventoryID] = InventoryRecord(projects[projectNumber], inventoryID, inventoryItemName, componentName, componentVersionName, selectedLicenseName, selectedLicenseUrl, componentUrl, hasVulnerabilities, purlString)
+
+    return inventoryData
+
+#----------------------------------------------------------------------#
+def measure_inventory(createInventory, inventoryValues):
+
+    tracemalloc.start()
+    startTime = time.perf_counter()
+    inventoryData = createInventory(inventoryValues)
+    elapsedTime = time.perf_counter() - startTime
+    currentMemory, peakMemory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Time a full pass over the sort key fields used by report_data
+    startTime = time.perf_counter()
+    if isinstance(next(iter(inventoryData.values())), dict):
+        sorted(inventoryData.items(), key=lambda x: (x[1]['componentName'],  x[1]['componentVersionName'], x[1]['selectedLicenseName']))
+    else:
+        sorted(inventoryData.items(), key=lambda x: (x[1].componentName,  x[1].componentVersionName, x[1].selectedLicenseName))
+    sortTime = time.perf_counter() - startTime
+
+    return currentMemory, peakMemory, elapsedTime, sortTime
+
+#----------------------------------------------------------------------#
+def main():
+
+    args = parser.parse_args()
+
+    for numberOfRows in args.rows:
+        inventoryValues = create_synthetic_values(numberOfRows, args.projects, args.seed)
+
+        dictionaryMemory, dictionaryPeak, dictionaryTime, dictionarySort = measure_inventory(create_dictionary_inventory, inventoryValues)
+        recordMemory, recordPeak, recordTime, recordSort = measure_inventory(create_record_inventory, inventoryValues)
+
+        print("Rows: %-8s  dict: %7.1f MB (build %.2f s, sort %.2f s)  records: %7.1f MB (build %.2f s, sort %.2f s)  reduction: %.1f%%" %(
+            numberOfRows,
+            dictionaryMemory / (1024 * 1024), dictionaryTime, dictionarySort,
+            recordMemory / (1024 * 1024), recordTime, recordSort,
+            100 * (1 - recordMemory / dictionaryMemory)))
+
+
+#----------------------------------------------------------------------#
+if __name__ == "__main__":
+    main()
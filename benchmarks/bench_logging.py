@@ -0,0 +1,88 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Author : sgeary
+Created On : Sun Oct 18 2026
+File : bench_logging.py
+'''
+import sys, os, argparse, logging, logging.handlers, queue, tempfile, time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import report_logging
+
+logger = logging.getLogger("bench_logging")
+
+parser = argparse.ArgumentParser(description="Compare the cost of the per inventory item logging for each logging mode")
+parser.add_argument("-rows", "--rows", type=int, default=50000, help="Number of inventory items to log")
+
+#----------------------------------------------------------------------#
+def log_items_eagerly(numberOfRows):
+    # The per item logging used prior to the lazy logging changes
+    for inventoryID in range(numberOfRows):
+        logger.debug("        Reporting for inventory item %s" %inventoryID)
+        logger.debug("            Project Name:  %s   Inventory Name %s" %("Project %s" %(inventoryID % 20), "component-%s (1.0)" %inventoryID))
+
+#----------------------------------------------------------------------#
+def log_items_lazily(numberOfRows):
+    for inventoryID in range(numberOfRows):
+        logger.debug("        Reporting for inventory item %s", inventoryID)
+        logger.debug("            Project Name:  %s   Inventory Name %s", "Project %s" %(inventoryID % 20), "component-%s (1.0)" %inventoryID)
+
+#----------------------------------------------------------------------#
+def time_logging(logItems, numberOfRows, logLevel, asynchronous, logfileName):
+
+    rootLogger = logging.getLogger()
+    rootLogger.setLevel(logLevel)
+
+    queueListener = None
+    if asynchronous:
+        logQueue = queue.SimpleQueue()
+        queueListener = logging.handlers.QueueListener(logQueue, report_logging.create_file_handler(logfileName))
+        queueListener.start()
+        logHandler = report_logging.DeferredQueueHandler(logQueue)
+    else:
+        logHandler = report_logging.create_file_handler(logfileName)
+
+    rootLogger.addHandler(logHandler)
+
+    startTime = time.perf_counter()
+    logItems(numberOfRows)
+    loggingTime = time.perf_counter() - startTime
+
+    # Time taken until everything is in the log file
+    if queueListener is not None:
+        queueListener.stop()
+    totalTime = time.perf_counter() - startTime
+
+    rootLogger.removeHandler(logHandler)
+    logHandler.close()
+
+    return loggingTime, totalTime
+
+#----------------------------------------------------------------------#
+def main():
+
+    args = parser.parse_args()
+
+    loggingModes = [
+        ("eager, DEBUG, synchronous", log_items_eagerly, logging.DEBUG, False),
+        ("lazy, DEBUG, synchronous", log_items_lazily, logging.DEBUG, False),
+        ("lazy, DEBUG, queued", log_items_lazily, logging.DEBUG, True),
+        ("eager, INFO, synchronous", log_items_eagerly, logging.INFO, False),
+        ("lazy, INFO, queued", log_items_lazily, logging.INFO, True),
+    ]
+
+    with tempfile.TemporaryDirectory() as outputDirectory:
+        logfileName = os.path.join(outputDirectory, "_sbom_report.log")
+
+        for modeName, logItems, logLevel, asynchronous in loggingModes:
+            loggingTime, totalTime = time_logging(logItems, args.rows, logLevel, asynchronous, logfileName)
+            print("Rows: %-8s  %-28s  report thread: %.3f s  until written: %.3f s" %(args.rows, modeName, loggingTime, totalTime))
+
+
+#----------------------------------------------------------------------#
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Author : sgeary
+Created On : Sun Oct 18 2026
+File : bench_purl.py
+'''
+import sys, os, argparse, logging, random, time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import purl
+
+logging.disable(logging.CRITICAL)  # Only interested in the purl creation cost
+
+parser = argparse.ArgumentParser(description="Micro-benchmark for purl string creation")
+parser.add_argument("-items", "--items", type=int, default=100000, help="Number of synthetic inventory items")
+parser.add_argument("-seed", "--seed", type=int, default=1, help="Random seed for the synthetic data")
+
+#----------------------------------------------------------------------#
+def create_synthetic_items(numberOfItems, seed):
+
+    randomizer = random.Random(seed)
+    forges = [forge for forge in purl.forgeRegistry if purl.forgeRegistry[forge] is not None]
+
+    inventoryItems = []
+    for itemNumber in range(numberOfItems):
+        forge = randomizer.choice(forges)
+        componentName = "component_%s" %randomizer.randint(0, 5000)
+        componentTitle = "org.example%s/%s - Synthetic component" %(randomizer.randint(0, 50), componentName)
+        componentVersionName = randomizer.choice(["1.0.%s" %itemNumber, "2.%s.0+build" %itemNumber, "N/A"])
+        inventoryItems.append((forge, componentTitle, componentName, componentVersionName))
+
+    return inventoryItems
+
+#----------------------------------------------------------------------#
+def main():
+
+    args = parser.parse_args()
+
+    inventoryItems = create_synthetic_items(args.items, args.seed)
+
+    startTime = time.perf_counter()
+    for forge, componentTitle, componentName, componentVersionName in inventoryItems:
+        purl.create_purl_string(forge, componentTitle, componentName, componentVersionName)
+    elapsedTime = time.perf_counter() - startTime
+
+    print("Items:          %s" %args.items)
+    print("Total time:     %.3f s" %elapsedTime)
+    print("Per item cost:  %.2f us" %(elapsedTime / args.items * 1000000))
+
+
+#----------------------------------------------------------------------#
+if __name__ == "__main__":
+    main()
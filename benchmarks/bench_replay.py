@@ -0,0 +1,105 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Author : sgeary
+Created On : Sun Oct 18 2026
+File : bench_replay.py
+'''
+import sys, os, argparse, json, subprocess, tempfile, time
+
+reportDirectory = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, reportDirectory)
+
+from create_replay_fixtures import create_synthetic_fixtures
+from replay_server import start_replay_server, load_fixtures
+
+parser = argparse.ArgumentParser(description="Time complete report runs (create_report.py) against the replay server")
+parser.add_argument("-projects", "--projects", type=int, nargs="+", default=[10, 100, 1000], help="Number of projects for each synthetic hierarchy")
+parser.add_argument("-items", "--items", type=int, default=50, help="Number of inventory items for each project")
+parser.add_argument("-shape", "--shape", choices=["wide", "balanced", "deep"], default="balanced", help="Shape of the project hierarchy")
+parser.add_argument("-fixtures", "--fixtures", help="Replay these recorded responses instead of synthetic hierarchies")
+parser.add_argument("-projectID", "--projectID", default="1", help="Project to run the report for")
+parser.add_argument("-latency", "--latency", type=float, default=20, help="Milliseconds added to each API response")
+parser.add_argument("-jitter", "--jitter", type=float, default=10, help="Random milliseconds (0 to jitter) added to each API response")
+parser.add_argument("-settings", "--settings", default="{}", help="json of additional sbom.* settings i.e. '{\"sbom.projectWorkers\" : 16}'")
+parser.add_argument("-reportOptions", "--reportOptions", default='{"includeChildProjects" : "True", "includeVulnerabilities" : "True"}', help="json of the report options")
+
+# The report is run in a new process for each hierarchy as it would be by Code Insight
+reportRunScript = '''
+import sys
+import create_report
+create_report.propertiesFile = sys.argv[1]
+sys.argv = ["create_report.py", "-pid", sys.argv[2], "-rid", "1", "-authToken", "replay", "-reportOpts", sys.argv[3]]
+create_report.main()
+'''
+
+#----------------------------------------------------------------------#
+def run_report(replayServer, args, runDirectory):
+
+    reportSettings = {
+        "core.server.url" : "http://127.0.0.1:%s" %replayServer.server_address[1],
+        "sbom.apiReplay" : True,
+        "sbom.cacheTTL" : 0,
+    }
+    reportSettings.update(json.loads(args.settings))
+
+    propertiesFile = os.path.join(runDirectory, "server_properties.json")
+    with open(propertiesFile, "w") as properties_ptr:
+        json.dump(reportSettings, properties_ptr)
+
+    # Report options are passed the same way as the Code Insight shell script does
+    reportOptions = json.dumps(json.loads(args.reportOptions))
+    if sys.platform.startswith("linux"):
+        reportOptions = '"' + reportOptions.replace('"', '""') + '"'
+
+    environment = dict(os.environ, PYTHONPATH=reportDirectory)
+
+    startTime = time.perf_counter()
+    subprocess.run([sys.executable, "-c", reportRunScript, propertiesFile, args.projectID, reportOptions], cwd=runDirectory, env=environment, check=True, stdout=subprocess.DEVNULL)
+    wallTime = time.perf_counter() - startTime
+
+    # The report run writes its own timings next to the report log file
+    with open(os.path.join(reportDirectory, "_sbom_report_metrics.json")) as metrics_ptr:
+        reportMetrics = json.load(metrics_ptr)
+
+    return wallTime, reportMetrics
+
+#----------------------------------------------------------------------#
+def report_results(hierarchyName, numberOfItems, replayServer, wallTime, reportMetrics):
+
+    phaseTimes = {phaseName : phaseSummary["total"] for phaseName, phaseSummary in reportMetrics.get("phases", {}).items() if "." not in phaseName}
+    endpointCalls = sum(endpointSummary["count"] for endpointSummary in reportMetrics.get("endpoints", {}).values())
+
+    print("%-20s items: %-8s wall: %7.2f s  items/s: %8.0f  API requests: %-7s  %s" %(
+        hierarchyName, numberOfItems, wallTime, numberOfItems / wallTime, endpointCalls,
+        "  ".join("%s: %.2f s" %(phaseName, phaseTime) for phaseName, phaseTime in phaseTimes.items())))
+
+#----------------------------------------------------------------------#
+def main():
+
+    args = parser.parse_args()
+
+    if args.fixtures:
+        hierarchies = [(os.path.basename(args.fixtures), load_fixtures(args.fixtures))]
+    else:
+        hierarchies = [("%s projects" %numberOfProjects, create_synthetic_fixtures(numberOfProjects, args.items, args.shape, "2023R4", 1)) for numberOfProjects in args.projects]
+
+    for hierarchyName, fixtures in hierarchies:
+        numberOfItems = sum(len(projectInventory) for projectInventory in fixtures.get("get_project_inventory_with_v3_summary", {}).values())
+
+        replayServer = start_replay_server(fixtures, latency=args.latency, jitter=args.jitter)
+        try:
+            with tempfile.TemporaryDirectory() as runDirectory:
+                wallTime, reportMetrics = run_report(replayServer, args, runDirectory)
+        finally:
+            replayServer.shutdown()
+            replayServer.server_close()
+
+        report_results(hierarchyName, numberOfItems, replayServer, wallTime, reportMetrics)
+
+
+#----------------------------------------------------------------------#
+if __name__ == "__main__":
+    main()
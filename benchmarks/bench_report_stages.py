@@ -0,0 +1,267 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Author : sgeary
+Created On : Sun Oct 18 2026
+File : bench_report_stages.py
+'''
+import sys, os, argparse, json, multiprocessing, platform, tempfile, time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+reportDirectory = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.insert(0, reportDirectory)
+
+import _version
+import api_recorder
+import report_data
+import report_artifacts
+import report_artifacts_xlsx
+import report_inventory
+import report_logging
+import report_metrics
+import report_settings
+import common.report_archive
+
+import xlsxwriter
+
+from create_replay_fixtures import create_synthetic_fixtures
+
+parser = argparse.ArgumentParser(description="Time each stage of the report creation for synthetic project portfolios")
+parser.add_argument("-items", "--items", type=int, nargs="+", default=[1000, 10000, 100000], help="Total number of inventory items for each portfolio (i.e. 1000 10000 100000 500000)")
+parser.add_argument("-shapes", "--shapes", choices=["wide", "balanced", "deep"], nargs="+", default=["wide", "deep"], help="Shapes of the project hierarchy")
+parser.add_argument("-projects", "--projects", type=int, default=100, help="Number of projects in each hierarchy")
+parser.add_argument("-release", "--release", default="2024R1", help="Code Insight release (pre 2024R1 also times the purl creation)")
+parser.add_argument("-seed", "--seed", type=int, default=1, help="Random seed for the synthetic data")
+parser.add_argument("-aggregate", "--aggregate", action="store_true", help="Enable the aggregateComponents report option")
+parser.add_argument("-settings", "--settings", default="{}", help="json of report settings to use i.e. '{\"htmlDataMode\" : \"json\"}'")
+parser.add_argument("-logLevel", "--logLevel", default="INFO", help="Log level for the report log file written to the temporary directory")
+parser.add_argument("-output", "--output", default="bench_report_stages.json", help="File to write the results to")
+parser.add_argument("-compare", "--compare", help="Results file from a previous run to compare against")
+parser.add_argument("-threshold", "--threshold", type=float, default=10, help="Percentage increase in wall time or peak memory reported as a regression")
+
+resultsVersion = 1  # Layout of the results file
+comparedValues = {"wallTime" : 0.05, "cpuTime" : 0.05, "peakRSSIncrease" : 1.0}  # Values compared and the smallest value (s or MB) considered
+
+#----------------------------------------------------------------------#
+def run_scenario(hierarchyShape, numberOfItems, args):
+
+    scenarioName = "%s-%s" %(hierarchyShape, numberOfItems)
+    itemsPerProject = max(1, numberOfItems // args.projects)
+
+    # Only the inventory variant used by the report is created to keep the raw data small
+    fixtures = create_synthetic_fixtures(args.projects, itemsPerProject, hierarchyShape, args.release, args.seed, inventoryVariants=("withVulnerabilities",))
+    use_fixture_responses(fixtures)
+
+    reportSettings = report_settings.get_report_settings({})
+    reportSettings.update(json.loads(args.settings))
+
+    reportData = {}
+    reportData["projectID"] = 1
+    reportData["reportName"] = "SBOM Report"
+    reportData["reportVersion"] = _version.__version__
+    reportData["reportOptions"] = {"includeChildProjects" : True, "includeVulnerabilities" : True, "aggregateComponents" : args.aggregate}
+    reportData["releaseVersion"] = args.release
+    reportData["fileNameTimeStamp"] = datetime.now().strftime("%Y%m%d-%H%M%S")
+    reportData["reportTimeStamp"] = datetime.now().strftime("%B %d, %Y at %H:%M:%S")
+    reportData["reportSettings"] = reportSettings
+    reportData["reportFileNameBase"] = "Benchmark-" + scenarioName
+
+    stageResults = {}
+
+    # The raw API responses are no longer needed once the data has been gathered
+    reportData = measure_stage(stageResults, "gatherData", report_data.gather_data_for_report, "https://codeinsight.example.com", 1, "benchmark", reportData)
+    fixtures.clear()
+
+    # The sub phases recorded by the report itself i.e. gatherData.processInventory
+    for phaseName, phaseSummary in report_metrics.get_metrics_summary().get("phases", {}).items():
+        stageResults["gatherData"].setdefault("phases", {})[phaseName] = round(phaseSummary["total"], 4)
+
+    artifactFiles = []
+    for artifactName, artifactGenerator in report_artifacts.reportArtifactGenerators:
+        artifactFiles.append(measure_stage(stageResults, artifactName, artifactGenerator, reportData))
+
+    measure_stage(stageResults, "displayProjectHierarchy", display_project_hierarchy, reportData)
+    report_inventory.remove_sorted_runs(reportData)
+
+    reports = {"viewable" : artifactFiles[0], "allFormats" : artifactFiles}
+    uploadZipfile = measure_stage(stageResults, "createArchive", common.report_archive.create_report_zipfile, reports, reportData["reportFileNameBase"])
+    os.remove(uploadZipfile)
+
+    return {
+        "scenario" : scenarioName,
+        "hierarchyShape" : hierarchyShape,
+        "projects" : args.projects,
+        "inventoryItems" : len(reportData["inventoryData"]),
+        "stages" : stageResults,
+    }
+
+#----------------------------------------------------------------------#
+def use_fixture_responses(fixtures):
+
+    # The API calls return the synthetic responses directly so only the
+    # processing of the responses is timed
+    def create_fixture_function(functionName):
+        def fixture_response(*args):
+            return fixtures[functionName][api_recorder.get_response_key(args)]
+        return fixture_response
+
+    for moduleName, functionName in api_recorder.recordedFunctions:
+        api_recorder.replace_function(moduleName, functionName, create_fixture_function(functionName))
+
+#----------------------------------------------------------------------#
+def display_project_hierarchy(reportData):
+
+    # The xlsx hierarchy sheet on its own using an in memory workbook
+    workbook = xlsxwriter.Workbook(os.devnull, {"in_memory" : True})
+    worksheet = workbook.add_worksheet("Project Hierarchy")
+    boldCellFormat = workbook.add_format({"bold" : True})
+
+    worksheet.write(0, 0, reportData["applicationDetails"][reportData["topLevelProjectName"]]["applicationName"], boldCellFormat)
+    report_artifacts_xlsx.display_project_hierarchy(worksheet, reportData["projectHierarchy"], reportData["applicationDetails"], 0, 0, boldCellFormat)
+
+#----------------------------------------------------------------------#
+def measure_stage(stageResults, stageName, stageFunction, *args):
+
+    reset_peak_memory()
+    startMemory = get_memory_usage()["VmRSS"]
+    startWallTime = time.perf_counter()
+    startCPUTime = time.process_time()
+
+    stageResult = stageFunction(*args)
+
+    cpuTime = time.process_time() - startCPUTime
+    wallTime = time.perf_counter() - startWallTime
+    peakMemory = get_memory_usage()["VmHWM"]
+
+    stageResults[stageName] = {
+        "wallTime" : round(wallTime, 4),
+        "cpuTime" : round(cpuTime, 4),
+        "peakRSS" : round(peakMemory, 1),
+        "peakRSSIncrease" : round(max(0, peakMemory - startMemory), 1),
+    }
+
+    print("    %-24s wall: %8.3f s  cpu: %8.3f s  peak RSS: %8.1f MB (+%.1f MB)" %(stageName, wallTime, cpuTime, peakMemory, peakMemory - startMemory))
+
+    return stageResult
+
+#----------------------------------------------------------------------#
+def get_memory_usage():
+
+    # Current (VmRSS) and peak (VmHWM) resident set size in MB
+    memoryUsage = {}
+    try:
+        with open("/proc/self/status") as status_ptr:
+            for statusLine in status_ptr:
+                statusName, statusValue = statusLine.split(":", 1)
+                if statusName in ["VmRSS", "VmHWM"]:
+                    memoryUsage[statusName] = int(statusValue.split()[0]) / 1024
+    except OSError:
+        # Without /proc the process peak is all that is available
+        peakMemory = report_artifacts_xlsx.get_peak_memory_usage()
+        peakMemory = 0 if peakMemory == "N/A" else peakMemory
+        memoryUsage = {"VmRSS" : peakMemory, "VmHWM" : peakMemory}
+
+    return memoryUsage
+
+#----------------------------------------------------------------------#
+def reset_peak_memory():
+
+    # Linux allows the peak resident set size to be reset for each stage
+    try:
+        with open("/proc/self/clear_refs", "w") as clear_refs_ptr:
+            clear_refs_ptr.write("5")
+        return True
+    except OSError:
+        return False
+
+#----------------------------------------------------------------------#
+def compare_results(benchmarkResults, previousResults, threshold):
+
+    previousScenarios = {scenarioResults["scenario"] : scenarioResults for scenarioResults in previousResults["results"]}
+    regressions = []
+
+    for scenarioResults in benchmarkResults["results"]:
+        previousScenario = previousScenarios.get(scenarioResults["scenario"])
+        if previousScenario is None:
+            continue
+
+        for stageName, stageResult in scenarioResults["stages"].items():
+            previousStage = previousScenario["stages"].get(stageName)
+            if previousStage is None:
+                continue
+
+            for valueName, minimumValue in comparedValues.items():
+                previousValue = previousStage[valueName]
+                currentValue = stageResult[valueName]
+
+                # Ignore changes too small to measure reliably
+                if previousValue < minimumValue or currentValue < minimumValue:
+                    continue
+
+                percentChange = (currentValue - previousValue) / previousValue * 100
+                if percentChange > threshold:
+                    regressions.append("%s %s %s: %s -> %s (+%.0f%%)" %(scenarioResults["scenario"], stageName, valueName, previousValue, currentValue, percentChange))
+
+    return regressions
+
+#----------------------------------------------------------------------#
+def main():
+
+    args = parser.parse_args()
+
+    benchmarkResults = {
+        "resultsVersion" : resultsVersion,
+        "reportVersion" : _version.__version__,
+        "createdOn" : datetime.now().isoformat(timespec="seconds"),
+        "python" : platform.python_version(),
+        "platform" : platform.platform(),
+        "cpuCount" : os.cpu_count(),
+        "peakMemoryPerStage" : reset_peak_memory(),
+        "parameters" : {"projects" : args.projects, "release" : args.release, "seed" : args.seed, "aggregate" : args.aggregate, "settings" : json.loads(args.settings), "logLevel" : args.logLevel},
+        "results" : [],
+    }
+
+    outputFile = os.path.abspath(args.output)
+
+    with tempfile.TemporaryDirectory() as runDirectory:
+        os.chdir(runDirectory)  # The report artifacts are written to the current directory
+
+        report_logging.configure_logging(os.path.join(runDirectory, "_sbom_report.log"))
+        report_logging.set_log_level(args.logLevel)
+
+        for hierarchyShape in args.shapes:
+            for numberOfItems in args.items:
+                print("%s hierarchy with %s projects and %s inventory items" %(hierarchyShape, args.projects, numberOfItems))
+
+                # Each scenario is run in a new process so the memory used by one does not affect the next
+                with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("fork")) as executor:
+                    benchmarkResults["results"].append(executor.submit(run_scenario, hierarchyShape, numberOfItems, args).result())
+
+        report_logging.stop_logging()
+        os.chdir(reportDirectory)
+
+    with open(outputFile, "w") as output_ptr:
+        json.dump(benchmarkResults, output_ptr, indent=4)
+
+    print("Results written to %s" %outputFile)
+
+    if args.compare:
+        with open(args.compare) as compare_ptr:
+            previousResults = json.load(compare_ptr)
+
+        regressions = compare_results(benchmarkResults, previousResults, args.threshold)
+        for regression in regressions:
+            print("    REGRESSION  %s" %regression)
+
+        if regressions:
+            sys.exit(1)
+
+        print("No regressions compared to %s" %args.compare)
+
+
+#----------------------------------------------------------------------#
+if __name__ == "__main__":
+    main()
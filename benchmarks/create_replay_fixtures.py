@@ -0,0 +1,179 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Author : sgeary
+Created On : Sun Oct 18 2026
+File : create_replay_fixtures.py
+'''
+import argparse, itertools, json, random
+
+parser = argparse.ArgumentParser(description="Create synthetic API responses for benchmarks/replay_server.py")
+parser.add_argument("-projects", "--projects", type=int, default=100, help="Number of projects in the hierarchy (including the parent project)")
+parser.add_argument("-items", "--items", type=int, default=50, help="Number of inventory items for each project")
+parser.add_argument("-shape", "--shape", choices=["wide", "balanced", "deep"], default="balanced", help="Shape of the project hierarchy")
+parser.add_argument("-release", "--release", default="2023R4", help="Code Insight release (pre 2024R1 the purl is created from the component details, otherwise it is part of the inventory)")
+parser.add_argument("-seed", "--seed", type=int, default=1, help="Random seed for the synthetic data")
+parser.add_argument("-output", "--output", default="replay_fixtures.json", help="File to write the API responses to")
+
+parentProjectID = 1
+childrenPerProject = 10  # Branching factor for the balanced hierarchy
+componentPoolSize = 20000
+
+# A few licenses cover most of the inventory with a long tail of others
+licensePool = ["MIT", "Apache-2.0", "BSD-3-Clause", "ISC", "BSD-2-Clause", "GPL-2.0-only", "LGPL-2.1-or-later", "MPL-2.0", "GPL-3.0-or-later", "EPL-2.0",
+               "CDDL-1.0", "Unlicense", "Zlib", "Artistic-2.0", "CC0-1.0", "OpenSSL", "Python-2.0", "AGPL-3.0-only", "EUPL-1.2", "WTFPL"]
+
+# Forges and the title used for their components
+componentForges = [
+    ("npm", "%(name)s - JavaScript package"),
+    ("pypi", "%(name)s - Python package"),
+    ("maven2-ibiblio", "org.example%(group)s/%(name)s - Java library"),
+    ("github", "owner%(group)s/%(name)s - GitHub repository"),
+    ("nuget gallery", "%(name)s - .NET package"),
+    ("gnu", "%(name)s - GNU project"),
+]
+
+#----------------------------------------------------------------------#
+def create_synthetic_fixtures(numberOfProjects, itemsPerProject, hierarchyShape, releaseVersion, seed, inventoryVariants=("withVulnerabilities", "withoutVulnerabilities")):
+
+    randomizer = random.Random(seed)
+
+    fixtures = {
+        "get_release_details" : {"" : {"fnci.release.name" : releaseVersion}},
+        "get_child_projects_recursively" : {},
+        "get_project_information_summary" : {},
+        "get_project_inventory_with_v3_summary" : {},
+        "get_project_inventory_without_vulns_summary" : {},
+        "get_license_details" : {},
+        "get_component_details_v3_summary" : {},
+        "get_all_projects" : {"" : []},
+    }
+
+    # Each project's part of the hierarchy so any project can be reported on (i.e. batch mode)
+    projectNodes = [create_project_hierarchy(numberOfProjects, hierarchyShape)]
+    while projectNodes:
+        projectNode = projectNodes.pop()
+        fixtures["get_child_projects_recursively"][str(projectNode["id"])] = projectNode
+        projectNodes.extend(projectNode["childProject"])
+
+    # Skewed (zipf like) use of the components and licenses across the inventory
+    componentWeights = list(itertools.accumulate(1 / (rank ** 1.1) for rank in range(1, componentPoolSize + 1)))
+    licenseWeights = list(itertools.accumulate(1 / (rank ** 1.5) for rank in range(1, len(licensePool) + 1)))
+
+    inventoryID = 0
+    for projectID in range(parentProjectID, parentProjectID + numberOfProjects):
+
+        fixtures["get_all_projects"][""].append({"id" : projectID, "name" : get_project_name(projectID)})
+        fixtures["get_project_information_summary"][str(projectID)] = {
+            "id" : projectID,
+            "name" : get_project_name(projectID),
+            "customFields" : [
+                {"fieldLabel" : "Application Name", "value" : "Application %s" %projectID if projectID % 3 == 0 else ""},
+                {"fieldLabel" : "Application Version", "value" : "1.%s" %(projectID % 10)},
+                {"fieldLabel" : "Application Publisher", "value" : ""},
+            ]
+        }
+
+        inventoryWithVulnerabilities = []
+        inventoryWithoutVulnerabilities = []
+
+        for itemNumber in range(itemsPerProject):
+            inventoryID += 1
+            componentID = randomizer.choices(range(componentPoolSize), cum_weights=componentWeights)[0]
+            componentName = "component-%s" %componentID
+            componentVersionName = "%s.%s.%s" %(componentID % 4, randomizer.randint(0, 9), randomizer.randint(0, 20))
+
+            # Roughly 1 in 20 items are work in progress without a license
+            if itemNumber % 20 == 19:
+                licenseID = "N/A"
+            else:
+                licenseID = randomizer.choices(range(len(licensePool)), cum_weights=licenseWeights)[0] + 1
+                if str(licenseID) not in fixtures["get_license_details"]:
+                    fixtures["get_license_details"][str(licenseID)] = create_license_details(licenseID)
+
+            if str(componentID) not in fixtures["get_component_details_v3_summary"]:
+                fixtures["get_component_details_v3_summary"][str(componentID)] = create_component_details(componentID, componentName)
+
+            inventoryItem = {
+                "id" : inventoryID,
+                "type" : "Component",
+                "name" : "%s (%s)" %(componentName, componentVersionName),
+                "componentId" : componentID,
+                "componentName" : componentName,
+                "componentVersionName" : componentVersionName,
+                "selectedLicenseId" : licenseID,
+                "selectedLicenseSPDXIdentifier" : licensePool[licenseID - 1] if licenseID != "N/A" else "",
+                "url" : "https://example.com/%s" %componentName if componentID % 5 else "N/A",
+                "purl" : "pkg:npm/%s@%s" %(componentName, componentVersionName) if releaseVersion >= "2024R1" else "",
+            }
+
+            if "withoutVulnerabilities" in inventoryVariants:
+                inventoryWithoutVulnerabilities.append(inventoryItem)
+
+            if "withVulnerabilities" in inventoryVariants:
+                inventoryItem = dict(inventoryItem)
+                inventoryItem["vulnerabilitySummary"] = [{"CvssV3" : {"critical" : 0, "high" : int(componentID % 11 == 0), "medium" : int(componentID % 7 == 0), "low" : 0}}]
+                inventoryWithVulnerabilities.append(inventoryItem)
+
+        fixtures["get_project_inventory_with_v3_summary"][str(projectID)] = inventoryWithVulnerabilities
+        fixtures["get_project_inventory_without_vulns_summary"][str(projectID)] = inventoryWithoutVulnerabilities
+
+    return fixtures
+
+#----------------------------------------------------------------------#
+def create_project_hierarchy(numberOfProjects, hierarchyShape):
+
+    projectNodes = {}
+    for projectID in range(parentProjectID, parentProjectID + numberOfProjects):
+        projectNodes[projectID] = {"id" : projectID, "name" : get_project_name(projectID), "childProject" : []}
+
+        if projectID == parentProjectID:
+            continue
+
+        # Which project is this one a child of?
+        childNumber = projectID - parentProjectID
+        if hierarchyShape == "wide":
+            parentID = parentProjectID
+        elif hierarchyShape == "deep":
+            parentID = projectID - 1
+        else:
+            parentID = parentProjectID + (childNumber - 1) // childrenPerProject
+
+        projectNodes[parentID]["childProject"].append(projectNodes[projectID])
+
+    return projectNodes[parentProjectID]
+
+#----------------------------------------------------------------------#
+def get_project_name(projectID):
+    return "Project %s" %projectID
+
+#----------------------------------------------------------------------#
+def create_license_details(licenseID):
+
+    spdxIdentifier = licensePool[licenseID - 1]
+    return {"url" : "https://spdx.org/licenses/%s.html" %spdxIdentifier, "spdxIdentifier" : spdxIdentifier, "priority" : 1, "shortName" : spdxIdentifier}
+
+#----------------------------------------------------------------------#
+def create_component_details(componentID, componentName):
+
+    forge, titleFormat = componentForges[componentID % len(componentForges)]
+    return {"data" : {"forge" : forge, "title" : titleFormat %{"name" : componentName, "group" : componentID % 50}}}
+
+#----------------------------------------------------------------------#
+def main():
+
+    args = parser.parse_args()
+
+    fixtures = create_synthetic_fixtures(args.projects, args.items, args.shape, args.release, args.seed)
+
+    with open(args.output, "w") as fixtures_ptr:
+        json.dump(fixtures, fixtures_ptr)
+
+    print("Wrote responses for %s projects with %s inventory items to %s" %(args.projects, args.projects * args.items, args.output))
+
+
+#----------------------------------------------------------------------#
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Author : sgeary
+Created On : Sun Oct 18 2026
+File : replay_server.py
+'''
+import sys, os, argparse, json, random, threading, time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import api_recorder
+
+parser = argparse.ArgumentParser(description="Serve recorded Code Insight API responses for report runs with sbom.apiReplay enabled")
+parser.add_argument("-fixtures", "--fixtures", required=True, help="Recorded (sbom.apiRecordFile) or synthetic (create_replay_fixtures.py) API responses")
+parser.add_argument("-port", "--port", type=int, default=8888, help="Port to listen on")
+parser.add_argument("-latency", "--latency", type=float, default=0, help="Milliseconds added to each response")
+parser.add_argument("-jitter", "--jitter", type=float, default=0, help="Random milliseconds (0 to jitter) added to each response")
+
+#----------------------------------------------------------------------#
+class ReplayRequestHandler(BaseHTTPRequestHandler):
+    # Keep-alive so the report's pooled connections are reused
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.record_request()
+
+        requestURL = urlsplit(self.path)
+        functionName = requestURL.path[len(api_recorder.replayPath):]
+        responseKey = parse_qs(requestURL.query, keep_blank_values=True).get("key", [""])[0]
+
+        recordedResponses = self.server.fixtures.get(functionName, {})
+
+        self.server.inject_latency()
+
+        if requestURL.path.startswith(api_recorder.replayPath) and responseKey in recordedResponses:
+            self.send_json(200, recordedResponses[responseKey])
+        else:
+            self.send_json(404, {"error" : "No recorded response for %s" %self.path})
+
+    def do_POST(self):
+        self.server.record_request()
+
+        # Report uploads are read and discarded
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            self.read_chunked_body()
+        else:
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+        self.server.inject_latency()
+        self.send_json(200, {})
+
+    def read_chunked_body(self):
+        while True:
+            chunkSize = int(self.rfile.readline().split(b";")[0].strip(), 16)
+            self.rfile.read(chunkSize + 2)  # Chunk data and the trailing CRLF
+            if chunkSize == 0:
+                break
+
+    def send_json(self, statusCode, responseData):
+        responseBody = json.dumps(responseData).encode("utf-8")
+        self.send_response(statusCode)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(responseBody)))
+        self.end_headers()
+        self.wfile.write(responseBody)
+
+    def log_message(self, format, *args):
+        pass
+
+#----------------------------------------------------------------------#
+class ReplayServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, serverAddress, fixtures, latency, jitter):
+        super().__init__(serverAddress, ReplayRequestHandler)
+        self.fixtures = fixtures
+        self.latency = latency / 1000
+        self.jitter = jitter / 1000
+        self.requestCount = 0
+        self.requestLock = threading.Lock()
+
+    def record_request(self):
+        with self.requestLock:
+            self.requestCount += 1
+
+    def inject_latency(self):
+        delay = self.latency + random.uniform(0, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+#----------------------------------------------------------------------#
+def load_fixtures(fixturesFile):
+    with open(fixturesFile) as fixtures_ptr:
+        return json.load(fixtures_ptr)
+
+#----------------------------------------------------------------------#
+def start_replay_server(fixtures, port=0, latency=0, jitter=0):
+
+    # Port 0 picks any free port, see server.server_address
+    replayServer = ReplayServer(("127.0.0.1", port), fixtures, latency, jitter)
+    serverThread = threading.Thread(target=replayServer.serve_forever, daemon=True)
+    serverThread.start()
+
+    return replayServer
+
+#----------------------------------------------------------------------#
+def main():
+
+    args = parser.parse_args()
+
+    replayServer = ReplayServer(("127.0.0.1", args.port), load_fixtures(args.fixtures), args.latency, args.jitter)
+    print("Serving %s on http://127.0.0.1:%s with %s ms latency" %(args.fixtures, replayServer.server_address[1], args.latency))
+
+    try:
+        replayServer.serve_forever()
+    except KeyboardInterrupt:
+        print("Served %s requests" %replayServer.requestCount)
+
+
+#----------------------------------------------------------------------#
+if __name__ == "__main__":
+    main()
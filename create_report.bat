@@ -14,4 +14,4 @@ rem #  use ~dp0 to get the location of this batch file since the script is
 rem #  relative to that.
 rem ###############################################################################
 
-python %~dp0\create_report.py -pid %projectId% -rid %reportId% -authToken %authToken% -reportOpts %reportOptions%
+python %~dp0\report_client.py -pid %projectId% -rid %reportId% -authToken %authToken% -reportOpts %reportOptions%
@@ -8,12 +8,21 @@ Created On : Wed Oct 06 2021
 File : create_report.py
 '''
 import sys, os, logging, argparse, json, re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import _version
 import report_data
 import report_artifacts
+import report_inventory
 import report_errors
+import report_cache
+import api_session
+import report_upload
+import report_settings
+import report_metrics
+import report_logging
+import api_recorder
 import common.api.project.upload_reports
 import common.api.system.release
 import common.report_archive
@@ -29,10 +38,12 @@ else:
 propertiesFile = "../server_properties.json"  # Created by installer or manually
 propertiesFile = logfileName = os.path.dirname(os.path.realpath(__file__)) + "/" +  propertiesFile
 logfileName = os.path.dirname(os.path.realpath(__file__)) + "/_sbom_report.log"
+metricsFileName = os.path.dirname(os.path.realpath(__file__)) + "/_sbom_report_metrics.json"
 
 ###################################################################################
 #  Set up logging handler to allow for different levels of logging to be capture
-logging.basicConfig(format='%(asctime)s,%(msecs)-3d  %(levelname)-8s [%(filename)-30s:%(lineno)-4d]  %(message)s', datefmt='%Y-%m-%d:%H:%M:%S', filename=logfileName, filemode='w',level=logging.DEBUG)
+#  The log level is updated once the report settings have been loaded
+report_logging.configure_logging(logfileName, logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 logging.getLogger("urllib3").setLevel(logging.WARNING)  # Disable logging for requests module
@@ -44,21 +55,30 @@ parser.add_argument('-pid', "--projectID", help="Project ID")
 parser.add_argument("-rid", "--reportID", help="Report ID")
 parser.add_argument("-authToken", "--authToken", help="Code Insight Authorization Token")
 parser.add_argument("-reportOpts", "--reportOptions", help="Options for report content")
+parser.add_argument("-batchPids", "--batchProjectIDs", help="Comma separated list of project IDs to create reports for in a single run")
+parser.add_argument("-batchFilter", "--batchProjectFilter", help="Also create reports for all projects with a name matching this regular expression")
 
 #----------------------------------------------------------------------#
 def main():
 
-    reportName = "SBOM Report"
-    reportVersion = _version.__version__
+    baseURL, reportSettings = load_report_settings()
+    start_report_services(reportSettings)
 
-    logger.info("Creating %s - %s" %(reportName, reportVersion))
-    print("Creating %s - %s" %(reportName, reportVersion))
-    print("    Logfile: %s" %(logfileName))
+    exitCode = run_report_request(baseURL, reportSettings, sys.argv[1:])
+
+    stop_report_services()
+    report_logging.stop_logging()
+
+    if exitCode:
+        sys.exit(exitCode)
 
+#----------------------------------------------------------------------#
+def load_report_settings():
 
     #####################################################################################################
     #  Code Insight System Information
     #  Pull the base URL from the same file that the installer is creating
+    configData = {}
     if os.path.exists(propertiesFile):
         try:
             file_ptr = open(propertiesFile, "r")
@@ -82,8 +102,44 @@ def main():
         baseURL = "http://localhost:8888"   # Required if the core.server.properties files is not used
         logger.info("Using baseURL from create_report.py")
 
+    # Any optional tuning values for the report
+    reportSettings = report_settings.get_report_settings(configData)
+
+    return baseURL, reportSettings
+
+#----------------------------------------------------------------------#
+def start_report_services(reportSettings):
+
+    # The log level, caches and HTTP session used by every report created by the process
+    report_logging.set_log_level(reportSettings["logLevel"])
+    report_cache.open_cache(reportSettings["cacheTTL"])
+    api_session.open_session(reportSettings["httpPoolSize"], reportSettings["httpRetries"], reportSettings["httpBackoffFactor"])
+
+    # Replay recorded API responses from a replay server or record them for later replay
+    if reportSettings["apiReplay"]:
+        api_recorder.start_replay()
+    elif reportSettings["apiRecordFile"]:
+        api_recorder.start_recording(os.path.join(os.path.dirname(os.path.realpath(__file__)), reportSettings["apiRecordFile"]))
+
+#----------------------------------------------------------------------#
+def stop_report_services():
+
+    api_recorder.stop_recording()
+    report_cache.close_cache()
+    api_session.close_session()
+
+#----------------------------------------------------------------------#
+def run_report_request(baseURL, reportSettings, reportArguments):
+
+    reportName = "SBOM Report"
+    reportVersion = _version.__version__
+
+    logger.info("Creating %s - %s" %(reportName, reportVersion))
+    print("Creating %s - %s" %(reportName, reportVersion))
+    print("    Logfile: %s" %(logfileName))
+
     # See what if any arguments were provided
-    args = parser.parse_args()
+    args = parser.parse_args(reportArguments)
     projectID = args.projectID
     reportID = args.reportID
     authToken = args.authToken
@@ -99,7 +155,8 @@ def main():
     reportOptions = json.loads(reportOptions)
     reportOptions = verifyOptions(reportOptions) 
 
-    releaseDetails = common.api.system.release.get_release_details(baseURL, authToken)
+    with report_metrics.span("releaseDetails"):
+        releaseDetails = common.api.system.release.get_release_details(baseURL, authToken)
     releaseVersion = releaseDetails["fnci.release.name"].replace(" ", "")
 
     logger.debug("Code Insight Release: %s" %releaseVersion)
@@ -110,6 +167,25 @@ def main():
     logger.debug("    baseURL:  %s" %baseURL)	
     logger.debug("    reportOptions:  %s" %reportOptions)	
 
+    # Create the reports for a list of projects or a single project
+    if args.batchProjectIDs or args.batchProjectFilter:
+        failedProjects = create_batch_reports(baseURL, args.batchProjectIDs, args.batchProjectFilter, reportID, authToken, reportOptions, reportSettings, releaseVersion, reportName, reportVersion, fileNameTimeStamp, reportTimeStamp)
+    else:
+        failedProjects = []
+        create_project_report(baseURL, projectID, reportID, authToken, reportOptions, reportSettings, releaseVersion, reportName, reportVersion, fileNameTimeStamp, reportTimeStamp)
+
+    # Where was the time spent for this report run?
+    report_metrics.write_metrics_file(metricsFileName, {"reportName" : reportName, "reportVersion" : reportVersion, "projectID" : projectID, "reportTimeStamp" : fileNameTimeStamp})
+
+    logger.info("Completed creating %s" %reportName)
+    print("Completed creating %s" %reportName)
+
+    return 1 if failedProjects else 0
+
+#----------------------------------------------------------------------#
+def create_project_report(baseURL, projectID, reportID, authToken, reportOptions, reportSettings, releaseVersion, reportName, reportVersion, fileNameTimeStamp, reportTimeStamp):
+    logger.info("Entering create_project_report for project %s" %projectID)
+
     reportData = {}
     reportData["projectID"] = projectID
     reportData["reportName"] = reportName
@@ -118,6 +194,7 @@ def main():
     reportData["releaseVersion"] = releaseVersion
     reportData["fileNameTimeStamp"] = fileNameTimeStamp
     reportData["reportTimeStamp"] = reportTimeStamp
+    reportData["reportSettings"] = reportSettings
 
     # Did we fail the options validation?
     if "errorMsg" in reportOptions.keys():
@@ -128,11 +205,13 @@ def main():
         reportData["reportName"] = reportName
         reportData["reportFileNameBase"] = reportFileNameBase
         
-        reports = report_errors.create_error_report(reportData)
+        with report_metrics.span("createArtifacts"):
+            reports = report_errors.create_error_report(reportData)
         print("    *** ERROR  ***  Error found validating report options")
     else:
         print("    Collect data for %s" %reportName)
-        reportData = report_data.gather_data_for_report(baseURL, projectID, authToken, reportData)
+        with report_metrics.span("gatherData"):
+            reportData = report_data.gather_data_for_report(baseURL, projectID, authToken, reportData)
         print("    Report data has been collected")
         
         projectName = reportData["topLevelProjectName"]
@@ -147,29 +226,98 @@ def main():
         reportData["reportFileNameBase"] = reportFileNameBase
 
         # Was there any errors while collection the report data?
-        if "errorMsg" in reportData.keys():
-            reports = report_errors.create_error_report(reportData)
-            print("    Error report artifacts have been created")
-        else:
-            reports = report_artifacts.create_report_artifacts(reportData)
-            print("    Report artifacts have been created")
-
-    print("    Create report archive for upload")
-    uploadZipfile = common.report_archive.create_report_zipfile(reports, reportFileNameBase)
-    print("    Upload zip file creation completed")
-    common.api.project.upload_reports.upload_project_report_data(baseURL, projectID, reportID, authToken, uploadZipfile)
-    print("    Report uploaded to Code Insight")
-
-    #########################################################
-    # Remove the file since it has been uploaded to Code Insight
-    try:
-        os.remove(uploadZipfile)
-    except OSError:
-        logger.error("Error removing %s" %uploadZipfile)
-        print("Error removing %s" %uploadZipfile)
+        with report_metrics.span("createArtifacts"):
+            if "errorMsg" in reportData.keys():
+                reports = report_errors.create_error_report(reportData)
+                print("    Error report artifacts have been created")
+            else:
+                try:
+                    reports = report_artifacts.create_report_artifacts(reportData)
+                finally:
+                    report_inventory.remove_sorted_runs(reportData)
+                print("    Report artifacts have been created")
+
+    if reportSettings["streamingUpload"]:
+        # Create the archive while it is being uploaded
+        print("    Stream report archive to Code Insight")
+        with report_metrics.span("streamUpload"):
+            report_upload.stream_report_archive(baseURL, projectID, reportID, authToken, reports, reportFileNameBase)
+        print("    Report uploaded to Code Insight")
+    else:
+        print("    Create report archive for upload")
+        with report_metrics.span("createArchive"):
+            uploadZipfile = common.report_archive.create_report_zipfile(reports, reportFileNameBase)
+        print("    Upload zip file creation completed")
+        with report_metrics.span("upload"):
+            common.api.project.upload_reports.upload_project_report_data(baseURL, projectID, reportID, authToken, uploadZipfile)
+        print("    Report uploaded to Code Insight")
+
+        #########################################################
+        # Remove the file since it has been uploaded to Code Insight
+        try:
+            os.remove(uploadZipfile)
+        except OSError:
+            logger.error("Error removing %s" %uploadZipfile)
+            print("Error removing %s" %uploadZipfile)
 
-    logger.info("Completed creating %s" %reportName)
-    print("Completed creating %s" %reportName)
+#----------------------------------------------------------------------#
+def create_batch_reports(baseURL, batchProjectIDs, batchProjectFilter, reportID, authToken, reportOptions, reportSettings, releaseVersion, reportName, reportVersion, fileNameTimeStamp, reportTimeStamp):
+    logger.info("Entering create_batch_reports")
+
+    # The projects listed by ID followed by any whose name matches the filter
+    projectIDs = []
+    if batchProjectIDs:
+        projectIDs = [batchProjectID.strip() for batchProjectID in batchProjectIDs.split(",") if batchProjectID.strip()]
+
+    if batchProjectFilter:
+        projectFilter = re.compile(batchProjectFilter)
+        for project in report_data.get_all_projects(baseURL, authToken):
+            if projectFilter.search(project["name"]):
+                projectIDs.append(str(project["id"]))
+
+    projectIDs = list(dict.fromkeys(projectIDs))  # Remove any duplicates but keep the order
+
+    # The error report for invalid options has the same file name for each project
+    batchWorkers = reportSettings["batchWorkers"]
+    if "errorMsg" in reportOptions.keys():
+        batchWorkers = 1
+
+    # Forking the artifact processes while another report thread holds one of the
+    # asset, metrics or cache locks can deadlock the forked process so each report
+    # creates its artifacts in its own thread when reports are created concurrently
+    if batchWorkers > 1 and reportSettings["artifactWorkers"] > 1:
+        logger.warning("    sbom.artifactWorkers is not used when batch reports are created concurrently")
+        reportSettings = dict(reportSettings, artifactWorkers=1)
+
+    logger.info("    Creating reports for %s projects using %s workers" %(len(projectIDs), batchWorkers))
+    print("    Creating reports for %s projects" %len(projectIDs))
+
+    # The HTTP session, caches and release details are shared by all of the reports
+    failedProjects = []
+    with ThreadPoolExecutor(max_workers=max(1, batchWorkers)) as executor:
+        projectFutures = {}
+        for projectID in projectIDs:
+            projectFutures[projectID] = executor.submit(create_batch_project_report, baseURL, projectID, reportID, authToken, reportOptions, reportSettings, releaseVersion, reportName, reportVersion, fileNameTimeStamp, reportTimeStamp)
+
+        for projectID, projectFuture in projectFutures.items():
+            try:
+                projectFuture.result()
+            except Exception as e:
+                logger.error("Unable to create report for project %s: %s" %(projectID, e))
+                print("    *** ERROR  ***  Unable to create report for project %s: %s" %(projectID, e))
+                failedProjects.append(projectID)
+
+    logger.info("    Reports created for %s of %s projects" %(len(projectIDs) - len(failedProjects), len(projectIDs)))
+    print("    Reports created for %s of %s projects" %(len(projectIDs) - len(failedProjects), len(projectIDs)))
+
+    return failedProjects
+
+#----------------------------------------------------------------------#
+def create_batch_project_report(baseURL, projectID, reportID, authToken, reportOptions, reportSettings, releaseVersion, reportName, reportVersion, fileNameTimeStamp, reportTimeStamp):
+
+    # Each project report is timed so slow projects stand out in the metrics file
+    with report_metrics.span(str(projectID), "projects"):
+        create_project_report(baseURL, projectID, reportID, authToken, reportOptions, reportSettings, releaseVersion, reportName, reportVersion, fileNameTimeStamp, reportTimeStamp)
 
 
 
@@ -178,6 +326,8 @@ def verifyOptions(reportOptions):
     '''
     Expected Options for report:
         includeChildProjects - True/False
+        includeVulnerabilities - True/False
+        aggregateComponents - True/False
     '''
     reportOptions["errorMsg"] = []
     trueOptions = ["true", "t", "yes", "y"]
@@ -185,6 +335,7 @@ def verifyOptions(reportOptions):
 
     includeChildProjects = reportOptions["includeChildProjects"]
     includeVulnerabilities = reportOptions["includeVulnerabilities"]
+    aggregateComponents = reportOptions.get("aggregateComponents", "False")  # Not passed by earlier registrations
 
 
     if includeChildProjects.lower() in trueOptions:
@@ -201,6 +352,13 @@ def verifyOptions(reportOptions):
     else:
         reportOptions["errorMsg"].append("Invalid option for including vulnerability data: <b>%s</b>.  Valid options are <b>True/False</b>" %includeVulnerabilities)
 
+    if aggregateComponents.lower() in trueOptions:
+        reportOptions["aggregateComponents"] = True
+    elif aggregateComponents.lower() in falseOptions:
+        reportOptions["aggregateComponents"] = False
+    else:
+        reportOptions["errorMsg"].append("Invalid option for combining duplicate components: <b>%s</b>.  Valid options are <b>True/False</b>" %aggregateComponents)
+
 
     if not reportOptions["errorMsg"]:
         reportOptions.pop('errorMsg', None)
@@ -15,4 +15,4 @@ reportOptions=$4
 
 REPORTDIR="$( cd "$( dirname "${BASH_SOURCE[0]}" )" >/dev/null 2>&1 && pwd )"
 
-python3 ${REPORTDIR}/create_report.py -pid $projectId -rid $reportId -authToken $authToken -reportOpts "$reportOptions"
\ No newline at end of file
+python3 ${REPORTDIR}/report_client.py -pid $projectId -rid $reportId -authToken $authToken -reportOpts "$reportOptions"
\ No newline at end of file
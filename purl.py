@@ -8,138 +8,235 @@ Created On : Fri May 20 2022
 File : purl.py
 '''
 
-import logging
+import logging, os, json, re
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
 
 import common.api.component.get_component_details
+import report_cache
 logger = logging.getLogger(__name__)
 
+# Component details needed for the purl keyed by server URL + component ID
+componentDetailsCache = {}
+
+# Optional file to add/override forge definitions without code changes
+forgeConfigFile = os.path.join(os.path.dirname(os.path.realpath(__file__)), "purl_forges.json")
+
+#  Map of Code Insight forge to the purl details for that forge.  A value of None
+#  means there is no purl type for the forge.  Available keys:
+#     type            - purl type (required)
+#     namespace       - fixed namespace value
+#     source          - "title" or "componentName" for the value the pattern is applied to
+#     pattern         - regex with "namespace" and/or "name" groups to extract from the source
+#     nameCharacters  - characters to replace within the name i.e. {"_" : "-"}
+titleNamePattern = r"(?P<name>.*?)(?: - |$)"  # start of title to dash "-" minus 1
+
+forgeDefinitions = {
+    "apache" : {"type" : "apache"},
+    "crates" : {"type" : "cargo"},
+    "nuget gallery" : {"type" : "nuget"},
+    "pypi" : {"type" : "pypi", "nameCharacters" : {"_" : "-"}},
+    "rubygems" : {"type" : "gem"},
+    "sourceforge" : {"type" : "sourceforge"},
+    "centos" : {"type" : "rpm", "namespace" : "centos"},
+    "fedora-koji" : {"type" : "rpm", "namespace" : "fedora"},
+    "clojars" : {"type" : "clojars", "source" : "title", "pattern" : r"(?P<namespace>[^/]*)"},  # groupId from start of title to "/"
+    "maven-google" : {"type" : "maven", "source" : "title", "pattern" : r"(?P<namespace>[^/]*)"},
+    "maven2-ibiblio" : {"type" : "maven", "source" : "title", "pattern" : r"(?P<namespace>[^/]*)"},
+    "cpan" : {"type" : "cpan", "source" : "title", "pattern" : titleNamePattern},
+    "cran" : {"type" : "cran", "source" : "title", "pattern" : titleNamePattern},
+    "hackage" : {"type" : "hackage", "source" : "title", "pattern" : titleNamePattern},
+    "npm" : {"type" : "npm", "source" : "componentName", "pattern" : r"(?:(?P<namespace>@[^/]+)/)?(?P<name>.+)"},
+    "packagist" : {"type" : "composer", "source" : "title", "pattern" : r"(?:(?P<namespace>(?:(?! - ).)*)/)?(?P<name>(?:(?! - )[^/])*)(?: - |$)"},  # vendor/package from the title
+    "github" : {"type" : "github", "source" : "title", "pattern" : r"(?P<namespace>(?:(?! - )[^/])*)/(?P<name>(?:(?! - )[^/])*)(?: - |$)"},
+    "gitlab" : {"type" : "gitlab", "source" : "title", "pattern" : r"(?P<namespace>(?:(?! - )[^/])*)/(?P<name>(?:(?! - )[^/])*)(?: - |$)"},
+    "fsf-directory" : None,
+    "codeplex" : None,
+    "gnu" : None,
+    "java.net" : None,
+    "kernel.org" : None,
+    "mozilla" : None,
+    "mysqlab" : None,
+    "savannah" : None,
+    "googlecode" : None,
+}
+
 
 ##############################
 def get_purl_string(inventoryItem, baseURL, authToken):
-    logger.info("entering get_purl_string")
-
-    purlString = "pkg:"  # Default value 
+    logger.debug("entering get_purl_string")
 
     componentId = inventoryItem["componentId"]
 
     # Since the summary does not have the forge grab that plus title from component lookup
-    componentDetails = common.api.component.get_component_details.get_component_details_v3_summary(baseURL, componentId, authToken)
-    forge = componentDetails["data"]["forge"]
-    componentTitle = componentDetails["data"]["title"]
+    componentDetails = get_component_details(baseURL, componentId, authToken)
+    forge = componentDetails["forge"]
+    componentTitle = componentDetails["title"]
 
     componentName = inventoryItem["componentName"]
     componentVersionName = inventoryItem["componentVersionName"]
+    inventoryItemName = inventoryItem["name"]
 
-    # Ensure there are no spaces in the version name
-    if " " in componentVersionName:
-        logger.debug("    Remove space from version name: %s" %componentVersionName)
-        componentVersionName = componentVersionName.replace(" ", "")
-        logger.debug("    is now: %s" %componentVersionName)
+    logger.debug("    Forge: %s  Inventory Item: %s", forge, inventoryItemName)
 
+    purlString = create_purl_string(forge, componentTitle, componentName, componentVersionName)
 
-    inventoryItemName = inventoryItem["name"]
+    logger.debug("        purlString: %s", purlString)
 
-    logger.info("    Forge: %s  Inventory Item: %s" %(forge, inventoryItemName))
+    return purlString
 
-    # Create the purl based on the forge
-    if forge in ["apache", "crates", "nuget gallery", "pypi", "rubygems", "sourceforge"]:
+##############################
+def create_purl_string(forge, componentTitle, componentName, componentVersionName):
 
-        if forge == "rubygems":
-            purlRepo = "gem"
-        elif forge == "crates":
-            purlRepo = "cargo"
-        elif forge == "nuget gallery":
-            purlRepo = "nuget"
-        else:
-            purlRepo = forge
+    if forge not in forgeRegistry:
+        logger.error("        Unsupported forge")
+        return ""
+
+    forgeRule = forgeRegistry[forge]
 
+    if forgeRule is None:
+        logger.debug("        No purl string for repository %s.", forge)
+        return ""
 
-        if forge in ["pypi"]:
-            purlName = componentName.replace("_", "-")
+    purlNameSpace = forgeRule["namespace"]
+    purlName = componentName
+
+    # Extract the namespace/name from the component name or title
+    if forgeRule["pattern"] is not None:
+        if forgeRule["source"] == "title":
+            ruleMatch = forgeRule["pattern"].match(componentTitle)
         else:
-            purlName = componentName
+            ruleMatch = forgeRule["pattern"].match(componentName)
 
-        purlVersion = componentVersionName
-        purlNameSpace = ""
+        if ruleMatch is None:
+            raise ValueError("Unable to determine purl name for forge %s from %s" %(forge, componentTitle))
 
-    elif forge in ["centos", "fedora-koji"]:
+        ruleValues = ruleMatch.groupdict()
+        if ruleValues.get("namespace"):
+            purlNameSpace = ruleValues["namespace"]
+        if "name" in ruleValues:
+            purlName = ruleValues["name"]
 
-        purlRepo = "rpm"
-        purlName = componentName
-        purlVersion = componentVersionName
+    if forgeRule["nameTranslation"] is not None:
+        purlName = purlName.translate(forgeRule["nameTranslation"])
 
-        if forge == "centos":
-            purlNameSpace = forge
-        else:
-            purlNameSpace = "fedora"
+    purlString = "pkg:" + forgeRule["type"] + "/"
 
-    elif forge in ["clojars", "maven-google", "maven2-ibiblio"]:
+    if purlNameSpace:
+        purlString += "/".join([quote(segment, safe=":") for segment in purlNameSpace.split("/")]) + "/"
 
-        if forge == "clojars":
-            purlRepo = forge
-        else:
-            purlRepo = "maven"
+    purlString += quote(purlName, safe=":")
+
+    # Ensure there are no spaces in the version name and only include a real version
+    purlVersion = componentVersionName.replace(" ", "")
+    if purlVersion != "N/A":
+        purlString += "@" + quote(purlVersion, safe=":")
 
-        purlName = componentName
-        purlVersion = componentVersionName
+    return purlString
 
-        purlNameSpace = componentTitle.split("/")[0] # parse groupId from component title (start of string to forward slash "/")
+##############################
+def get_component_details(baseURL, componentId, authToken, persistCache=False):
 
+    componentCacheKey = baseURL + "|" + str(componentId)
 
-    elif forge in ["cpan", "cran", "hackage"]:
+    # Has this component already been looked up during this run?
+    if componentCacheKey in componentDetailsCache:
+        return componentDetailsCache[componentCacheKey]
 
-        purlRepo = forge
-        purlNameSpace = ""
-        purlVersion = componentVersionName  
-        
-        purlName = componentTitle.split(" - ")[0] # parse case-sensitive name from component title (start of string to dash "-" minus 1)
+    componentDetails = None
+    if persistCache:
+        componentDetails = report_cache.get_cached_value("componentDetails", componentCacheKey)
 
-    elif forge in ["npm"]:
+    if componentDetails is None:
+        logger.debug("    Fetching component details for component ID %s", componentId)
+        componentInformation = common.api.component.get_component_details.get_component_details_v3_summary(baseURL, componentId, authToken)
 
-        purlRepo = forge
-        purlNameSpace = ""
-        
-        purlVersion = componentVersionName  
-        purlName = componentName
+        componentDetails = {}
+        componentDetails["forge"] = componentInformation["data"]["forge"]
+        componentDetails["title"] = componentInformation["data"]["title"]
 
-    elif forge in ["packagist"]:
+        if persistCache:
+            report_cache.set_cached_value("componentDetails", componentCacheKey, componentDetails)
 
-        purlRepo = "composer"
-        purlNameSpace = ""
+    componentDetailsCache[componentCacheKey] = componentDetails
 
-        purlName = componentTitle.split(" - ")[0] # parse case-sensitive name from component title (start of string to dash "-" minus 1)
+    return componentDetails
 
-        purlVersion = componentVersionName  
+##############################
+def prefetch_component_details(baseURL, componentIds, authToken, componentWorkers, persistCache):
+    logger.info("entering prefetch_component_details")
 
-    elif forge in ["github", "gitlab"]:
+    componentIds = [componentId for componentId in componentIds if baseURL + "|" + str(componentId) not in componentDetailsCache]
 
-        purlRepo = forge
-        purlVersion = componentVersionName  
+    logger.info("    Prefetching details for %s components using %s workers" %(len(componentIds), componentWorkers))
 
-      
-        componentName = componentTitle.split(" - ")[0] # parse case-sensitive name from component title (start of string to dash "-" minus 1)
+    with ThreadPoolExecutor(max_workers=max(1, componentWorkers)) as executor:
+        componentFutures = {}
+        for componentId in componentIds:
+            componentFutures[componentId] = executor.submit(get_component_details, baseURL, componentId, authToken, persistCache)
 
-        purlNameSpace, purlName  = componentName.split("/") # parse groupId from component title (start of string to forward slash "/")
-      
-    elif forge in ["fsf-directory", "codeplex", "gnu", "java.net", "kernel.org", "mozilla", "mysqlab", "savannah", "googlecode"]:
-        logger.warning("        No purl string for repository %s."  %forge)
-        purlString = ""
+        for componentId, componentFuture in componentFutures.items():
+            # Any failures will be retried and handled when the purl is created
+            try:
+                componentFuture.result()
+            except Exception:
+                logger.warning("    Unable to prefetch component details for component ID %s" %componentId)
 
+##############################
+def compile_forge_registry(definitions):
+
+    forgeRegistry = {}
+
+    for forge, forgeDefinition in definitions.items():
+        try:
+            forgeRegistry[forge] = compile_forge_rule(forgeDefinition)
+        except (KeyError, TypeError, AttributeError, ValueError, re.error) as e:
+            # An invalid definition from purl_forges.json is skipped in favour of the built in one (if any)
+            logger.error("Invalid forge definition for %s: %s (%s)" %(forge, forgeDefinition, e))
+            if forge in forgeDefinitions and definitions is not forgeDefinitions:
+                forgeRegistry[forge] = compile_forge_rule(forgeDefinitions[forge])
+
+    return forgeRegistry
+
+##############################
+def compile_forge_rule(forgeDefinition):
+
+    if forgeDefinition is None:
+        return None
+
+    forgeRule = {}
+    forgeRule["type"] = forgeDefinition["type"].lower()
+    forgeRule["namespace"] = forgeDefinition.get("namespace", "")
+    forgeRule["source"] = forgeDefinition.get("source", "componentName")
+
+    if forgeRule["source"] not in ["title", "componentName"]:
+        raise ValueError("source must be title or componentName")
+
+    if "pattern" in forgeDefinition:
+        forgeRule["pattern"] = re.compile(forgeDefinition["pattern"], re.DOTALL)
     else:
-        logger.error("        Unsupported forge")
-        purlString = ""
+        forgeRule["pattern"] = None
 
-    # Is there a value
-    if purlString != "":
-        if purlNameSpace == "":
-            purlString = "pkg:" + purlRepo + "/" + purlName + "@" + purlVersion 
-        else:
-            purlString = "pkg:" + purlRepo + "/" + purlNameSpace +"/" + purlName + "@" + purlVersion 
+    if "nameCharacters" in forgeDefinition:
+        forgeRule["nameTranslation"] = str.maketrans(forgeDefinition["nameCharacters"])
+    else:
+        forgeRule["nameTranslation"] = None
 
-        if purlVersion == "N/A":
-            purlString = purlString[:-4]
+    return forgeRule
 
-    logger.info("        purlString: %s" %(purlString))
+##############################
+def load_forge_definitions(forgeConfigFile):
 
-    return purlString
+    definitions = dict(forgeDefinitions)
+
+    if os.path.exists(forgeConfigFile):
+        try:
+            with open(forgeConfigFile, "r") as file_ptr:
+                definitions.update(json.load(file_ptr))
+            logger.info("Loaded forge definitions from %s" %forgeConfigFile)
+        except (OSError, ValueError, TypeError):
+            logger.error("Unable to load forge definitions from %s" %forgeConfigFile)
+
+    return definitions
 
+forgeRegistry = compile_forge_registry(load_forge_definitions(forgeConfigFile))
@@ -8,12 +8,33 @@ Created On : Wed Oct 06 2021
 File : report_artifacts.py
 '''
 import logging
+import multiprocessing
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 import report_artifacts_html
 import report_artifacts_xlsx
+import report_artifacts_cyclonedx
+import report_artifacts_spdx
+import report_metrics
 
 logger = logging.getLogger(__name__)
 
+#  Registry of the report artifacts to create.  Each entry is the name of the
+#  artifact and the function that creates it from the report data, returning
+#  the name of the file created.  The first artifact is the viewable report
+reportArtifactGenerators = [
+    ("html", report_artifacts_html.generate_html_report),
+    ("xlsx", report_artifacts_xlsx.generate_xlsx_report),
+    ("cyclonedx", report_artifacts_cyclonedx.generate_cyclonedx_report),
+    ("spdx", report_artifacts_spdx.generate_spdx_report),
+]
+
+#--------------------------------------------------------------------------------#
+def register_report_artifact(artifactName, artifactGenerator):
+    reportArtifactGenerators.append((artifactName, artifactGenerator))
+
 #--------------------------------------------------------------------------------#
 def create_report_artifacts(reportData):
     logger.info("Entering create_report_artifacts")
@@ -21,12 +42,61 @@ def create_report_artifacts(reportData):
     # Dict to hold the complete list of reports
     reports = {}
 
-    htmlFile = report_artifacts_html.generate_html_report(reportData)
-    xlsxFile = report_artifacts_xlsx.generate_xlsx_report(reportData)
-    reports["viewable"] = htmlFile
-    reports["allFormats"] = [htmlFile, xlsxFile]
+    artifactWorkers = reportData["reportSettings"]["artifactWorkers"]
+
+    if artifactWorkers > 1 and len(reportArtifactGenerators) > 1:
+        artifactFiles = generate_artifacts_concurrently(reportData, artifactWorkers)
+    else:
+        artifactFiles = []
+        for artifactName, artifactGenerator in reportArtifactGenerators:
+            with report_metrics.span("createArtifacts." + artifactName):
+                artifactFiles.append(artifactGenerator(reportData))
+
+    reports["viewable"] = artifactFiles[0]
+    reports["allFormats"] = artifactFiles
 
     logger.info("Exiting create_report_artifacts")
     
     return reports 
 
+#--------------------------------------------------------------------------------#
+def generate_artifacts_concurrently(reportData, artifactWorkers):
+    logger.info("    Creating %s artifacts using %s workers" %(len(reportArtifactGenerators), artifactWorkers))
+
+    # Serialize the report data once rather than for each artifact
+    serializedReportData = pickle.dumps(reportData, protocol=pickle.HIGHEST_PROTOCOL)
+    logger.debug("        Serialized report data size: %s bytes" %len(serializedReportData))
+
+    # The worker processes are forked so they share the logging setup and any
+    # registered artifacts.  Fall back to threads if fork is not available
+    try:
+        executor = ProcessPoolExecutor(max_workers=artifactWorkers, mp_context=multiprocessing.get_context("fork"))
+    except (TypeError, ValueError):
+        logger.warning("        Unable to use a process pool, creating artifacts using threads")
+        executor = ThreadPoolExecutor(max_workers=artifactWorkers)
+
+    with executor:
+        artifactFutures = [(artifactName, executor.submit(generate_artifact, artifactName, serializedReportData)) for artifactName, artifactGenerator in reportArtifactGenerators]
+
+        # The timings are taken within the workers and recorded here since
+        # anything recorded in a worker process is not seen by this process
+        artifactFiles = []
+        for artifactName, artifactFuture in artifactFutures:
+            artifactFile, artifactTime = artifactFuture.result()
+            report_metrics.record_timing("phases", "createArtifacts." + artifactName, artifactTime)
+            artifactFiles.append(artifactFile)
+
+    return artifactFiles
+
+#--------------------------------------------------------------------------------#
+def generate_artifact(artifactName, serializedReportData):
+
+    startTime = time.perf_counter()
+    reportData = pickle.loads(serializedReportData)
+
+    for registeredArtifactName, artifactGenerator in reportArtifactGenerators:
+        if registeredArtifactName == artifactName:
+            artifactFile = artifactGenerator(reportData)
+            return artifactFile, time.perf_counter() - startTime
+
+    raise ValueError("Unknown report artifact %s" %artifactName)
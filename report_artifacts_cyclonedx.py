@@ -0,0 +1,110 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Author : sgeary
+Created On : Sun Oct 18 2026
+File : report_artifacts_cyclonedx.py
+'''
+import logging
+import uuid
+
+import _version
+from report_inventory import ordered_inventory
+from report_json_writer import write_json_document, get_sbom_timestamp, is_spdx_license_id
+
+logger = logging.getLogger(__name__)
+
+#------------------------------------------------------------------#
+def generate_cyclonedx_report(reportData):
+    logger.info("    Entering generate_cyclonedx_report")
+
+    reportName = reportData["reportName"]
+    projectName = reportData["topLevelProjectName"]
+    reportFileNameBase = reportData["reportFileNameBase"]
+    reportOptions = reportData["reportOptions"]
+    applicationDetails = reportData["applicationDetails"]
+
+    cyclonedxFile = reportFileNameBase + ".cdx.json"
+
+    applicationName = applicationDetails[projectName]["applicationName"]
+    applicationVersion = applicationDetails[projectName]["applicationVersion"]
+    applicationPublisher = applicationDetails[projectName]["applicationPublisher"]
+
+    # The top level project is the subject of the SBOM
+    applicationComponent = {"type" : "application", "bom-ref" : "application", "name" : applicationName}
+    if applicationVersion != "":
+        applicationComponent["version"] = applicationVersion
+    if applicationPublisher != "":
+        applicationComponent["supplier"] = {"name" : applicationPublisher}
+
+    documentValues = {
+        "bomFormat" : "CycloneDX",
+        "specVersion" : "1.5",
+        "serialNumber" : "urn:uuid:" + str(uuid.uuid4()),
+        "version" : 1,
+        "metadata" : {
+            "timestamp" : get_sbom_timestamp(reportData["fileNameTimeStamp"]),
+            "tools" : {"components" : [{"type" : "application", "name" : reportName, "version" : _version.__version__}]},
+            "component" : applicationComponent
+        }
+    }
+
+    streamedArrays = [
+        ("components", create_cyclonedx_components(reportData, reportOptions["includeVulnerabilities"])),
+    ]
+
+    write_json_document(cyclonedxFile, documentValues, streamedArrays)
+
+    logger.info("    Exiting generate_cyclonedx_report")
+
+    return cyclonedxFile
+
+#------------------------------------------------------------------#
+def create_cyclonedx_components(reportData, includeVulnerabilities):
+
+    for inventoryID, inventoryItem in ordered_inventory(reportData):
+
+        component = {"type" : "library", "bom-ref" : get_cyclonedx_bom_ref(inventoryID), "name" : inventoryItem.componentName}
+
+        if inventoryItem.componentVersionName != "":
+            component["version"] = inventoryItem.componentVersionName
+
+        licenseDetails = get_cyclonedx_license(inventoryItem)
+        if licenseDetails:
+            component["licenses"] = [{"license" : licenseDetails}]
+
+        if inventoryItem.purlString:
+            component["purl"] = inventoryItem.purlString
+
+        if inventoryItem.componentUrl not in ["N/A", ""]:
+            component["externalReferences"] = [{"type" : "website", "url" : inventoryItem.componentUrl}]
+
+        properties = [{"name" : "codeinsight:project", "value" : project.applicationNameVersion} for project in inventoryItem.projects]
+        if includeVulnerabilities:
+            properties.append({"name" : "codeinsight:hasVulnerabilities", "value" : str(bool(inventoryItem.hasVulnerabilities)).lower()})
+        component["properties"] = properties
+
+        yield component
+
+#------------------------------------------------------------------#
+def get_cyclonedx_bom_ref(inventoryID):
+    return "component-" + str(inventoryID)
+
+#------------------------------------------------------------------#
+def get_cyclonedx_license(inventoryItem):
+
+    licenseName = inventoryItem.selectedLicenseName
+    if licenseName == "":
+        return None
+
+    if is_spdx_license_id(inventoryItem):
+        licenseDetails = {"id" : licenseName}
+    else:
+        licenseDetails = {"name" : licenseName}
+
+    if inventoryItem.selectedLicenseUrl != "":
+        licenseDetails["url"] = inventoryItem.selectedLicenseUrl
+
+    return licenseDetails
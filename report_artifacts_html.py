@@ -8,13 +8,33 @@ Created On : Wed Oct 27 2021
 File : report_artifacts_html.py
 '''
 import logging
-import os
-import base64
+import json
 
 import _version
+import report_assets
+from report_inventory import ordered_inventory
+import report_metrics
 
 logger = logging.getLogger(__name__)
 
+# CDN files used by the report (see report_assets.cdnAssets)
+htmlStylesheets = [
+    "https://stackpath.bootstrapcdn.com/bootstrap/4.5.1/css/bootstrap.min.css",
+    "https://cdnjs.cloudflare.com/ajax/libs/twitter-bootstrap/4.1.3/css/bootstrap.css",
+    "https://cdn.datatables.net/1.10.21/css/dataTables.bootstrap4.min.css",
+    "https://cdnjs.cloudflare.com/ajax/libs/jstree/3.2.1/themes/default/style.min.css",
+]
+htmlScripts = [
+    "https://code.jquery.com/jquery-3.5.1.slim.min.js",
+    "https://cdnjs.cloudflare.com/ajax/libs/jquery/3.5.1/jquery.min.js",
+    "https://cdn.datatables.net/1.10.21/js/jquery.dataTables.min.js",
+    "https://cdn.datatables.net/1.10.21/js/dataTables.bootstrap4.min.js",
+    "https://cdnjs.cloudflare.com/ajax/libs/jstree/3.3.10/jstree.min.js",
+]
+
+htmlWriteBufferSize = 1024 * 1024  # Large buffer since the inventory table can be many MB
+rowsPerWrite = 500  # Number of rendered inventory rows joined for each write
+
 
 #------------------------------------------------------------------#
 def generate_html_report(reportData):
@@ -29,16 +49,20 @@ def generate_html_report(reportData):
     reportOptions = reportData["reportOptions"]
     projectInventoryCount = reportData["projectInventoryCount"]
     applicationDetails = reportData["applicationDetails"]
- 
-    scriptDirectory = os.path.dirname(os.path.realpath(__file__))
-    cssFile =  os.path.join(scriptDirectory, "common/branding/css/revenera_common.css")
-    logoImageFile =  os.path.join(scriptDirectory, "common/branding/images/logo_reversed.svg")
-    iconFile =  os.path.join(scriptDirectory, "common/branding/images/favicon-revenera.ico")
+    reportSettings = reportData["reportSettings"]
+
+    # Should the inventory be embedded as json data rather than static table rows?
+    if reportSettings["htmlDataMode"] == "json":
+        embedInventoryData = True
+    elif reportSettings["htmlDataMode"] == "auto":
+        embedInventoryData = len(inventoryData) > reportSettings["htmlJsonThreshold"]
+    else:
+        embedInventoryData = False
 
-    #########################################################
-    #  Encode the image files
-    encodedLogoImage = encodeImage(logoImageFile)
-    encodedfaviconImage = encodeImage(iconFile)
+    logger.info("        Embed inventory data as json: %s" %embedInventoryData)
+ 
+    # Use the cached branding and (optionally) inlined CDN files
+    inlineAssets = reportSettings["htmlInlineAssets"]
 
     htmlFile = reportFileNameBase + ".html"
 
@@ -46,44 +70,13 @@ def generate_html_report(reportData):
     # Create a simple HTML file to display
     #---------------------------------------------------------------------------------------------------
     try:
-        html_ptr = open(htmlFile,"w")
+        html_ptr = open(htmlFile,"w", buffering=htmlWriteBufferSize)
     except:
         logger.error("Failed to open htmlfile %s:" %htmlFile)
         raise
 
     html_ptr.write("<html>\n") 
-    html_ptr.write("    <head>\n")
-
-    html_ptr.write("        <!-- Required meta tags --> \n")
-    html_ptr.write("        <meta charset='utf-8'>  \n")
-    html_ptr.write("        <meta name='viewport' content='width=device-width, initial-scale=1, shrink-to-fit=no'> \n")
-
-    html_ptr.write(''' 
-        <link rel="stylesheet" href="https://stackpath.bootstrapcdn.com/bootstrap/4.5.1/css/bootstrap.min.css" integrity="sha384-VCmXjywReHh4PwowAiWNagnWcLhlEJLA5buUprzK8rxFgeH0kww/aWY76TfkUoSX" crossorigin="anonymous">
-        <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/twitter-bootstrap/4.1.3/css/bootstrap.css">
-        <link rel="stylesheet" href="https://cdn.datatables.net/1.10.21/css/dataTables.bootstrap4.min.css">
-        <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/jstree/3.2.1/themes/default/style.min.css">
-    ''')
-
-
-    html_ptr.write("        <style>\n")
-
-    # Add the contents of the css file to the head block
-    try:
-        f_ptr = open(cssFile)
-        for line in f_ptr:
-            html_ptr.write("            %s" %line)
-        f_ptr.close()
-    except:
-        logger.error("Unable to open %s" %cssFile)
-        print("Unable to open %s" %cssFile)
-
-
-    html_ptr.write("        </style>\n")  
-
-    html_ptr.write("    	<link rel='icon' type='image/png' href='data:image/png;base64, {}'>\n".format(encodedfaviconImage.decode('utf-8')))
-    html_ptr.write("        <title>%s</title>\n" %(reportName))
-    html_ptr.write("    </head>\n") 
+    html_ptr.write(report_assets.get_html_head(reportName, htmlStylesheets, inlineAssets))
 
     html_ptr.write("<body>\n")
     html_ptr.write("<div class=\"container-fluid\">\n")
@@ -94,7 +87,7 @@ def generate_html_report(reportData):
     html_ptr.write("<!-- BEGIN HEADER -->\n")
     html_ptr.write("<div class='header'>\n")
     html_ptr.write("  <div class='logo'>\n")
-    html_ptr.write("    <img src='data:image/svg+xml;base64,{}' style='height: 5%;'>\n".format(encodedLogoImage.decode('utf-8')))
+    html_ptr.write("    <img src='data:image/svg+xml;base64,{}' style='height: 5%;'>\n".format(report_assets.get_logo_image()))
     html_ptr.write("  </div>\n")
     html_ptr.write("<div class='report-title'>%s</div>\n" %reportName)
     html_ptr.write("</div>\n")
@@ -172,58 +165,18 @@ def generate_html_report(reportData):
 
     ######################################################
     # Cycle through the inventory to create the 
-    # table with the results
-    for inventoryID in inventoryData:
-
-        logger.debug("        Reporting for inventory item %s" %inventoryID)
-        projectName = inventoryData[inventoryID]["projectName"]
-        inventoryItemName = inventoryData[inventoryID]["inventoryItemName"]
-        componentName = inventoryData[inventoryID]["componentName"]
-        componentUrl = inventoryData[inventoryID]["componentUrl"]
-        componentVersionName = inventoryData[inventoryID]["componentVersionName"]
-        selectedLicenseName = inventoryData[inventoryID]["selectedLicenseName"]
-        selectedLicenseUrl = inventoryData[inventoryID]["selectedLicenseUrl"]
-        hasVulnerabilities = inventoryData[inventoryID]["hasVulnerabilities"]
-        purlString = inventoryData[inventoryID]["purlString"]
-
-        applicationNameVersion = applicationDetails[projectName]["applicationNameVersion"]
-
-        logger.debug("            Project Name:  %s   Inventory Name %s" %(projectName, inventoryItemName))
-
-        html_ptr.write("        <tr> \n")
-        if len(projectList) > 1:
-            html_ptr.write("            <td class='text-left'>%s</td>\n" %(applicationNameVersion))
-
-        #  Is there a valid URL to link to?
-        if componentUrl == "N/A":
-            html_ptr.write("            <td class='text-left'>%s</td>\n" %(componentName))
-        else:
-            html_ptr.write("            <td class='text-left'><a href='%s' target='_blank'>%s</a></td>\n" %(componentUrl, componentName))
-
-        html_ptr.write("            <td class='text-left'>%s</td>\n" %(componentVersionName))
+    # table with the results.  If the data is embedded
+    # the rows are created by the datatable instead
+    if not embedInventoryData:
+        write_inventory_rows(html_ptr, ordered_inventory(reportData), len(projectList) > 1, reportOptions["includeVulnerabilities"])
 
-
-        #  Is there a valid URL to link to?
-        if selectedLicenseUrl == "":
-            html_ptr.write("            <td class='text-left'>%s</td>\n" %(selectedLicenseName))
-        else:
-            html_ptr.write("            <td class='text-left'><a href='%s' target='_blank'>%s</a></td>\n" %(selectedLicenseUrl, selectedLicenseName))
-
-        html_ptr.write("            </td>\n")
-
-        html_ptr.write("            <td class='text-left'>%s</td>\n" %(purlString))
-
-
-        if reportOptions["includeVulnerabilities"]:
-            if hasVulnerabilities:
-                html_ptr.write("            <td class='text-left'>Yes</td>\n")
-            else:
-                html_ptr.write("            <td class='text-left'>&nbsp</td>\n")
-
-        html_ptr.write("        </tr>\n") 
     html_ptr.write("    </tbody>\n")
     html_ptr.write("</table>\n")  
 
+    # Timings for the report run up to the creation of this file
+    if reportSettings["htmlMetricsAppendix"]:
+        add_metrics_appendix(html_ptr, report_metrics.get_metrics_summary())
+
     html_ptr.write("<!-- END BODY -->\n")  
 
     #---------------------------------------------------------------------------------------------------
@@ -243,14 +196,7 @@ def generate_html_report(reportData):
     # Add javascript 
     #---------------------------------------------------------------------------------------------------
 
-    html_ptr.write('''
-
-    <script src="https://code.jquery.com/jquery-3.5.1.slim.min.js" integrity="sha384-DfXdz2htPH0lsSSs5nCTpuj/zy4C+OGpamoFVy38MVBnE+IbbVYUew+OrCXaRkfj" crossorigin="anonymous"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/jquery/3.5.1/jquery.min.js"></script>
-    <script src="https://cdn.datatables.net/1.10.21/js/jquery.dataTables.min.js"></script>  
-    <script src="https://cdn.datatables.net/1.10.21/js/dataTables.bootstrap4.min.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/jstree/3.3.10/jstree.min.js"></script>
-    ''')
+    html_ptr.write(report_assets.get_html_scripts(htmlScripts, inlineAssets))
 
     html_ptr.write("<script>\n")
     
@@ -261,8 +207,17 @@ def generate_html_report(reportData):
     else:
         # Inventory items are the first column
         sortByColumn = 0
+
+    # Keep the initial table order in line with the inventory order
+    if reportSettings["inventorySortOrder"] == "project" and len(projectList) > 1:
+        sortByColumn = 0
+    elif reportSettings["inventorySortOrder"] == "license":
+        sortByColumn += 2
     
-    add_inventory_datatable(html_ptr, sortByColumn)
+    if embedInventoryData:
+        add_inventory_json_datatable(html_ptr, sortByColumn, ordered_inventory(reportData), len(projectList) > 1, reportOptions["includeVulnerabilities"])
+    else:
+        add_inventory_datatable(html_ptr, sortByColumn)
 
     
 
@@ -281,19 +236,94 @@ def generate_html_report(reportData):
     return htmlFile
 
 
-####################################################################
-def encodeImage(imageFile):
+#------------------------------------------------------------------#
+def write_inventory_rows(html_ptr, inventoryItems, includeProjectColumn, includeVulnerabilities):
+    logger.info("    Entering write_inventory_rows")
+
+    # Build the template for each table row once based on the columns in the report
+    rowTemplate = "        <tr> \n"
+    if includeProjectColumn:
+        rowTemplate += "            <td class='text-left'>%s</td>\n"  # Project
+    rowTemplate += "            <td class='text-left'>%s</td>\n"  # Component
+    rowTemplate += "            <td class='text-left'>%s</td>\n"  # Version
+    rowTemplate += "            <td class='text-left'>%s</td>\n"  # License
+    rowTemplate += "            </td>\n"
+    rowTemplate += "            <td class='text-left'>%s</td>\n"  # Purl
+    if includeVulnerabilities:
+        rowTemplate += "            <td class='text-left'>%s</td>\n"  # Vulnerabilities
+    rowTemplate += "        </tr>\n"
+
+    # The rendered rows always contain every column so trim to what the template expects
+    firstColumn = 0 if includeProjectColumn else 1
+    lastColumn = 6 if includeVulnerabilities else 5
+
+    # Join the rendered rows into larger blocks to limit the number of writes
+    rowBuffer = []
+    for rowValues in render_inventory_rows(inventoryItems):
+        rowBuffer.append(rowTemplate %rowValues[firstColumn:lastColumn])
+
+        if len(rowBuffer) == rowsPerWrite:
+            html_ptr.write("".join(rowBuffer))
+            rowBuffer = []
+
+    html_ptr.write("".join(rowBuffer))
 
-    #############################################
-    # Create base64 variable for branding image
-    try:
-        with open(imageFile,"rb") as image:
-            encodedImage = base64.b64encode(image.read())
-            return encodedImage
-    except:
-        logger.error("Unable to open %s" %imageFile)
-        raise
+#------------------------------------------------------------------#
+def render_inventory_rows(inventoryItems):
+
+    # Checked once since the per item details are only needed for debug logging
+    debugLogging = logger.isEnabledFor(logging.DEBUG)
+
+    for inventoryID, inventoryItem in inventoryItems:
 
+        componentName = inventoryItem.componentName
+        componentUrl = inventoryItem.componentUrl
+        selectedLicenseName = inventoryItem.selectedLicenseName
+        selectedLicenseUrl = inventoryItem.selectedLicenseUrl
+
+        if debugLogging:
+            logger.debug("        Reporting for inventory item %s", inventoryID)
+            logger.debug("            Project Name:  %s   Inventory Name %s", inventoryItem.projectName, inventoryItem.inventoryItemName)
+
+        #  Is there a valid URL to link to?
+        if componentUrl == "N/A":
+            componentCell = componentName
+        else:
+            componentCell = "<a href='%s' target='_blank'>%s</a>" %(componentUrl, componentName)
+
+        #  Is there a valid URL to link to?
+        if selectedLicenseUrl == "":
+            licenseCell = selectedLicenseName
+        else:
+            licenseCell = "<a href='%s' target='_blank'>%s</a>" %(selectedLicenseUrl, selectedLicenseName)
+
+        if inventoryItem.hasVulnerabilities:
+            vulnerabilityCell = "Yes"
+        else:
+            vulnerabilityCell = "&nbsp"
+
+        yield (inventoryItem.applicationNameVersion, componentCell, inventoryItem.componentVersionName, licenseCell, inventoryItem.purlString, vulnerabilityCell)
+
+
+#------------------------------------------------------------------#
+def add_metrics_appendix(html_ptr, metricsSummary):
+    logger.info("    Entering add_metrics_appendix")
+
+    html_ptr.write("<hr class='small'>\n")
+    html_ptr.write("<table id='reportMetrics' class='table table-sm' style='width:90%'>\n")
+    html_ptr.write("    <thead>\n")
+    html_ptr.write("        <tr><th colspan='6' class='text-center'><p style='font-size:18px'>Report Timings</p></th></tr>\n")
+    html_ptr.write("        <tr><th class='text-left'>NAME</th><th class='text-right'>COUNT</th><th class='text-right'>TOTAL (s)</th><th class='text-right'>P50 (s)</th><th class='text-right'>P95 (s)</th><th class='text-right'>MAX (s)</th></tr>\n")
+    html_ptr.write("    </thead>\n")
+    html_ptr.write("    <tbody>\n")
+
+    for category, categorySummary in metricsSummary.items():
+        html_ptr.write("        <tr><td colspan='6' class='text-left'><b>%s</b></td></tr>\n" %category)
+        for timingName, timingSummary in categorySummary.items():
+            html_ptr.write("        <tr><td class='text-left'>%s</td><td class='text-right'>%s</td><td class='text-right'>%.3f</td><td class='text-right'>%.3f</td><td class='text-right'>%.3f</td><td class='text-right'>%.3f</td></tr>\n" %(timingName, timingSummary["count"], timingSummary["total"], timingSummary["p50"], timingSummary["p95"], timingSummary["max"]))
+
+    html_ptr.write("    </tbody>\n")
+    html_ptr.write("</table>\n")
 
 #----------------------------------------------------------------------------------------#
 def add_inventory_datatable(html_ptr, sortByColumn):
@@ -308,6 +338,79 @@ def add_inventory_datatable(html_ptr, sortByColumn):
             });
         ''')    
 
+#----------------------------------------------------------------------------------------#
+def add_inventory_json_datatable(html_ptr, sortByColumn, inventoryItems, includeProjectColumn, includeVulnerabilities):
+    logger.info("    Entering add_inventory_json_datatable")
+
+    # Project names and licenses are repeated across the inventory so
+    # each row only holds an index into these lists
+    projectIndexes = {}
+    licenseIndexes = {}
+
+    # Each row is [project index, component, component url, version, license index, purl, vulnerabilities]
+    html_ptr.write("var inventoryRows = [\n")
+
+    rowBuffer = []
+    for inventoryID, inventoryItem in inventoryItems:
+
+        applicationNameVersion = inventoryItem.applicationNameVersion
+        projectIndex = projectIndexes.setdefault(applicationNameVersion, len(projectIndexes))
+
+        licenseKey = (inventoryItem.selectedLicenseName, inventoryItem.selectedLicenseUrl)
+        licenseIndex = licenseIndexes.setdefault(licenseKey, len(licenseIndexes))
+
+        componentUrl = inventoryItem.componentUrl
+        if componentUrl == "N/A":
+            componentUrl = ""
+
+        rowBuffer.append(encode_script_json([projectIndex, inventoryItem.componentName, componentUrl, inventoryItem.componentVersionName, licenseIndex, inventoryItem.purlString, int(inventoryItem.hasVulnerabilities)]))
+
+        if len(rowBuffer) == rowsPerWrite:
+            html_ptr.write(",\n".join(rowBuffer) + ",\n")
+            rowBuffer = []
+
+    html_ptr.write(",\n".join(rowBuffer) + "\n];\n")
+
+    html_ptr.write("var inventoryProjects = %s;\n" %encode_script_json(list(projectIndexes)))
+    html_ptr.write("var inventoryLicenses = %s;\n" %encode_script_json([list(licenseKey) for licenseKey in licenseIndexes]))
+
+    # Only include the columns being reported on
+    columns = []
+    if includeProjectColumn:
+        columns.append("""{ "data": 0, "className": "text-left", "render": function (data) { return inventoryProjects[data]; } }""")
+
+    columns.append("""{ "data": 1, "className": "text-left", "render": function (data, type, row) {
+                        return (type === "display" && row[2]) ? "<a href='" + row[2] + "' target='_blank'>" + data + "</a>" : data; } }""")
+    columns.append("""{ "data": 3, "className": "text-left" }""")
+    columns.append("""{ "data": 4, "className": "text-left", "render": function (data, type) {
+                        var license = inventoryLicenses[data];
+                        return (type === "display" && license[1]) ? "<a href='" + license[1] + "' target='_blank'>" + license[0] + "</a>" : license[0]; } }""")
+    columns.append("""{ "data": 5, "className": "text-left" }""")
+
+    if includeVulnerabilities:
+        columns.append("""{ "data": 6, "className": "text-left", "render": function (data) { return data ? "Yes" : "&nbsp"; } }""")
+
+    # Only the rows being displayed are turned into DOM elements
+    html_ptr.write('''
+
+            $(document).ready(function (){
+                var table = $('#inventoryData').DataTable({
+                    "data": inventoryRows,
+                    "deferRender": true,
+                    "columns": [
+                    ''' + ",\n                    ".join(columns) + '''
+                    ],
+                    "order": [ ''' +  str(sortByColumn) + ''', 'asc' ],
+                    "lengthMenu": [ [25, 50, 100, -1], [25, 50, 100, "All"] ],
+                });
+            });
+        ''')
+
+#----------------------------------------------------------------------------------------#
+def encode_script_json(value):
+    # Ensure the data can not close the script block it is embedded in
+    return json.dumps(value, separators=(",", ":")).replace("</", "<\\/")
+
 #----------------------------------------------------------------------------------------#
 def generate_project_hierarchy_tree(html_ptr, projectHierarchy, projectInventoryCount):
     logger.info("    Entering generate_project_hierarchy_tree")
@@ -0,0 +1,157 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Author : sgeary
+Created On : Sun Oct 18 2026
+File : report_artifacts_spdx.py
+'''
+import logging
+import re
+import uuid
+from urllib.parse import quote
+
+import _version
+from report_inventory import ordered_inventory
+from report_json_writer import write_json_document, get_sbom_timestamp, is_spdx_license_id, get_license_ref
+
+logger = logging.getLogger(__name__)
+
+applicationSPDXID = "SPDXRef-Application"
+
+#------------------------------------------------------------------#
+def generate_spdx_report(reportData):
+    logger.info("    Entering generate_spdx_report")
+
+    reportName = reportData["reportName"]
+    projectName = reportData["topLevelProjectName"]
+    reportFileNameBase = reportData["reportFileNameBase"]
+    applicationDetails = reportData["applicationDetails"]
+
+    spdxFile = reportFileNameBase + ".spdx.json"
+
+    applicationName = applicationDetails[projectName]["applicationName"]
+    applicationVersion = applicationDetails[projectName]["applicationVersion"]
+    applicationPublisher = applicationDetails[projectName]["applicationPublisher"]
+
+    creators = ["Tool: %s-%s" %(re.sub(r"\s+", "-", reportName), _version.__version__)]
+    if applicationPublisher != "":
+        creators.append("Organization: %s" %applicationPublisher)
+
+    documentValues = {
+        "spdxVersion" : "SPDX-2.3",
+        "dataLicense" : "CC0-1.0",
+        "SPDXID" : "SPDXRef-DOCUMENT",
+        "name" : applicationDetails[projectName]["applicationNameVersion"],
+        "documentNamespace" : "https://spdx.org/spdxdocs/%s-%s" %(quote(applicationName, safe=""), uuid.uuid4()),
+        "creationInfo" : {
+            "created" : get_sbom_timestamp(reportData["fileNameTimeStamp"]),
+            "creators" : creators
+        }
+    }
+
+    # The top level project is the package described by the document
+    applicationPackage = create_spdx_package(applicationSPDXID, applicationName, applicationVersion)
+    if applicationPublisher != "":
+        applicationPackage["supplier"] = "Organization: %s" %applicationPublisher
+    applicationPackage["primaryPackagePurpose"] = "APPLICATION"
+
+    # The licenses that are not on the SPDX license list are added as they are
+    # found in the packages and written once all of the packages are written
+    extractedLicenses = {}  # Extracted license details using the license names as keys
+    extractedLicenseIDs = set()
+
+    streamedArrays = [
+        ("packages", create_spdx_packages(reportData, applicationPackage, extractedLicenses, extractedLicenseIDs)),
+        ("hasExtractedLicensingInfos", create_spdx_extracted_licenses(extractedLicenses)),
+        ("relationships", create_spdx_relationships(reportData)),
+    ]
+
+    write_json_document(spdxFile, documentValues, streamedArrays)
+
+    logger.info("    Exiting generate_spdx_report")
+
+    return spdxFile
+
+#------------------------------------------------------------------#
+def create_spdx_packages(reportData, applicationPackage, extractedLicenses, extractedLicenseIDs):
+
+    yield applicationPackage
+
+    for inventoryID, inventoryItem in ordered_inventory(reportData):
+
+        package = create_spdx_package(get_spdx_package_id(inventoryID), inventoryItem.componentName, inventoryItem.componentVersionName)
+
+        if is_spdx_license_id(inventoryItem):
+            package["licenseConcluded"] = inventoryItem.selectedLicenseName
+        elif inventoryItem.selectedLicenseName != "":
+            package["licenseConcluded"] = get_extracted_license_id(extractedLicenses, extractedLicenseIDs, inventoryItem.selectedLicenseName, inventoryItem.selectedLicenseUrl)
+
+        if inventoryItem.componentUrl not in ["N/A", ""]:
+            package["homepage"] = inventoryItem.componentUrl
+
+        if inventoryItem.purlString:
+            package["externalRefs"] = [{"referenceCategory" : "PACKAGE-MANAGER", "referenceType" : "purl", "referenceLocator" : inventoryItem.purlString}]
+
+        package["comment"] = "Code Insight project(s): %s" %inventoryItem.applicationNameVersion
+
+        yield package
+
+#------------------------------------------------------------------#
+def get_extracted_license_id(extractedLicenses, extractedLicenseIDs, licenseName, licenseUrl):
+
+    extractedLicense = extractedLicenses.get(licenseName)
+
+    if extractedLicense is None:
+        licenseID = get_license_ref(licenseName)
+
+        # Different names can have the same LicenseRef once the invalid characters are replaced
+        duplicateNumber = 1
+        uniqueLicenseID = licenseID
+        while uniqueLicenseID in extractedLicenseIDs:
+            duplicateNumber += 1
+            uniqueLicenseID = "%s-%s" %(licenseID, duplicateNumber)
+
+        extractedLicense = {"licenseId" : uniqueLicenseID, "name" : licenseName, "extractedText" : "NOASSERTION"}
+        if licenseUrl != "":
+            extractedLicense["seeAlsos"] = [licenseUrl]
+
+        extractedLicenses[licenseName] = extractedLicense
+        extractedLicenseIDs.add(uniqueLicenseID)
+
+    return extractedLicense["licenseId"]
+
+#------------------------------------------------------------------#
+def create_spdx_extracted_licenses(extractedLicenses):
+    yield from extractedLicenses.values()
+
+#------------------------------------------------------------------#
+def create_spdx_relationships(reportData):
+
+    yield {"spdxElementId" : "SPDXRef-DOCUMENT", "relationshipType" : "DESCRIBES", "relatedSpdxElement" : applicationSPDXID}
+
+    for inventoryID, inventoryItem in ordered_inventory(reportData):
+        yield {"spdxElementId" : applicationSPDXID, "relationshipType" : "CONTAINS", "relatedSpdxElement" : get_spdx_package_id(inventoryID)}
+
+#------------------------------------------------------------------#
+def create_spdx_package(packageID, packageName, packageVersion):
+
+    package = {
+        "name" : packageName,
+        "SPDXID" : packageID,
+        "downloadLocation" : "NOASSERTION",
+        "filesAnalyzed" : False,
+        "licenseConcluded" : "NOASSERTION",
+        "licenseDeclared" : "NOASSERTION",
+        "copyrightText" : "NOASSERTION"
+    }
+
+    if packageVersion != "":
+        package["versionInfo"] = packageVersion
+
+    return package
+
+#------------------------------------------------------------------#
+def get_spdx_package_id(inventoryID):
+    return "SPDXRef-Package-" + str(inventoryID)
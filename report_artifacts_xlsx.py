@@ -9,10 +9,12 @@ File : report_artifacts_xlsx.py
 '''
 
 import logging
+import sys
 import xlsxwriter
 
 import _version
 import common.branding.xlsx.xlsx_formatting
+from report_inventory import ordered_inventory
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +30,7 @@ def generate_xlsx_report(reportData):
     reportOptions = reportData["reportOptions"]
     projectHierarchy = reportData["projectHierarchy"]
     applicationDetails = reportData["applicationDetails"]
+    reportSettings = reportData["reportSettings"]
 
     applicationName = applicationDetails[projectName]["applicationName"]
     applicationVersion = applicationDetails[projectName]["applicationVersion"]
@@ -35,8 +38,14 @@ def generate_xlsx_report(reportData):
 
     xlsxFile = reportFileNameBase + ".xlsx"
 
-    # Create the workbook/worksheet for storying the data
-    workbook = xlsxwriter.Workbook(xlsxFile)
+    # Create the workbook/worksheet for storying the data.  In constant memory mode
+    # each row is flushed to disk once the next row is started so all rows of
+    # a worksheet must be written in order
+    if reportSettings["xlsxConstantMemory"]:
+        logger.info("        Using constant memory mode")
+        workbook = xlsxwriter.Workbook(xlsxFile, {"constant_memory": True})
+    else:
+        workbook = xlsxwriter.Workbook(xlsxFile)
 
     cellFormat = workbook.add_format(common.branding.xlsx.xlsx_formatting.standardCellFormatProperties)
     cellLinkFormat = workbook.add_format(common.branding.xlsx.xlsx_formatting.linkCellFormatProperties)
@@ -108,45 +117,41 @@ def generate_xlsx_report(reportData):
         tableHeaders.append("VULNERABILITIES")
         column+=1
 
-    # If there is no hierarchy add report details 
+    # If there is no hierarchy add report details next to the table.  These
+    # are written along with each table row to keep the rows in order
+    reportDetails = []
+    reportDetailsColumn = column+1
     if len(projectList) == 1:
-        detailsRow=0
-        detailsWorksheet.write(detailsRow, column+1, "Product:  %s" %applicationName)
-        detailsRow+=1 
+        reportDetails.append("Product:  %s" %applicationName)
         if applicationVersion != "":
-            detailsWorksheet.write(detailsRow, column+1, "Version:  %s" %applicationVersion)
-            detailsRow+=1 
+            reportDetails.append("Version:  %s" %applicationVersion)
         if applicationPublisher != "":
-            detailsWorksheet.write(detailsRow, column+1, "Publisher:  %s" %applicationPublisher)
-            detailsRow+=1 
-        detailsWorksheet.write(detailsRow, column+1, "Report Generated:  %s" %reportTimeStamp)
-        detailsRow+=1 
-        detailsWorksheet.write(detailsRow, column+1, "Report Version:  %s" %_version.__version__)
+            reportDetails.append("Publisher:  %s" %applicationPublisher)
+        reportDetails.append("Report Generated:  %s" %reportTimeStamp)
+        reportDetails.append("Report Version:  %s" %_version.__version__)
 
     # Write out the column headers
     detailsWorksheet.write_row(row, 0, tableHeaders, tableHeaderFormat)
+    if row < len(reportDetails):
+        detailsWorksheet.write(row, reportDetailsColumn, reportDetails[row])
 
     ######################################################
     # Cycle through the inventory to create the table with the SBOM Details
-    for inventoryID in inventoryData:
+    for inventoryID, inventoryItem in ordered_inventory(reportData):
         row+=1
-        logger.debug("        Reporting for inventory item %s" %inventoryID)
-
-        projectName = inventoryData[inventoryID]["projectName"]
-        inventoryItemName = inventoryData[inventoryID]["inventoryItemName"]
-        componentName = inventoryData[inventoryID]["componentName"]
-        componentUrl = inventoryData[inventoryID]["componentUrl"]
-        componentVersionName = inventoryData[inventoryID]["componentVersionName"]
-        selectedLicenseName = inventoryData[inventoryID]["selectedLicenseName"]
-        selectedLicenseUrl = inventoryData[inventoryID]["selectedLicenseUrl"]
-        selectedLicenseName = inventoryData[inventoryID]["selectedLicenseName"]
-        projectLink = inventoryData[inventoryID]["projectLink"]
-        hasVulnerabilities = inventoryData[inventoryID]["hasVulnerabilities"]
-        purlString = inventoryData[inventoryID]["purlString"]
+        logger.debug("        Reporting for inventory item %s", inventoryID)
 
-        applicationNameVersion = applicationDetails[projectName]["applicationNameVersion"]
+        inventoryItemName = inventoryItem.inventoryItemName
+        componentName = inventoryItem.componentName
+        componentUrl = inventoryItem.componentUrl
+        componentVersionName = inventoryItem.componentVersionName
+        selectedLicenseName = inventoryItem.selectedLicenseName
+        selectedLicenseUrl = inventoryItem.selectedLicenseUrl
+        hasVulnerabilities = inventoryItem.hasVulnerabilities
+        purlString = inventoryItem.purlString
+        applicationNameVersion = inventoryItem.applicationNameVersion
 
-        logger.debug("            Project Name:  %s --> Inventory Item %s" %(applicationNameVersion, inventoryItemName))
+        logger.debug("            Project Name:  %s --> Inventory Item %s", applicationNameVersion, inventoryItemName)
 
         # Now write each row of inventory data
         column=0
@@ -182,11 +187,19 @@ def generate_xlsx_report(reportData):
             else:
                 detailsWorksheet.write(row, column, "", cellFormat)
 
+        if row < len(reportDetails):
+            detailsWorksheet.write(row, reportDetailsColumn, reportDetails[row])
+
+    # Any report details beyond the end of the table
+    for detailsRow in range(row+1, len(reportDetails)):
+        detailsWorksheet.write(detailsRow, reportDetailsColumn, reportDetails[detailsRow])
 
     # Automatically create the filter sort options
     detailsWorksheet.autofilter(0,0, 0 + len(inventoryData)-1, len(tableHeaders)-1)
 
     workbook.close()
+
+    logger.info("        Peak memory usage: %s MB" %get_peak_memory_usage())
     
     logger.info("    Exiting generate_xlsx_report")
     return xlsxFile
@@ -212,3 +225,19 @@ def display_project_hierarchy(worksheet, parentProject, applicationDetails, row,
 
             row =  display_project_hierarchy(worksheet, childProject, applicationDetails, row, column, boldCellFormat)
     return row
+
+#------------------------------------------------------------#
+def get_peak_memory_usage():
+    # Peak resident set size for the process in MB (not available on Windows)
+    try:
+        import resource
+    except ImportError:
+        return "N/A"
+
+    peakMemory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Linux reports the value in KB while macOS uses bytes
+    if sys.platform == "darwin":
+        peakMemory = peakMemory / 1024
+
+    return round(peakMemory / 1024, 1)
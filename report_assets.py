@@ -0,0 +1,295 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Author : sgeary
+Created On : Sun Oct 18 2026
+File : report_assets.py
+'''
+import os, logging, base64, hashlib, json, re, threading
+from urllib.parse import urljoin
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+assetsVersion = 2  # Layout of the asset cache file
+
+scriptDirectory = os.path.dirname(os.path.realpath(__file__))
+cssFile = os.path.join(scriptDirectory, "common/branding/css/revenera_common.css")
+logoImageFile = os.path.join(scriptDirectory, "common/branding/images/logo_reversed.svg")
+iconFile = os.path.join(scriptDirectory, "common/branding/images/favicon-revenera.ico")
+
+# The branding and any inlined CDN files are kept next to the report log file
+assetCacheFile = os.path.join(scriptDirectory, "_sbom_report_assets.json")
+
+#  The CDN stylesheets and scripts used by the HTML reports along with the
+#  subresource integrity hash (if any) the browser checks them against
+cdnAssets = {
+    "https://stackpath.bootstrapcdn.com/bootstrap/4.5.1/css/bootstrap.min.css" : "sha384-VCmXjywReHh4PwowAiWNagnWcLhlEJLA5buUprzK8rxFgeH0kww/aWY76TfkUoSX",
+    "https://cdnjs.cloudflare.com/ajax/libs/twitter-bootstrap/4.1.3/css/bootstrap.css" : None,
+    "https://cdn.datatables.net/1.10.21/css/dataTables.bootstrap4.min.css" : None,
+    "https://cdnjs.cloudflare.com/ajax/libs/jstree/3.2.1/themes/default/style.min.css" : None,
+    "https://code.jquery.com/jquery-3.5.1.slim.min.js" : "sha384-DfXdz2htPH0lsSSs5nCTpuj/zy4C+OGpamoFVy38MVBnE+IbbVYUew+OrCXaRkfj",
+    "https://cdnjs.cloudflare.com/ajax/libs/jquery/3.5.1/jquery.min.js" : None,
+    "https://cdn.datatables.net/1.10.21/js/jquery.dataTables.min.js" : None,
+    "https://cdn.datatables.net/1.10.21/js/dataTables.bootstrap4.min.js" : None,
+    "https://cdnjs.cloudflare.com/ajax/libs/jstree/3.3.10/jstree.min.js" : None,
+}
+
+# url() references within a stylesheet i.e. url("32px.png") or url(throbber.gif)
+cssURLPattern = re.compile(r"""url\(\s*(['"]?)([^'")]+?)\1\s*\)""")
+
+assetBundle = None  # Assets already loaded by this process
+htmlBlocks = {}  # Finished head and script blocks keyed by branding key, asset URLs and inlining
+failedDownloads = set()  # CDN files that could not be downloaded by this process
+assetLock = threading.Lock()
+
+#----------------------------------------------------------------------#
+def get_asset_bundle():
+    global assetBundle
+
+    # The branding files are only read and encoded again if they have changed
+    brandingKey = get_branding_key()
+
+    with assetLock:
+        if assetBundle is None:
+            assetBundle = load_asset_cache()
+
+        if assetBundle.get("brandingKey") != brandingKey:
+            logger.info("    Creating branding assets for key %s" %brandingKey)
+            if create_branding_assets(assetBundle):
+                assetBundle["brandingKey"] = brandingKey
+                save_asset_cache(assetBundle)
+            else:
+                assetBundle["brandingKey"] = None  # Nothing built from the incomplete branding is reused
+
+    return assetBundle
+
+#----------------------------------------------------------------------#
+def get_branding_key():
+
+    # Any change to the branding files changes their modified time or size
+    brandingDetails = [assetsVersion]
+    for brandingFile in [cssFile, logoImageFile, iconFile]:
+        try:
+            fileStatus = os.stat(brandingFile)
+            brandingDetails.append([brandingFile, fileStatus.st_mtime_ns, fileStatus.st_size])
+        except OSError:
+            brandingDetails.append([brandingFile, None, None])
+
+    return hashlib.sha256(json.dumps(brandingDetails).encode("utf-8")).hexdigest()
+
+#----------------------------------------------------------------------#
+def create_branding_assets(assetBundle):
+
+    assetBundle["logoImage"] = encode_image(logoImageFile)
+    assetBundle["faviconImage"] = encode_image(iconFile)
+
+    # The css is added to the head block of each report as an indented style block
+    try:
+        with open(cssFile) as f_ptr:
+            assetBundle["styleBlock"] = "".join("            %s" %line for line in f_ptr)
+    except OSError:
+        logger.error("Unable to open %s" %cssFile)
+        print("Unable to open %s" %cssFile)
+        assetBundle["styleBlock"] = ""
+        return False  # Try again next time rather than keeping the missing css
+
+    return True
+
+#----------------------------------------------------------------------#
+def encode_image(imageFile):
+
+    # Create base64 value for branding image
+    try:
+        with open(imageFile, "rb") as image:
+            return base64.b64encode(image.read()).decode("utf-8")
+    except:
+        logger.error("Unable to open %s" %imageFile)
+        raise
+
+#----------------------------------------------------------------------#
+def load_asset_cache():
+
+    try:
+        with open(assetCacheFile) as cache_ptr:
+            assetCache = json.load(cache_ptr)
+    except (OSError, ValueError):
+        return {"assetsVersion" : assetsVersion, "cdnContent" : {}}
+
+    if assetCache.get("assetsVersion") != assetsVersion:
+        return {"assetsVersion" : assetsVersion, "cdnContent" : {}}
+
+    return assetCache
+
+#----------------------------------------------------------------------#
+def save_asset_cache(assetBundle):
+
+    # Replace the file in one step in case another report is reading it
+    temporaryFile = "%s.%s" %(assetCacheFile, os.getpid())
+    try:
+        with open(temporaryFile, "w") as cache_ptr:
+            json.dump(assetBundle, cache_ptr)
+        os.replace(temporaryFile, assetCacheFile)
+    except OSError as e:
+        logger.error("Unable to write asset cache %s: %s" %(assetCacheFile, e))
+
+#----------------------------------------------------------------------#
+def get_cdn_content(assetBundle, assetURL):
+
+    # CDN files are versioned by URL so once downloaded they are kept
+    with assetLock:
+        if assetURL in assetBundle["cdnContent"]:
+            return assetBundle["cdnContent"][assetURL]
+
+        # Don't hold up each report with another attempt (i.e. no internet access)
+        if assetURL in failedDownloads:
+            return None
+
+    logger.info("    Downloading %s to inline in the report" %assetURL)
+    try:
+        response = requests.get(assetURL, timeout=30)
+        response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        logger.warning("    Unable to download %s: %s" %(assetURL, e))
+        failedDownloads.add(assetURL)
+        return None
+
+    # Only keep the content if it is what the browser would have accepted
+    integrityHash = cdnAssets.get(assetURL)
+    if integrityHash:
+        hashName, expectedDigest = integrityHash.split("-", 1)
+        if base64.b64encode(hashlib.new(hashName, response.content).digest()).decode("utf-8") != expectedDigest:
+            logger.warning("    Integrity check failed for %s" %assetURL)
+            failedDownloads.add(assetURL)
+            return None
+
+    try:
+        cdnContent = response.content.decode("utf-8")
+    except UnicodeDecodeError as e:
+        logger.warning("    Unable to decode %s: %s" %(assetURL, e))
+        failedDownloads.add(assetURL)
+        return None
+
+    # Relative images and fonts no longer resolve once the stylesheet is inlined
+    if assetURL.endswith(".css"):
+        cdnContent = make_css_urls_absolute(cdnContent, assetURL)
+
+    with assetLock:
+        assetBundle["cdnContent"][assetURL] = cdnContent
+        save_asset_cache(assetBundle)
+
+    return cdnContent
+
+#----------------------------------------------------------------------#
+def make_css_urls_absolute(cssContent, cssURL):
+
+    def make_url_absolute(urlMatch):
+        quoteCharacter, referencedURL = urlMatch.group(1), urlMatch.group(2).strip()
+
+        # Embedded data and references within the page are left as they are
+        if referencedURL.startswith(("data:", "#")):
+            return urlMatch.group(0)
+
+        return "url(%s%s%s)" %(quoteCharacter, urljoin(cssURL, referencedURL), quoteCharacter)
+
+    return cssURLPattern.sub(make_url_absolute, cssContent)
+
+#----------------------------------------------------------------------#
+def get_html_head(reportName, stylesheetURLs, inlineAssets):
+
+    assetBundle = get_asset_bundle()
+
+    # Everything other than the title only changes with the branding files
+    blockKey = (assetBundle["brandingKey"], "head", tuple(stylesheetURLs), inlineAssets)
+    headBlock = get_html_block(blockKey)
+    if headBlock is None:
+        headBlock = create_html_head(assetBundle, stylesheetURLs, inlineAssets)
+        save_html_block(blockKey, headBlock)
+
+    return headBlock + "        <title>%s</title>\n    </head>\n" %(reportName)
+
+#----------------------------------------------------------------------#
+def create_html_head(assetBundle, stylesheetURLs, inlineAssets):
+
+    headBlock = []
+    headBlock.append("    <head>\n")
+    headBlock.append("        <!-- Required meta tags --> \n")
+    headBlock.append("        <meta charset='utf-8'>  \n")
+    headBlock.append("        <meta name='viewport' content='width=device-width, initial-scale=1, shrink-to-fit=no'> \n")
+
+    headBlock.append(" \n")
+    for stylesheetURL in stylesheetURLs:
+        stylesheetContent = get_cdn_content(assetBundle, stylesheetURL) if inlineAssets else None
+
+        if stylesheetContent is None:
+            headBlock.append("        <link rel=\"stylesheet\" href=\"%s\"%s>\n" %(stylesheetURL, get_integrity_attributes(stylesheetURL)))
+        else:
+            headBlock.append("        <style>\n%s\n        </style>\n" %stylesheetContent.replace("</style", "<\\/style"))
+    headBlock.append("    ")
+
+    headBlock.append("        <style>\n")
+    headBlock.append(assetBundle["styleBlock"])
+    headBlock.append("        </style>\n")
+
+    headBlock.append("    \t<link rel='icon' type='image/png' href='data:image/png;base64, %s'>\n" %assetBundle["faviconImage"])
+
+    return "".join(headBlock)
+
+#----------------------------------------------------------------------#
+def get_html_scripts(scriptURLs, inlineAssets):
+
+    assetBundle = get_asset_bundle()
+
+    blockKey = (assetBundle["brandingKey"], "scripts", tuple(scriptURLs), inlineAssets)
+    scriptBlock = get_html_block(blockKey)
+    if scriptBlock is None:
+        scriptBlock = create_html_scripts(assetBundle, scriptURLs, inlineAssets)
+        save_html_block(blockKey, scriptBlock)
+
+    return scriptBlock
+
+#----------------------------------------------------------------------#
+def create_html_scripts(assetBundle, scriptURLs, inlineAssets):
+
+    scriptBlock = ["\n\n"]
+    for scriptURL in scriptURLs:
+        scriptContent = get_cdn_content(assetBundle, scriptURL) if inlineAssets else None
+
+        if scriptContent is None:
+            scriptBlock.append("    <script src=\"%s\"%s></script>\n" %(scriptURL, get_integrity_attributes(scriptURL)))
+        else:
+            scriptBlock.append("    <script>\n%s\n    </script>\n" %scriptContent.replace("</script", "<\\/script"))
+    scriptBlock.append("    ")
+
+    return "".join(scriptBlock)
+
+#----------------------------------------------------------------------#
+def get_html_block(blockKey):
+    with assetLock:
+        return htmlBlocks.get(blockKey)
+
+#----------------------------------------------------------------------#
+def save_html_block(blockKey, htmlBlock):
+
+    # Blocks built while the branding files could not be read are built again
+    if blockKey[0] is None:
+        return
+
+    with assetLock:
+        htmlBlocks[blockKey] = htmlBlock
+
+#----------------------------------------------------------------------#
+def get_integrity_attributes(assetURL):
+
+    integrityHash = cdnAssets.get(assetURL)
+    if integrityHash:
+        return " integrity=\"%s\" crossorigin=\"anonymous\"" %integrityHash
+
+    return ""
+
+#----------------------------------------------------------------------#
+def get_logo_image():
+    return get_asset_bundle()["logoImage"]
@@ -0,0 +1,153 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Author : sgeary
+Created On : Sun Oct 18 2026
+File : report_cache.py
+'''
+import sys, os, logging, argparse, json, sqlite3, threading, time
+
+logger = logging.getLogger(__name__)
+
+# The cache lives next to the report log file so it is shared across report runs
+cacheFile = os.path.join(os.path.dirname(os.path.realpath(__file__)), "_sbom_report_cache.db")
+
+createTableStatement = "CREATE TABLE IF NOT EXISTS cache (cacheName TEXT, cacheKey TEXT, cacheValue TEXT, expiresOn REAL, PRIMARY KEY (cacheName, cacheKey))"
+
+cacheConnection = None
+cacheTTL = 0  # Seconds
+cacheLock = threading.Lock()
+
+#----------------------------------------------------------------------#
+def open_cache(cacheTTLHours, cacheFileName=cacheFile):
+    global cacheConnection, cacheTTL
+    logger.info("Entering open_cache")
+
+    if cacheConnection is not None:
+        return
+
+    # A TTL of zero disables the persistent cache
+    if cacheTTLHours <= 0:
+        logger.info("    Persistent cache disabled")
+        return
+
+    try:
+        connection = sqlite3.connect(cacheFileName, check_same_thread=False)
+        create_cache_table(connection)
+
+        # Evict anything that has expired since the last run
+        expiredEntries = connection.execute("DELETE FROM cache WHERE expiresOn < ?", (time.time(),)).rowcount
+        connection.commit()
+    except sqlite3.Error as e:
+        logger.error("Unable to open cache file %s: %s" %(cacheFileName, e))
+        return
+
+    logger.info("    Using cache file %s (%s expired entries removed)" %(cacheFileName, expiredEntries))
+
+    cacheConnection = connection
+    cacheTTL = cacheTTLHours * 3600
+
+#----------------------------------------------------------------------#
+def close_cache():
+    global cacheConnection
+    logger.info("Entering close_cache")
+
+    if cacheConnection is None:
+        return
+
+    with cacheLock:
+        cacheConnection.close()
+        cacheConnection = None
+
+#----------------------------------------------------------------------#
+def get_cached_value(cacheName, cacheKey):
+
+    if cacheConnection is None:
+        return None
+
+    with cacheLock:
+        try:
+            cacheEntry = cacheConnection.execute("SELECT cacheValue, expiresOn FROM cache WHERE cacheName = ? AND cacheKey = ?", (cacheName, cacheKey)).fetchone()
+        except sqlite3.Error as e:
+            logger.error("Unable to read %s from cache %s: %s" %(cacheKey, cacheName, e))
+            return None
+
+    if cacheEntry is None:
+        return None
+
+    cacheValue, expiresOn = cacheEntry
+
+    if time.time() > expiresOn:
+        return None
+
+    return json.loads(cacheValue)
+
+#----------------------------------------------------------------------#
+def set_cached_value(cacheName, cacheKey, cacheValue, timeToLive=None):
+
+    if cacheConnection is None:
+        return
+
+    # Entries can have their own lifetime (seconds) rather than the overall TTL
+    if timeToLive is None:
+        timeToLive = cacheTTL
+
+    with cacheLock:
+        try:
+            cacheConnection.execute("INSERT OR REPLACE INTO cache (cacheName, cacheKey, cacheValue, expiresOn) VALUES (?, ?, ?, ?)", (cacheName, cacheKey, json.dumps(cacheValue), time.time() + timeToLive))
+            cacheConnection.commit()
+        except sqlite3.Error as e:
+            logger.error("Unable to write %s to cache %s: %s" %(cacheKey, cacheName, e))
+
+#----------------------------------------------------------------------#
+def create_cache_table(connection):
+
+    # Recreate the table if it was created by an earlier version with a different layout
+    cacheColumns = [column[1] for column in connection.execute("PRAGMA table_info(cache)")]
+    if cacheColumns and "expiresOn" not in cacheColumns:
+        logger.info("    Recreating cache table")
+        connection.execute("DROP TABLE cache")
+
+    connection.execute(createTableStatement)
+
+#----------------------------------------------------------------------#
+def clear_cache(cacheName=None, cacheFileName=cacheFile):
+    logger.info("Entering clear_cache")
+
+    if not os.path.exists(cacheFileName):
+        return 0
+
+    connection = sqlite3.connect(cacheFileName)
+    try:
+        create_cache_table(connection)
+        if cacheName is None:
+            removedEntries = connection.execute("DELETE FROM cache").rowcount
+        else:
+            removedEntries = connection.execute("DELETE FROM cache WHERE cacheName = ?", (cacheName,)).rowcount
+        connection.commit()
+    finally:
+        connection.close()
+
+    logger.info("    Removed %s cache entries" %removedEntries)
+
+    return removedEntries
+
+
+#----------------------------------------------------------------------#
+if __name__ == "__main__":
+
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description="Manage the persistent cache used by the SBOM report")
+    parser.add_argument("-clear", "--clear", action="store_true", help="Invalidate the cache")
+    parser.add_argument("-cacheName", "--cacheName", help="Only invalidate the named cache i.e. licenseDetails")
+    args = parser.parse_args()
+
+    if args.clear:
+        removedEntries = clear_cache(args.cacheName)
+        print("Removed %s entries from %s" %(removedEntries, cacheFile))
+    else:
+        parser.print_help()
+        sys.exit(1)
@@ -0,0 +1,32 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Author : sgeary
+Created On : Sun Oct 18 2026
+File : report_client.py
+'''
+import sys
+
+import report_daemon
+
+#  Called by create_report.sh/create_report.bat with the create_report.py
+#  arguments.  The report is created by the report daemon (report_daemon.py)
+#  if it is enabled and running, otherwise it is created by this process
+
+#----------------------------------------------------------------------#
+def main():
+
+    exitCode = report_daemon.submit_report_request(sys.argv[1:])
+
+    if exitCode is None:
+        import create_report
+        create_report.main()
+    elif exitCode:
+        sys.exit(exitCode)
+
+
+#----------------------------------------------------------------------#
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Author : sgeary
+Created On : Sun Oct 18 2026
+File : report_daemon.py
+'''
+import sys, os, argparse, contextlib, io, json, logging, secrets, time, traceback
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Listener, Client
+
+import report_settings
+
+logger = logging.getLogger(__name__)
+
+#  The client side of this module is used by report_client.py for every report
+#  request so only standard library modules are imported until the daemon starts
+
+reportDirectory = os.path.dirname(os.path.realpath(__file__))
+propertiesFile = os.path.join(reportDirectory, "../server_properties.json")  # Same file as create_report.py
+daemonKeyFile = os.path.join(reportDirectory, "_sbom_report_daemon.key")  # Written by the running daemon
+daemonHost = "localhost"
+
+parser = argparse.ArgumentParser(description="Resident process creating SBOM reports for report_client.py")
+parser.add_argument("-start", "--start", action="store_true", help="Run the report daemon (until stopped)")
+parser.add_argument("-stop", "--stop", action="store_true", help="Stop the running report daemon")
+parser.add_argument("-status", "--status", action="store_true", help="Show the status of the running report daemon")
+
+#----------------------------------------------------------------------#
+def get_daemon_settings():
+
+    configData = {}
+    try:
+        with open(propertiesFile, "r") as file_ptr:
+            configData = json.load(file_ptr)
+    except (OSError, ValueError):
+        pass
+
+    return report_settings.get_report_settings(configData)
+
+#----------------------------------------------------------------------#
+def submit_report_request(reportArguments):
+
+    # Returns the exit code of the report or None if the daemon is not used
+    reportSettings = get_daemon_settings()
+    if not reportSettings["reportDaemon"]:
+        return None
+
+    # The artifacts are written to the working directory of the requester
+    response = send_daemon_request({"command" : "createReport", "arguments" : reportArguments, "workingDirectory" : os.getcwd()}, reportSettings["daemonPort"])
+    if response is None:
+        return None
+
+    sys.stdout.write(response["output"])
+    sys.stdout.flush()
+
+    return response["exitCode"]
+
+#----------------------------------------------------------------------#
+def send_daemon_request(daemonRequest, daemonPort):
+
+    # Only a running daemon has a key file
+    try:
+        with open(daemonKeyFile, "rb") as key_ptr:
+            authKey = key_ptr.read()
+    except OSError:
+        return None
+
+    try:
+        with Client((daemonHost, daemonPort), authkey=authKey) as connection:
+            connection.send(daemonRequest)
+            return connection.recv()
+    except (OSError, EOFError, AuthenticationError):
+        return None
+
+#----------------------------------------------------------------------#
+def run_daemon(daemonPort):
+
+    # The report modules, caches, HTTP session and branding images stay loaded
+    # between reports.  Importing create_report also sets up the log file
+    import create_report
+    import report_logging
+
+    logger.info("Entering run_daemon")
+
+    baseURL, reportSettings = create_report.load_report_settings()
+    create_report.start_report_services(reportSettings)
+
+    # Each start uses a new key so only processes that can read the key file can connect
+    authKey = secrets.token_bytes(32)
+    listener = Listener((daemonHost, daemonPort), authkey=authKey, backlog=32)
+    write_key_file(authKey)
+
+    daemonStatus = {"pid" : os.getpid(), "port" : daemonPort, "startedOn" : time.strftime("%Y-%m-%d %H:%M:%S"), "reportsCreated" : 0}
+    logger.info("    Report daemon listening on %s:%s" %(daemonHost, daemonPort))
+    print("Report daemon listening on %s:%s" %(daemonHost, daemonPort))
+
+    try:
+        # Report requests are handled one at a time with any others waiting to connect
+        while True:
+            try:
+                connection = listener.accept()
+            except (OSError, EOFError, AuthenticationError) as e:
+                logger.warning("    Rejected report daemon connection: %s" %e)
+                continue
+
+            with connection:
+                try:
+                    daemonRequest = connection.recv()
+                except (OSError, EOFError):
+                    continue
+
+                if daemonRequest["command"] == "stop":
+                    connection.send(daemonStatus)
+                    break
+                elif daemonRequest["command"] == "status":
+                    connection.send(daemonStatus)
+                elif daemonRequest["command"] == "createReport":
+                    daemonResponse = create_daemon_report(create_report, report_logging, baseURL, reportSettings, daemonRequest)
+                    daemonStatus["reportsCreated"] += 1
+
+                    try:
+                        connection.send(daemonResponse)
+                    except OSError:
+                        logger.error("    Report requester disconnected before the report completed")
+
+    except KeyboardInterrupt:
+        pass
+    finally:
+        listener.close()
+        remove_key_file()
+        create_report.stop_report_services()
+        logger.info("    Report daemon stopped after %s reports" %daemonStatus["reportsCreated"])
+        print("Report daemon stopped after %s reports" %daemonStatus["reportsCreated"])
+        report_logging.stop_logging()
+
+#----------------------------------------------------------------------#
+def create_daemon_report(create_report, report_logging, baseURL, reportSettings, daemonRequest):
+
+    # Each report starts with an empty log file and no timings as it would in its own process
+    report_logging.restart_log_file()
+    create_report.report_metrics.reset_metrics()
+
+    # The in memory license and component details are only kept for one report so
+    # changes on the server are seen once the persistent cache entries expire (sbom.cacheTTL)
+    create_report.report_data.sharedLicenseDetails.clear()
+    create_report.report_data.purl.componentDetailsCache.clear()
+
+    reportOutput = io.StringIO()
+    daemonDirectory = os.getcwd()
+
+    with contextlib.redirect_stdout(reportOutput):
+        try:
+            os.chdir(daemonRequest["workingDirectory"])
+            exitCode = create_report.run_report_request(baseURL, reportSettings, daemonRequest["arguments"])
+        except SystemExit as e:
+            exitCode = e.code if isinstance(e.code, int) else 1
+        except Exception:
+            logger.exception("Unable to create report")
+            traceback.print_exc(file=reportOutput)
+            exitCode = 1
+        finally:
+            os.chdir(daemonDirectory)
+
+    return {"exitCode" : exitCode, "output" : reportOutput.getvalue()}
+
+#----------------------------------------------------------------------#
+def write_key_file(authKey):
+
+    # Readable by the owner of the daemon only
+    keyFileDescriptor = os.open(daemonKeyFile, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(keyFileDescriptor, "wb") as key_ptr:
+        key_ptr.write(authKey)
+
+#----------------------------------------------------------------------#
+def remove_key_file():
+    try:
+        os.remove(daemonKeyFile)
+    except OSError:
+        pass
+
+#----------------------------------------------------------------------#
+def main():
+
+    args = parser.parse_args()
+    daemonPort = get_daemon_settings()["daemonPort"]
+
+    if args.start:
+        run_daemon(daemonPort)
+    elif args.stop or args.status:
+        daemonStatus = send_daemon_request({"command" : "stop" if args.stop else "status"}, daemonPort)
+        if daemonStatus is None:
+            print("Report daemon is not running")
+            sys.exit(1)
+
+        print("Report daemon (pid %s) on %s:%s started %s has created %s reports" %(daemonStatus["pid"], daemonHost, daemonStatus["port"], daemonStatus["startedOn"], daemonStatus["reportsCreated"]))
+        if args.stop:
+            print("Report daemon stopped")
+    else:
+        parser.print_help()
+
+
+#----------------------------------------------------------------------#
+if __name__ == "__main__":
+    main()
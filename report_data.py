@@ -8,19 +8,34 @@ Created On : Wed Oct 06 2021
 File : report_data.py
 '''
 import logging
-from collections import OrderedDict
+import hashlib
+import json
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 
 import common.application_details
-import common.project_heirarchy
+import common.api.project.get_child_projects
 import common.api.project.get_inventory_summary
 import common.api.project.get_project_information
 import common.api.license.license_lookup
 
+import requests
+
+import api_inventory
 import purl
+import report_cache
+import report_metrics
+from report_inventory import ProjectDetails, InventoryRecord, SortedInventory, add_component_group, create_inventory_order
 
 logger = logging.getLogger(__name__)
 logging.getLogger("urllib3").setLevel(logging.WARNING)  # Disable logging for requests module
 
+snapshotVersion = 3  # Layout of the project snapshots stored in the report cache
+
+# License details for each server shared by all reports created by the process (batch mode)
+sharedLicenseDetails = {}
+
 
 #-------------------------------------------------------------------#
 def gather_data_for_report(baseURL, projectID, authToken, reportData):
@@ -30,168 +45,182 @@ def gather_data_for_report(baseURL, projectID, authToken, reportData):
     reportOptions = reportData["reportOptions"]
     includeChildProjects = reportOptions["includeChildProjects"]  # True/False
     includeVulnerabilities = reportOptions["includeVulnerabilities"]  # True/False
+    aggregateComponents = reportOptions["aggregateComponents"]  # True/False
+
+    projectWorkers = reportData["reportSettings"]["projectWorkers"]
+    inventoryPageSize = reportData["reportSettings"]["inventoryPageSize"]
+    inventoryPageWorkers = reportData["reportSettings"]["inventoryPageWorkers"]
+    incrementalMode = reportData["reportSettings"]["incrementalMode"]
+    releaseVersion = reportData["releaseVersion"]
 
     projectList = [] # List to hold parent/child details for report
     inventoryData = {}  # Create a dictionary containing the inventory data using inventoryID as keys
+    componentGroups = {}  # Inventory grouped by component/version/license/purl using a group ID as keys
+    componentGroupIndex = {}  # Dictionary to map each component/version/license/purl to its group
     projectData = {} # Create a dictionary containing the project level summary data using projectID as keys
-    licenseDetails = {} # Dictionary to store license details to avoid multiple lookups for same id
+    licenseDetails = sharedLicenseDetails.setdefault(baseURL, {}) # Dictionary to store license details to avoid multiple lookups for same id
     applicationDetails = {} # Dictionary to allow a project to be mapped to an application name/version
 
-    # applicationDetails = common.application_details.determine_application_details(projectID, baseURL, authToken)
-    projectList = common.project_heirarchy.create_project_heirarchy(baseURL, authToken, projectID, includeChildProjects)
+    # Get the parent/child projects start at the base project.  The nested hierarchy is
+    # used for the xlsx hierarchy sheet and the flat list for everything else
+    with report_metrics.span("gatherData.projectHierarchy"):
+        projectHierarchy = get_project_hierarchy(baseURL, projectID, authToken, reportData["reportSettings"]["hierarchyCacheTTL"])
+    projectList = create_project_list(projectHierarchy, includeChildProjects, baseURL)
     topLevelProjectName = projectList[0]["projectName"]
 
-    # Get the list of parent/child projects start at the base project
-    projectHierarchy = common.api.project.get_child_projects.get_child_projects_recursively(baseURL, projectID, authToken)
+    # The optional streaming pipeline passes the inventory through generator stages
+    # into sorted runs spilled to disk rather than holding it all in memory
+    if reportData["reportSettings"]["streamingPipeline"]:
+        if aggregateComponents:
+            logger.warning("    The streaming pipeline does not support aggregateComponents.  Using the staged pipeline")
+        else:
+            return gather_streamed_data(baseURL, authToken, reportData, projectHierarchy, projectList, licenseDetails)
 
     projectInventoryCount = {}
 
-    #  Gather the details for each project and summerize the data
+    # Snapshots are only refreshed for unchanged projects once they expire so make
+    # it clear how out of date the report can be
+    if incrementalMode:
+        logger.warning("    Incremental mode is enabled.  License and vulnerability changes for unchanged projects may not be shown for up to %s hours" %reportData["reportSettings"]["snapshotMaxAge"])
+
+    # Collect the project details and inventory for each unique project concurrently.
+    # The same child project can appear more than once within the hierarchy
+    uniqueProjects = {}
     for project in projectList:
+        uniqueProjects[project["projectID"]] = project["projectName"]
+
+    logger.info("    Collecting data for %s projects using %s workers" %(len(uniqueProjects), projectWorkers))
+
+    # With paged inventory only the first page of each project is fetched here.  The
+    # remaining pages are fetched by the page workers while the inventory is processed
+    pageExecutor = create_page_executor(reportData["reportSettings"])
+
+    try:
+        with report_metrics.span("gatherData.projectData"), ThreadPoolExecutor(max_workers=max(1, projectWorkers)) as executor:
+            projectFutures = {}
+            for uniqueProjectID, uniqueProjectName in uniqueProjects.items():
+                projectFutures[uniqueProjectID] = executor.submit(get_project_data, baseURL, uniqueProjectName, uniqueProjectID, authToken, includeVulnerabilities, incrementalMode, releaseVersion, pageExecutor, inventoryPageSize, inventoryPageWorkers)
+
+            collectedProjectData = {}
+            for uniqueProjectID, projectFuture in projectFutures.items():
+                collectedProjectData[uniqueProjectID] = projectFuture.result()
+
+        # Paged inventory can only be read once so read all the pages of any project that
+        # appears more than once in the hierarchy or is needed for the component lookups
+        projectOccurrences = Counter(project["projectID"] for project in projectList)
+        for uniqueProjectID, (uniqueProjectApplicationDetails, uniqueProjectInventorySummary, uniqueProjectSnapshot) in collectedProjectData.items():
+            if isinstance(uniqueProjectInventorySummary, api_inventory.InventoryPages):
+                if projectOccurrences[uniqueProjectID] > 1 or releaseVersion < "2024R1":
+                    collectedProjectData[uniqueProjectID] = (uniqueProjectApplicationDetails, list(uniqueProjectInventorySummary), uniqueProjectSnapshot)
+
+        # Prior to 2024R1 the purl is created from the component details so look up
+        # each distinct component once rather than once per inventory item
+        if releaseVersion < "2024R1":
+            componentIds = set()
+            for uniqueProjectApplicationDetails, uniqueProjectInventorySummary, uniqueProjectSnapshot in collectedProjectData.values():
+                # Nothing to look up if the project data is coming from a snapshot
+                if uniqueProjectInventorySummary is None:
+                    continue
+
+                for inventoryItem in uniqueProjectInventorySummary:
+                    if inventoryItem["type"] == "Component":
+                        componentIds.add(inventoryItem["componentId"])
+
+            with report_metrics.span("gatherData.componentDetails"):
+                purl.prefetch_component_details(baseURL, componentIds, authToken, reportData["reportSettings"]["componentWorkers"], reportData["reportSettings"]["persistComponentCache"])
+
+        #  Summerize the data for each project in the original hierarchy order
+        processingStartTime = time.perf_counter()
+        for project in projectList:
+
+            projectID = project["projectID"]
+            projectName = project["projectName"]
+            projectLink = project["projectLink"]
+
+            applicationDetails[projectName], projectInventorySummary, projectSnapshot = collectedProjectData[projectID]
+            applicationNameVersion = applicationDetails[projectName]["applicationNameVersion"]
+           
+            # Add the applicationNameVersion to the project hierarchy
+            project["applicationNameVersion"] = applicationNameVersion
 
-        projectID = project["projectID"]
-        projectName = project["projectName"]
-        projectLink = project["projectLink"]
+            # Create empty dictionary for project level data for this project
+            projectData[projectName] = {}
 
-        applicationDetails[projectName] = determine_application_details(baseURL, projectName, projectID, authToken)
-        applicationNameVersion = applicationDetails[projectName]["applicationNameVersion"]
-           
-        # Add the applicationNameVersion to the project hierarchy
-        project["applicationNameVersion"] = applicationNameVersion
-             
-        # Include vulnerability data?
-        if includeVulnerabilities:
-            # Just default to v3 summary data
-            projectInventorySummary = common.api.project.get_inventory_summary.get_project_inventory_with_v3_summary(baseURL, projectID, authToken)
-        else:
-            projectInventorySummary = common.api.project.get_inventory_summary.get_project_inventory_without_vulns_summary(baseURL, projectID, authToken)
+            # Project level values shared by each inventory record for the project
+            projectDetails = ProjectDetails(projectID, projectName, projectLink, applicationNameVersion)
 
-        
-        if not projectInventorySummary:
-            logger.warning("    Project contains no inventory items")
-            print("Project contains no inventory items.")
+            # Has the project changed since the last snapshot was taken?
+            if projectInventorySummary is None:
+                logger.info("    Using inventory snapshot for project %s" %projectName)
+
+                for inventoryValues in projectSnapshot["inventoryData"]:
+                    inventoryRecord = InventoryRecord.from_dict(projectDetails, inventoryValues)
+                    inventoryData[inventoryRecord.inventoryID] = inventoryRecord
 
-        # Create empty dictionary for project level data for this project
-        projectData[projectName] = {}
+                    if aggregateComponents:
+                        add_component_group(componentGroups, componentGroupIndex, inventoryRecord)
 
-        currentItem=0
-        projectInventoryCount[projectName] = len(projectInventorySummary)
+                projectInventoryCount[projectName] = projectSnapshot["inventoryCount"]
+                projectData[projectName]["projectLink"] = projectLink
+                continue
+
+            projectInventoryData = [] # Processed inventory for the project snapshot
 
-        for inventoryItem in projectInventorySummary:
+            currentItem=0
+            projectInventoryCount[projectName] = 0  # Counted as the items are read since paged inventory has no length
 
-            inventoryType = inventoryItem["type"]
+            for inventoryItem in projectInventorySummary:
+
+                projectInventoryCount[projectName] += 1
+                inventoryType = inventoryItem["type"]
             
-            # This is not a component for move to the next item
-            if inventoryType != "Component":
-                continue
+                # This is not a component for move to the next item
+                if inventoryType != "Component":
+                    continue
 
-            currentItem +=1
+                currentItem +=1
 
-            inventoryID = inventoryItem["id"]
-            inventoryItemName = inventoryItem["name"]
+                inventoryID = inventoryItem["id"]
+                inventoryItemName = inventoryItem["name"]
 
-            logger.debug("Processing inventory items %s of %s" %(currentItem, len(projectInventorySummary)))
-            logger.debug("    Project:  %s   Inventory Name: %s  Inventory ID: %s" %(projectName, inventoryItemName, inventoryID))
+                logger.debug("Processing inventory item %s", currentItem)
+                logger.debug("    Project:  %s   Inventory Name: %s  Inventory ID: %s", projectName, inventoryItemName, inventoryID)
             
-            componentName = inventoryItem["componentName"]
-            componentVersionName = inventoryItem["componentVersionName"]
-            selectedLicenseID = inventoryItem["selectedLicenseId"]
-            selectedLicenseName = inventoryItem["selectedLicenseSPDXIdentifier"]
+                # Store the data for the inventory item for reporting
+                inventoryData[inventoryID] = create_inventory_record(inventoryItem, projectDetails, baseURL, authToken, licenseDetails, releaseVersion)
 
-            if reportData["releaseVersion"] >= "2024R1":
-                purlString = inventoryItem["purl"]
-            else:
-                # Attempt to generate a purl string for the component
-                try:
-                    purlString = purl.get_purl_string(inventoryItem, baseURL, authToken)
-                except:
-                    logger.warning("Unable to create purl string for inventory item %s." %inventoryItemName)
-                    purlString = ""
+                projectInventoryData.append(inventoryData[inventoryID].to_dict())
 
+                if aggregateComponents:
+                    add_component_group(componentGroups, componentGroupIndex, inventoryData[inventoryID])
 
-            if selectedLicenseID in licenseDetails.keys():
-                selectedLicenseName = licenseDetails[selectedLicenseID]["selectedLicenseName"]
-                selectedLicenseUrl = licenseDetails[selectedLicenseID]["selectedLicenseUrl"]
-            else:
-                if selectedLicenseID != "N/A":  
-                    logger.debug("        Fetching license details for %s with ID %s" %(selectedLicenseName, selectedLicenseID ))
-                    licenseInformation = common.api.license.license_lookup.get_license_details(baseURL, selectedLicenseID, authToken)
-                    licenseURL = licenseInformation["url"]
-                    spdxIdentifier = licenseInformation["spdxIdentifier"]
-                    licensePriority = licenseInformation["priority"]
+                projectData[projectName]["projectLink"] = projectLink
 
-                    if spdxIdentifier != "" and spdxIdentifier != "N/A":
-                        licenseName = spdxIdentifier
-                    else:
-                        licenseName = licenseInformation["shortName"]
+            if not projectInventoryCount[projectName]:
+                logger.warning("    Project contains no inventory items")
+                print("Project contains no inventory items.")
 
-                    # There is not specific selected licesne just let it be blank
-                    if licenseName == "I don't know":
-                        licenseName = ""
+            if incrementalMode:
+                save_project_snapshot(baseURL, projectID, includeVulnerabilities, projectSnapshot, projectInventoryCount[projectName], projectInventoryData, reportData["reportSettings"]["snapshotMaxAge"])
 
-                    licenseDetails[selectedLicenseID] = {}
-                    licenseDetails[selectedLicenseID]["selectedLicenseName"] = licenseName
-                    licenseDetails[selectedLicenseID]["selectedLicenseUrl"] = licenseURL
-                    licenseDetails[selectedLicenseID]["selectedLicensePriority"] = licensePriority
+        report_metrics.record_timing("phases", "gatherData.processInventory", time.perf_counter() - processingStartTime)
+    finally:
+        shutdown_page_executor(pageExecutor)
 
-                    selectedLicenseName = licenseName
-                    selectedLicenseUrl = licenseURL
+    # Report each distinct component once along with the projects it is used in
+    if aggregateComponents:
+        logger.info("    %s inventory items grouped into %s components" %(len(inventoryData), len(componentGroups)))
+        inventoryData = componentGroups
 
-                else:
-                    # Typically a WIP item
-                    selectedLicenseName = ""
-                    selectedLicenseUrl = ""     
-
-            # If there is no specific version just leave it blank
-            if componentVersionName == "N/A":
-                componentVersionName = ""
-
-            # If there is no license URL set it to blank
-            if selectedLicenseUrl is None:
-                selectedLicenseUrl = ""
-
-            componentUrl = inventoryItem["url"]
-            inventoryLink = baseURL + "/codeinsight/FNCI#myprojectdetails/?id=" + str(projectID) + "&tab=projectInventory&pinv=" + str(inventoryID)
-
-            # Determine if there are any vulnerabilities
-            try:
-                vulnerabilities = inventoryItem["vulnerabilitySummary"][0]["CvssV3"]
-                
-                if sum(vulnerabilities.values()):
-                    hasVulnerabilities=True
-                else:
-                    hasVulnerabilities=False
-
-            except:
-                logger.info("        No vulnerabilies for %s - %s" %(componentName, componentVersionName))
-                hasVulnerabilities=False
-
-
-            # Store the data for the inventory item for reporting
-            inventoryData[inventoryID] = {
-                "projectName" : projectName,
-                "inventoryItemName" : inventoryItemName,
-                "componentName" : componentName,
-                "componentVersionName" : componentVersionName,
-                "selectedLicenseName" : selectedLicenseName,
-                "componentUrl" : componentUrl,
-                "selectedLicenseUrl" : selectedLicenseUrl,
-                "inventoryLink" : inventoryLink,
-                "projectLink" : projectLink,
-                "hasVulnerabilities" : hasVulnerabilities,
-                "applicationNameVersion" : applicationNameVersion,
-                "purlString" : purlString
-            }
-
-            projectData[projectName]["projectLink"] = projectLink
-
-    # Sort the inventory data by Component Name / Component Version / Selected License Name
-    sortedInventoryData = OrderedDict(sorted(inventoryData.items(), key=lambda x: (x[1]['componentName'],  x[1]['componentVersionName'], x[1]['selectedLicenseName'])  ) )
+    # Order the inventory by Component Name / Component Version / Selected License Name (or the configured sort order)
+    with report_metrics.span("gatherData.sortInventory"):
+        inventoryOrder = create_inventory_order(inventoryData, reportData["reportSettings"]["inventorySortOrder"])
 
     # Build up the data to return for the
     reportData["projectHierarchy"] = projectHierarchy
     reportData["topLevelProjectName"] = topLevelProjectName
-    reportData["inventoryData"] = sortedInventoryData
+    reportData["inventoryData"] = inventoryData
+    reportData["inventoryOrder"] = inventoryOrder
     reportData["projectList"] =projectList
     reportData["reportOptions"] =reportOptions
     reportData["projectInventoryCount"] = projectInventoryCount
@@ -200,6 +229,293 @@ def gather_data_for_report(baseURL, projectID, authToken, reportData):
     return reportData
 
 
+#----------------------------------------------#
+def gather_streamed_data(baseURL, authToken, reportData, projectHierarchy, projectList, licenseDetails):
+    logger.info("Entering gather_streamed_data")
+
+    reportSettings = reportData["reportSettings"]
+
+    if reportSettings["incrementalMode"]:
+        logger.warning("    Inventory snapshots are not used by the streaming pipeline")
+
+    applicationDetails = {}
+    projectInventoryCount = {}
+    inventoryData = SortedInventory(reportSettings["inventorySortOrder"], reportSettings["pipelineRunSize"])
+
+    pageExecutor = create_page_executor(reportSettings)
+
+    # fetch -> Components only -> license and purl details -> sorted runs
+    with report_metrics.span("gatherData.streamInventory"):
+        try:
+            projectInventory = fetch_project_inventory(baseURL, authToken, projectList, reportData, pageExecutor, applicationDetails, projectInventoryCount)
+            componentItems = filter_components(projectInventory)
+            inventoryRecords = enrich_inventory(componentItems, baseURL, authToken, licenseDetails, reportData["releaseVersion"])
+
+            for inventoryRecord in inventoryRecords:
+                inventoryData.add_record(inventoryRecord)
+        finally:
+            shutdown_page_executor(pageExecutor)
+
+    logger.info("    %s inventory items sorted in %s runs" %(len(inventoryData), len(inventoryData.runFiles) + 1))
+
+    reportData["projectHierarchy"] = projectHierarchy
+    reportData["topLevelProjectName"] = projectList[0]["projectName"]
+    reportData["inventoryData"] = inventoryData
+    reportData["inventoryOrder"] = None  # The inventory is read in order from the sorted runs
+    reportData["projectList"] = projectList
+    reportData["projectInventoryCount"] = projectInventoryCount
+    reportData["applicationDetails"] = applicationDetails
+
+    return reportData
+
+#----------------------------------------------#
+def fetch_project_inventory(baseURL, authToken, projectList, reportData, pageExecutor, applicationDetails, projectInventoryCount):
+
+    reportSettings = reportData["reportSettings"]
+    includeVulnerabilities = reportData["reportOptions"]["includeVulnerabilities"]
+    releaseVersion = reportData["releaseVersion"]
+    projectWorkers = max(1, reportSettings["projectWorkers"])
+
+    # Only the next few projects are fetched ahead of the project being read
+    # so the whole portfolio is never held in memory at once
+    uniqueProjects = {}
+    for project in projectList:
+        uniqueProjects.setdefault(project["projectID"], project["projectName"])
+    pendingProjects = deque(uniqueProjects.items())
+
+    projectApplicationDetails = {}
+
+    with ThreadPoolExecutor(max_workers=projectWorkers) as executor:
+        projectFutures = {}
+
+        for project in projectList:
+            projectID = project["projectID"]
+            projectName = project["projectName"]
+
+            # A project appearing more than once in the hierarchy is only read once
+            if projectID not in projectApplicationDetails:
+                while pendingProjects and len(projectFutures) < projectWorkers:
+                    pendingProjectID, pendingProjectName = pendingProjects.popleft()
+                    projectFutures[pendingProjectID] = executor.submit(get_project_data, baseURL, pendingProjectName, pendingProjectID, authToken, includeVulnerabilities, False, releaseVersion, pageExecutor, reportSettings["inventoryPageSize"], reportSettings["inventoryPageWorkers"])
+
+                projectApplicationDetails[projectID], projectInventorySummary, projectSnapshot = projectFutures.pop(projectID).result()
+            else:
+                projectInventorySummary = None
+
+            applicationDetails[projectName] = projectApplicationDetails[projectID]
+            project["applicationNameVersion"] = applicationDetails[projectName]["applicationNameVersion"]
+
+            if projectInventorySummary is None:
+                continue
+
+            # Prior to 2024R1 look up the distinct components for the project before its items are enriched
+            if releaseVersion < "2024R1":
+                projectInventorySummary = list(projectInventorySummary)
+                componentIds = {inventoryItem["componentId"] for inventoryItem in projectInventorySummary if inventoryItem["type"] == "Component"}
+                purl.prefetch_component_details(baseURL, componentIds, authToken, reportSettings["componentWorkers"], reportSettings["persistComponentCache"])
+
+            projectDetails = ProjectDetails(projectID, projectName, project["projectLink"], project["applicationNameVersion"])
+            projectInventoryCount[projectName] = 0
+
+            for inventoryItem in projectInventorySummary:
+                projectInventoryCount[projectName] += 1
+                yield projectDetails, inventoryItem
+
+            if not projectInventoryCount[projectName]:
+                logger.warning("    Project contains no inventory items")
+                print("Project contains no inventory items.")
+
+#----------------------------------------------#
+def filter_components(projectInventory):
+    for projectDetails, inventoryItem in projectInventory:
+        if inventoryItem["type"] == "Component":
+            yield projectDetails, inventoryItem
+
+#----------------------------------------------#
+def enrich_inventory(componentItems, baseURL, authToken, licenseDetails, releaseVersion):
+    for projectDetails, inventoryItem in componentItems:
+        logger.debug("    Project:  %s   Inventory Name: %s  Inventory ID: %s", projectDetails.projectName, inventoryItem["name"], inventoryItem["id"])
+        yield create_inventory_record(inventoryItem, projectDetails, baseURL, authToken, licenseDetails, releaseVersion)
+
+#----------------------------------------------#
+def create_page_executor(reportSettings):
+
+    # With paged inventory the pages after the first are fetched by the page
+    # workers while the inventory is processed
+    if reportSettings["inventoryPageSize"] <= 0:
+        return None
+
+    logger.info("    Fetching inventory in pages of %s items using %s page workers" %(reportSettings["inventoryPageSize"], reportSettings["inventoryPageWorkers"]))
+    return api_inventory.PageExecutor(max_workers=max(1, reportSettings["inventoryPageWorkers"]))
+
+#----------------------------------------------#
+def shutdown_page_executor(pageExecutor):
+    # Any pages still waiting to be fetched (i.e. the processing failed) are cancelled
+    if pageExecutor is not None:
+        pageExecutor.cancel_pages()
+        pageExecutor.shutdown(wait=False)
+
+#----------------------------------------------#
+def create_inventory_record(inventoryItem, projectDetails, baseURL, authToken, licenseDetails, releaseVersion):
+
+    inventoryID = inventoryItem["id"]
+    inventoryItemName = inventoryItem["name"]
+
+    componentName = inventoryItem["componentName"]
+    componentVersionName = inventoryItem["componentVersionName"]
+    selectedLicenseID = inventoryItem["selectedLicenseId"]
+    selectedLicenseName = inventoryItem["selectedLicenseSPDXIdentifier"]
+
+    if releaseVersion >= "2024R1":
+        purlString = inventoryItem["purl"]
+    else:
+        # Attempt to generate a purl string for the component
+        try:
+            with report_metrics.span("purlGeneration", "operations"):
+                purlString = purl.get_purl_string(inventoryItem, baseURL, authToken)
+        except:
+            logger.warning("Unable to create purl string for inventory item %s." %inventoryItemName)
+            purlString = ""
+
+
+    if selectedLicenseID in licenseDetails.keys():
+        selectedLicenseName = licenseDetails[selectedLicenseID]["selectedLicenseName"]
+        selectedLicenseUrl = licenseDetails[selectedLicenseID]["selectedLicenseUrl"]
+        selectedLicenseIsSPDX = licenseDetails[selectedLicenseID]["selectedLicenseIsSPDX"]
+    else:
+        if selectedLicenseID != "N/A":  
+            # Was this license looked up during a previous report run?
+            licenseCacheKey = baseURL + "|" + str(selectedLicenseID)
+            cachedLicenseDetails = report_cache.get_cached_value("licenseDetails", licenseCacheKey)
+
+            # Entries cached before the SPDX flag was added are looked up again
+            if cachedLicenseDetails is not None and "selectedLicenseIsSPDX" in cachedLicenseDetails:
+                licenseDetails[selectedLicenseID] = cachedLicenseDetails
+            else:
+                logger.debug("        Fetching license details for %s with ID %s", selectedLicenseName, selectedLicenseID)
+                with report_metrics.span("licenseLookup", "operations"):
+                    licenseInformation = common.api.license.license_lookup.get_license_details(baseURL, selectedLicenseID, authToken)
+                licenseURL = licenseInformation["url"]
+                spdxIdentifier = licenseInformation["spdxIdentifier"]
+                licensePriority = licenseInformation["priority"]
+
+                if spdxIdentifier != "" and spdxIdentifier != "N/A":
+                    licenseName = spdxIdentifier
+                    isSPDXLicense = True
+                else:
+                    licenseName = licenseInformation["shortName"]
+                    isSPDXLicense = False
+
+                # There is not specific selected licesne just let it be blank
+                if licenseName == "I don't know":
+                    licenseName = ""
+
+                licenseDetails[selectedLicenseID] = {}
+                licenseDetails[selectedLicenseID]["selectedLicenseName"] = licenseName
+                licenseDetails[selectedLicenseID]["selectedLicenseUrl"] = licenseURL
+                licenseDetails[selectedLicenseID]["selectedLicensePriority"] = licensePriority
+                licenseDetails[selectedLicenseID]["selectedLicenseIsSPDX"] = isSPDXLicense
+
+                report_cache.set_cached_value("licenseDetails", licenseCacheKey, licenseDetails[selectedLicenseID])
+
+            selectedLicenseName = licenseDetails[selectedLicenseID]["selectedLicenseName"]
+            selectedLicenseUrl = licenseDetails[selectedLicenseID]["selectedLicenseUrl"]
+            selectedLicenseIsSPDX = licenseDetails[selectedLicenseID]["selectedLicenseIsSPDX"]
+
+        else:
+            # Typically a WIP item
+            selectedLicenseName = ""
+            selectedLicenseUrl = ""     
+            selectedLicenseIsSPDX = False
+
+    # If there is no specific version just leave it blank
+    if componentVersionName == "N/A":
+        componentVersionName = ""
+
+    # If there is no license URL set it to blank
+    if selectedLicenseUrl is None:
+        selectedLicenseUrl = ""
+
+    componentUrl = inventoryItem["url"]
+
+    # Determine if there are any vulnerabilities
+    try:
+        vulnerabilities = inventoryItem["vulnerabilitySummary"][0]["CvssV3"]
+        
+        if sum(vulnerabilities.values()):
+            hasVulnerabilities=True
+        else:
+            hasVulnerabilities=False
+
+    except (KeyError, IndexError, TypeError, AttributeError):
+        logger.debug("        No vulnerabilities for %s - %s", componentName, componentVersionName)
+        hasVulnerabilities=False
+
+
+    return InventoryRecord(
+        project = projectDetails,
+        inventoryID = inventoryID,
+        inventoryItemName = inventoryItemName,
+        componentName = componentName,
+        componentVersionName = componentVersionName,
+        selectedLicenseName = selectedLicenseName,
+        selectedLicenseUrl = selectedLicenseUrl,
+        componentUrl = componentUrl,
+        hasVulnerabilities = hasVulnerabilities,
+        purlString = purlString,
+        selectedLicenseIsSPDX = selectedLicenseIsSPDX
+    )
+
+#----------------------------------------------#
+def get_project_hierarchy(baseURL, projectID, authToken, hierarchyCacheTTL):
+    logger.debug("Entering get_project_hierarchy.")
+
+    # Can a recently collected hierarchy be used?
+    hierarchyCacheKey = baseURL + "|" + str(projectID)
+    if hierarchyCacheTTL > 0:
+        projectHierarchy = report_cache.get_cached_value("projectHierarchy", hierarchyCacheKey)
+        if projectHierarchy is not None:
+            logger.info("    Using cached project hierarchy for project %s" %projectID)
+            return projectHierarchy
+
+    projectHierarchy = common.api.project.get_child_projects.get_child_projects_recursively(baseURL, projectID, authToken)
+
+    if hierarchyCacheTTL > 0:
+        report_cache.set_cached_value("projectHierarchy", hierarchyCacheKey, projectHierarchy, hierarchyCacheTTL * 60)
+
+    return projectHierarchy
+
+#----------------------------------------------#
+def get_all_projects(baseURL, authToken):
+    logger.debug("Entering get_all_projects.")
+
+    # Used by batch mode to find the projects matching a name filter
+    projectsURL = baseURL + "/codeinsight/api/projects"
+    response = requests.get(projectsURL, headers={"Authorization" : "Bearer " + authToken})
+
+    if response.status_code != 200:
+        raise RuntimeError("Unable to get the list of projects.  Response code %s" %response.status_code)
+
+    return response.json()["data"]
+
+#----------------------------------------------#
+def create_project_list(projectHierarchy, includeChildProjects, baseURL):
+    logger.debug("Entering create_project_list.")
+
+    # The top level project is the root of the jsTree hierarchy
+    nodeDetails = {}
+    nodeDetails["projectID"] = projectHierarchy["id"]
+    nodeDetails["parent"] = "#"
+    nodeDetails["projectName"] = projectHierarchy["name"]
+    nodeDetails["projectLink"] = baseURL + "/codeinsight/FNCI#myprojectdetails/?id=" + str(projectHierarchy["id"]) + "&tab=projectInventory"
+
+    projectList = [nodeDetails]
+
+    if includeChildProjects:
+        projectList = create_project_hierarchy(projectHierarchy, projectHierarchy["id"], projectList, baseURL)
+
+    return projectList
+
 #----------------------------------------------#
 def create_project_hierarchy(project, parentID, projectList, baseURL):
     logger.debug("Entering create_project_hierarchy.")
@@ -226,7 +542,68 @@ def create_project_hierarchy(project, parentID, projectList, baseURL):
     return projectList
 
 #----------------------------------------------#
-def determine_application_details(baseURL, projectName, projectID, authToken):
+def get_project_data(baseURL, projectName, projectID, authToken, includeVulnerabilities, incrementalMode, releaseVersion, pageExecutor=None, inventoryPageSize=0, inventoryPageWorkers=1):
+    logger.debug("Entering get_project_data for project %s" %projectName)
+
+    projectInformation = common.api.project.get_project_information.get_project_information_summary(baseURL, projectID, authToken)
+    applicationDetails = determine_application_details(projectName, projectInformation)
+
+    # Only refetch the inventory if the project has changed since the last snapshot
+    projectSnapshot = None
+    if incrementalMode:
+        projectSnapshot = {}
+        projectSnapshot["fingerprint"] = get_project_fingerprint(projectInformation)
+        projectSnapshot["releaseVersion"] = releaseVersion
+
+        previousSnapshot = report_cache.get_cached_value("projectSnapshots", get_project_snapshot_key(baseURL, projectID, includeVulnerabilities))
+
+        projectSnapshot["snapshotVersion"] = snapshotVersion
+
+        if previousSnapshot is not None:
+            if previousSnapshot.get("snapshotVersion") == snapshotVersion and previousSnapshot["fingerprint"] == projectSnapshot["fingerprint"] and previousSnapshot["releaseVersion"] == releaseVersion:
+                return applicationDetails, None, previousSnapshot
+
+    # Fetch the inventory a page at a time?  Fall back to a single request if the
+    # paged request fails (i.e. the API responses are being replayed)
+    if pageExecutor is not None:
+        try:
+            projectInventorySummary = api_inventory.InventoryPages(baseURL, projectID, authToken, includeVulnerabilities, inventoryPageSize, pageExecutor, inventoryPageWorkers)
+            return applicationDetails, projectInventorySummary, projectSnapshot
+        except (RuntimeError, ValueError, KeyError, requests.exceptions.RequestException) as e:
+            logger.warning("    Unable to fetch paged inventory for project %s: %s" %(projectName, e))
+
+    # Include vulnerability data?
+    if includeVulnerabilities:
+        # Just default to v3 summary data
+        projectInventorySummary = common.api.project.get_inventory_summary.get_project_inventory_with_v3_summary(baseURL, projectID, authToken)
+    else:
+        projectInventorySummary = common.api.project.get_inventory_summary.get_project_inventory_without_vulns_summary(baseURL, projectID, authToken)
+
+    return applicationDetails, projectInventorySummary, projectSnapshot
+
+#----------------------------------------------#
+def get_project_fingerprint(projectInformation):
+    # Any change to the project details (last updated/scanned dates, inventory
+    # counts, custom fields etc) will result in a new fingerprint.  Changes to an
+    # item's license or new vulnerabilities may not so snapshots also expire
+    # after snapshotMaxAge hours
+    return hashlib.sha256(json.dumps(projectInformation, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+#----------------------------------------------#
+def get_project_snapshot_key(baseURL, projectID, includeVulnerabilities):
+    return baseURL + "|" + str(projectID) + "|" + str(includeVulnerabilities)
+
+#----------------------------------------------#
+def save_project_snapshot(baseURL, projectID, includeVulnerabilities, projectSnapshot, inventoryCount, projectInventoryData, snapshotMaxAge):
+    logger.debug("Entering save_project_snapshot for project %s" %projectID)
+
+    projectSnapshot["inventoryCount"] = inventoryCount
+    projectSnapshot["inventoryData"] = projectInventoryData
+
+    report_cache.set_cached_value("projectSnapshots", get_project_snapshot_key(baseURL, projectID, includeVulnerabilities), projectSnapshot, snapshotMaxAge * 3600)
+
+#----------------------------------------------#
+def determine_application_details(projectName, projectInformation):
     logger.debug("Entering determine_application_details.")
     # Create a application name for the report if the custom fields are populated
     # Default values
@@ -235,8 +612,6 @@ def determine_application_details(baseURL, projectName, projectID, authToken):
     applicationPublisher = ""
     applicationDetailsString = ""
 
-    projectInformation = common.api.project.get_project_information.get_project_information_summary(baseURL, projectID, authToken)
-
     # Project level custom fields added in 2022R1
     if "customFields" in projectInformation:
         customFields = projectInformation["customFields"]
@@ -9,13 +9,21 @@ File : report_errors.py
 '''
 
 import logging
-import os
-import base64
 
 import _version
+import report_assets
 
 logger = logging.getLogger(__name__)
 
+# CDN files used by the report (see report_assets.cdnAssets)
+errorStylesheets = [
+    "https://stackpath.bootstrapcdn.com/bootstrap/4.5.1/css/bootstrap.min.css",
+    "https://cdnjs.cloudflare.com/ajax/libs/twitter-bootstrap/4.1.3/css/bootstrap.css",
+]
+errorScripts = [
+    "https://code.jquery.com/jquery-3.5.1.slim.min.js",
+]
+
 #--------------------------------------------------------------------------------#
 def create_error_report(reportData):
     logger.info("Entering create_error_report")
@@ -41,15 +49,8 @@ def generate_error_report(reportData):
     errorMsg = reportData["errorMsg"]
     reportTimeStamp = reportData["reportTimeStamp"] 
 
-    scriptDirectory = os.path.dirname(os.path.realpath(__file__))
-    cssFile =  os.path.join(scriptDirectory, "report_branding/css/revenera_common.css")
-    logoImageFile =  os.path.join(scriptDirectory, "report_branding/images/logo_reversed.svg")
-    iconFile =  os.path.join(scriptDirectory, "report_branding/images/favicon-revenera.ico")
-
-    #########################################################
-    #  Encode the image files
-    encodedLogoImage = encodeImage(logoImageFile)
-    encodedfaviconImage = encodeImage(iconFile)
+    # Use the cached branding and (optionally) inlined CDN files
+    inlineAssets = reportData["reportSettings"]["htmlInlineAssets"]
 
     # Grab the current date/time for report date stamp
     htmlFile = reportFileNameBase + ".html"
@@ -64,36 +65,7 @@ def generate_error_report(reportData):
         raise
 
     html_ptr.write("<html>\n") 
-    html_ptr.write("    <head>\n")
-    html_ptr.write("        <!-- Required meta tags --> \n")
-    html_ptr.write("        <meta charset='utf-8'>  \n")
-    html_ptr.write("        <meta name='viewport' content='width=device-width, initial-scale=1, shrink-to-fit=no'> \n")
-
-    html_ptr.write(''' 
-        <link rel="stylesheet" href="https://stackpath.bootstrapcdn.com/bootstrap/4.5.1/css/bootstrap.min.css" integrity="sha384-VCmXjywReHh4PwowAiWNagnWcLhlEJLA5buUprzK8rxFgeH0kww/aWY76TfkUoSX" crossorigin="anonymous">
-        <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/twitter-bootstrap/4.1.3/css/bootstrap.css">
-    ''')
-
-
-    html_ptr.write("        <style>\n")
-
-    # Add the contents of the css file to the head block
-    try:
-        f_ptr = open(cssFile)
-        logger.debug("Adding css file details")
-        for line in f_ptr:
-            html_ptr.write("            %s" %line)
-        f_ptr.close()
-    except:
-        logger.error("Unable to open %s" %cssFile)
-        print("Unable to open %s" %cssFile)
-
-
-    html_ptr.write("        </style>\n")  
-
-    html_ptr.write("    	<link rel='icon' type='image/png' href='data:image/png;base64, {}'>\n".format(encodedfaviconImage.decode('utf-8')))
-    html_ptr.write("        <title>%s</title>\n" %(reportName))
-    html_ptr.write("    </head>\n") 
+    html_ptr.write(report_assets.get_html_head(reportName, errorStylesheets, inlineAssets))
 
     html_ptr.write("<body>\n")
     html_ptr.write("<div class=\"container-fluid\">\n")
@@ -104,7 +76,7 @@ def generate_error_report(reportData):
     html_ptr.write("<!-- BEGIN HEADER -->\n")
     html_ptr.write("<div class='header'>\n")
     html_ptr.write("  <div class='logo'>\n")
-    html_ptr.write("    <img src='data:image/svg+xml;base64,{}' style='height: 5%;'>\n".format(encodedLogoImage.decode('utf-8')))
+    html_ptr.write("    <img src='data:image/svg+xml;base64,{}' style='height: 5%;'>\n".format(report_assets.get_logo_image()))
     html_ptr.write("  </div>\n")
     html_ptr.write("<div class='report-title'>%s</div>\n" %reportName)
     html_ptr.write("</div>\n")
@@ -136,10 +108,7 @@ def generate_error_report(reportData):
     # Add javascript 
     #---------------------------------------------------------------------------------------------------
 
-    html_ptr.write('''
-
-    <script src="https://code.jquery.com/jquery-3.5.1.slim.min.js" integrity="sha384-DfXdz2htPH0lsSSs5nCTpuj/zy4C+OGpamoFVy38MVBnE+IbbVYUew+OrCXaRkfj" crossorigin="anonymous"></script>
-    ''')
+    html_ptr.write(report_assets.get_html_scripts(errorScripts, inlineAssets))
 
     html_ptr.write("</body>\n") 
     html_ptr.write("</html>\n") 
@@ -148,16 +117,3 @@ def generate_error_report(reportData):
     logger.info("    Exiting generate_error_report")
     return htmlFile
 
-
-####################################################################
-def encodeImage(imageFile):
-
-    #############################################
-    # Create base64 variable for branding image
-    try:
-        with open(imageFile,"rb") as image:
-            encodedImage = base64.b64encode(image.read())
-            return encodedImage
-    except:
-        logger.error("Unable to open %s" %imageFile)
-        raise
\ No newline at end of file
@@ -0,0 +1,256 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Author : sgeary
+Created On : Sun Oct 18 2026
+File : report_inventory.py
+'''
+import logging
+import heapq
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import weakref
+from operator import attrgetter
+
+logger = logging.getLogger(__name__)
+
+#  Fields stored for each inventory item.  The project level values are held
+#  once per project and shared by all of the inventory items for that project
+inventoryFields = ["inventoryID", "inventoryItemName", "componentName", "componentVersionName", "selectedLicenseName", "selectedLicenseUrl", "componentUrl", "hasVulnerabilities", "purlString", "selectedLicenseIsSPDX"]
+
+#  Record values used to order the inventory for each of the supported sort orders
+inventorySortKeys = {
+    "component" : attrgetter("componentName", "componentVersionName", "selectedLicenseName"),
+    "project" : attrgetter("applicationNameVersion", "componentName", "componentVersionName", "selectedLicenseName"),
+    "license" : attrgetter("selectedLicenseName", "componentName", "componentVersionName"),
+}
+
+#------------------------------------------------------------------#
+class ProjectDetails:
+    __slots__ = ["projectID", "projectName", "projectLink", "applicationNameVersion"]
+
+    def __init__(self, projectID, projectName, projectLink, applicationNameVersion):
+        self.projectID = projectID
+        self.projectName = projectName
+        self.projectLink = projectLink
+        self.applicationNameVersion = applicationNameVersion
+
+#------------------------------------------------------------------#
+class InventoryRecord:
+    __slots__ = ["project"] + inventoryFields
+
+    def __init__(self, project, inventoryID, inventoryItemName, componentName, componentVersionName, selectedLicenseName, selectedLicenseUrl, componentUrl, hasVulnerabilities, purlString, selectedLicenseIsSPDX=False):
+        self.project = project
+        self.inventoryID = inventoryID
+        self.inventoryItemName = inventoryItemName
+        # The same component/version/license values repeat across projects
+        self.componentName = intern_value(componentName)
+        self.componentVersionName = intern_value(componentVersionName)
+        self.selectedLicenseName = intern_value(selectedLicenseName)
+        self.selectedLicenseUrl = intern_value(selectedLicenseUrl)
+        self.componentUrl = componentUrl
+        self.hasVulnerabilities = hasVulnerabilities
+        self.purlString = purlString
+        self.selectedLicenseIsSPDX = selectedLicenseIsSPDX  # The license name is the Code Insight SPDX identifier
+
+    @property
+    def projectName(self):
+        return self.project.projectName
+
+    @property
+    def projectLink(self):
+        return self.project.projectLink
+
+    @property
+    def applicationNameVersion(self):
+        return self.project.applicationNameVersion
+
+    @property
+    def projects(self):
+        return [self.project]
+
+    @property
+    def inventoryLink(self):
+        return self.project.projectLink + "&pinv=" + str(self.inventoryID)
+
+    def to_dict(self):
+        # Project values are not included since they are restored from the project
+        return {fieldName : getattr(self, fieldName) for fieldName in inventoryFields}
+
+    @classmethod
+    def from_dict(cls, project, inventoryValues):
+        return cls(project, **inventoryValues)
+
+#------------------------------------------------------------------#
+class ComponentGroup:
+    # A component/version/license/purl and the projects it appears in
+    __slots__ = ["groupID", "inventoryItemName", "componentName", "componentVersionName", "selectedLicenseName", "selectedLicenseUrl", "componentUrl", "hasVulnerabilities", "purlString", "selectedLicenseIsSPDX", "projects", "projectIDs", "inventoryIDs"]
+
+    def __init__(self, groupID, inventoryRecord):
+        self.groupID = groupID
+        self.inventoryItemName = inventoryRecord.inventoryItemName
+        self.componentName = inventoryRecord.componentName
+        self.componentVersionName = inventoryRecord.componentVersionName
+        self.selectedLicenseName = inventoryRecord.selectedLicenseName
+        self.selectedLicenseUrl = inventoryRecord.selectedLicenseUrl
+        self.componentUrl = inventoryRecord.componentUrl
+        self.hasVulnerabilities = False
+        self.purlString = inventoryRecord.purlString
+        self.selectedLicenseIsSPDX = inventoryRecord.selectedLicenseIsSPDX
+        self.projects = []
+        self.projectIDs = set()  # For checking the projects already added
+        self.inventoryIDs = []
+
+    def add_inventory_record(self, inventoryRecord):
+        self.inventoryIDs.append(inventoryRecord.inventoryID)
+        self.hasVulnerabilities = self.hasVulnerabilities or inventoryRecord.hasVulnerabilities
+        # Projects are added in hierarchy order and the same component can be
+        # in a project more than once
+        if inventoryRecord.project.projectID not in self.projectIDs:
+            self.projectIDs.add(inventoryRecord.project.projectID)
+            self.projects.append(inventoryRecord.project)
+
+    @property
+    def projectName(self):
+        return ", ".join(project.projectName for project in self.projects)
+
+    @property
+    def applicationNameVersion(self):
+        return ", ".join(project.applicationNameVersion for project in self.projects)
+
+#------------------------------------------------------------------#
+class SortedInventory:
+    # Inventory records for the streaming pipeline.  The records are sorted in
+    # runs of at most runSize records which are spilled to disk and merged back
+    # in order (external merge sort) each time the inventory is read
+    recordsPerBlock = 1000  # Records pickled together within a run file
+
+    def __init__(self, sortOrder, runSize):
+        self.sortOrder = get_sort_order(sortOrder)
+        self.runSize = max(1, runSize)
+        self.projects = {}  # ProjectDetails restored for the records read back from the runs
+        self.runFiles = []
+        self.runRecords = []  # Records not yet spilled to disk
+        self.recordCount = 0
+        self.runDirectory = tempfile.mkdtemp(prefix="_sbom_inventory_")
+        self.finalizer = weakref.finalize(self, shutil.rmtree, self.runDirectory, True)
+
+    def __getstate__(self):
+        # Copies sent to the artifact processes read the runs but never remove them
+        state = dict(self.__dict__)
+        del state["finalizer"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.finalizer = None
+
+    def __len__(self):
+        return self.recordCount
+
+    def add_record(self, inventoryRecord):
+        self.projects[inventoryRecord.project.projectID] = inventoryRecord.project
+        self.runRecords.append(inventoryRecord)
+        self.recordCount += 1
+
+        if len(self.runRecords) >= self.runSize:
+            self.spill_run()
+
+    def spill_run(self):
+        self.runRecords.sort(key=inventorySortKeys[self.sortOrder])
+
+        runFile = os.path.join(self.runDirectory, "run-%s" %len(self.runFiles))
+        logger.debug("    Writing %s inventory records to %s", len(self.runRecords), runFile)
+
+        with open(runFile, "wb") as run_ptr:
+            for blockStart in range(0, len(self.runRecords), self.recordsPerBlock):
+                recordBlock = [(inventoryRecord.project.projectID, [getattr(inventoryRecord, fieldName) for fieldName in inventoryFields]) for inventoryRecord in self.runRecords[blockStart:blockStart + self.recordsPerBlock]]
+                pickle.dump(recordBlock, run_ptr, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self.runFiles.append(runFile)
+        self.runRecords = []
+
+    def read_run(self, runFile):
+        with open(runFile, "rb") as run_ptr:
+            while True:
+                try:
+                    recordBlock = pickle.load(run_ptr)
+                except EOFError:
+                    return
+
+                for projectID, inventoryValues in recordBlock:
+                    yield InventoryRecord(self.projects[projectID], *inventoryValues)
+
+    def __iter__(self):
+        # The runs are in the order the records were added and heapq.merge keeps
+        # equal records in run order so the order matches a sort of all records
+        runs = [self.read_run(runFile) for runFile in self.runFiles]
+        runs.append(iter(sorted(self.runRecords, key=inventorySortKeys[self.sortOrder])))
+
+        return heapq.merge(*runs, key=inventorySortKeys[self.sortOrder])
+
+    def remove_runs(self):
+        if self.finalizer is not None:
+            self.finalizer()
+
+#------------------------------------------------------------------#
+def add_component_group(componentGroups, groupIndex, inventoryRecord):
+
+    groupKey = (inventoryRecord.componentName, inventoryRecord.componentVersionName, inventoryRecord.selectedLicenseName, inventoryRecord.purlString)
+
+    componentGroup = groupIndex.get(groupKey)
+    if componentGroup is None:
+        componentGroup = ComponentGroup(len(componentGroups), inventoryRecord)
+        groupIndex[groupKey] = componentGroup
+        componentGroups[componentGroup.groupID] = componentGroup
+
+    componentGroup.add_inventory_record(inventoryRecord)
+
+#------------------------------------------------------------------#
+def intern_value(value):
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+#------------------------------------------------------------------#
+def create_inventory_order(inventoryData, sortOrder):
+    logger.info("Entering create_inventory_order")
+
+    # Only the IDs are sorted so the records themselves are never copied
+    sortKey = inventorySortKeys[get_sort_order(sortOrder)]
+    return sorted(inventoryData, key=lambda inventoryID: sortKey(inventoryData[inventoryID]))
+
+#------------------------------------------------------------------#
+def get_sort_order(sortOrder):
+
+    if sortOrder not in inventorySortKeys:
+        logger.error("Invalid inventory sort order %s.  Using component order" %sortOrder)
+        return "component"
+
+    return sortOrder
+
+#------------------------------------------------------------------#
+def ordered_inventory(reportData):
+
+    inventoryData = reportData["inventoryData"]
+
+    # Streamed inventory is merged back in order from its sorted runs
+    if isinstance(inventoryData, SortedInventory):
+        for inventoryRecord in inventoryData:
+            yield inventoryRecord.inventoryID, inventoryRecord
+        return
+
+    for inventoryID in reportData["inventoryOrder"]:
+        yield inventoryID, inventoryData[inventoryID]
+
+#------------------------------------------------------------------#
+def remove_sorted_runs(reportData):
+
+    # The spilled runs of streamed inventory are removed once the artifacts are created
+    if isinstance(reportData.get("inventoryData"), SortedInventory):
+        reportData["inventoryData"].remove_runs()
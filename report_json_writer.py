@@ -0,0 +1,82 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Author : sgeary
+Created On : Sun Oct 18 2026
+File : report_json_writer.py
+'''
+import logging
+import json
+import re
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+jsonWriteBufferSize = 1024 * 1024
+itemsPerWrite = 500  # Number of encoded array items joined for each write
+
+# A single SPDX license identifier such as MIT or GPL-2.0-or-later
+spdxLicenseIdPattern = re.compile(r"[A-Za-z0-9][A-Za-z0-9.\-+]*")
+licenseRefInvalidCharacters = re.compile(r"[^A-Za-z0-9.\-]+")
+
+#------------------------------------------------------------------#
+def write_json_document(jsonFile, documentValues, streamedArrays):
+    logger.info("        Entering write_json_document for %s" %jsonFile)
+
+    # The small document level values are written as usual while each
+    # streamed array is written an item at a time from its iterator so the
+    # complete document is never held in memory
+    with open(jsonFile, "w", encoding="utf-8", buffering=jsonWriteBufferSize) as json_ptr:
+        json_ptr.write("{\n")
+
+        documentEntries = ["  %s: %s" %(json.dumps(valueName), json.dumps(value, indent=2).replace("\n", "\n  ")) for valueName, value in documentValues.items()]
+        json_ptr.write(",\n".join(documentEntries))
+        addSeparator = len(documentEntries) > 0
+
+        for arrayName, arrayItems in streamedArrays:
+            if addSeparator:
+                json_ptr.write(",\n")
+            addSeparator = True
+
+            json_ptr.write("  %s: [" %json.dumps(arrayName))
+            write_json_array_items(json_ptr, arrayItems)
+            json_ptr.write("\n  ]")
+
+        json_ptr.write("\n}\n")
+
+#------------------------------------------------------------------#
+def write_json_array_items(json_ptr, arrayItems):
+
+    itemBuffer = []
+    blockPrefix = "\n    "
+
+    for arrayItem in arrayItems:
+        itemBuffer.append(json.dumps(arrayItem, separators=(",", ":")))
+
+        if len(itemBuffer) == itemsPerWrite:
+            json_ptr.write(blockPrefix + ",\n    ".join(itemBuffer))
+            blockPrefix = ",\n    "
+            itemBuffer = []
+
+    if itemBuffer:
+        json_ptr.write(blockPrefix + ",\n    ".join(itemBuffer))
+
+#------------------------------------------------------------------#
+def get_sbom_timestamp(fileNameTimeStamp):
+    # The report time stamp is local time so convert it to UTC
+    reportTime = datetime.strptime(fileNameTimeStamp, "%Y%m%d-%H%M%S").astimezone(timezone.utc)
+    return reportTime.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+#------------------------------------------------------------------#
+def is_spdx_license_id(inventoryItem):
+    # Only a license whose name came from its Code Insight SPDX identifier is on
+    # the SPDX license list.  Custom licenses (LicenseRef-) and expressions are not
+    licenseName = inventoryItem.selectedLicenseName
+    return inventoryItem.selectedLicenseIsSPDX and bool(spdxLicenseIdPattern.fullmatch(licenseName)) and not licenseName.startswith("LicenseRef-")
+
+#------------------------------------------------------------------#
+def get_license_ref(licenseName):
+    # LicenseRef- identifiers may only contain letters, numbers, . and -
+    return "LicenseRef-" + (licenseRefInvalidCharacters.sub("-", licenseName).strip("-") or "Unknown")
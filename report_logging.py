@@ -0,0 +1,106 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Author : sgeary
+Created On : Sun Oct 18 2026
+File : report_logging.py
+'''
+import atexit, logging, logging.handlers, os, queue
+
+logger = logging.getLogger(__name__)
+
+logFormat = "%(asctime)s,%(msecs)-3d  %(levelname)-8s [%(filename)-30s:%(lineno)-4d]  %(message)s"
+logDateFormat = "%Y-%m-%d:%H:%M:%S"
+
+logLevels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+
+queueListener = None
+logFileName = None
+
+#----------------------------------------------------------------------#
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    # The records are formatted by the listener thread rather than when they
+    # are queued.  The logged values are not modified after the logging call
+    def prepare(self, record):
+        return record
+
+#----------------------------------------------------------------------#
+def configure_logging(logfileName, logLevel=logging.DEBUG):
+    global queueListener, logFileName
+
+    # Start with an empty log file for each run.  The file is then appended
+    # to so any forked worker processes can safely write to it as well
+    open(logfileName, "w").close()
+    logFileName = logfileName
+
+    # The log file is written by a background thread so the report is not
+    # held up by file writes.  Records are only queued by the logging calls
+    logQueue = queue.SimpleQueue()
+    queueListener = logging.handlers.QueueListener(logQueue, create_file_handler(logfileName))
+    queueListener.start()
+
+    rootLogger = logging.getLogger()
+    rootLogger.addHandler(DeferredQueueHandler(logQueue))
+    rootLogger.setLevel(logLevel)
+
+    atexit.register(stop_logging)
+
+    # A forked worker does not have the listener thread so it writes directly
+    if hasattr(os, "register_at_fork"):
+        os.register_at_fork(after_in_child=use_direct_file_handler)
+
+#----------------------------------------------------------------------#
+def create_file_handler(logfileName):
+
+    fileHandler = logging.FileHandler(logfileName, mode="a")
+    fileHandler.setFormatter(logging.Formatter(logFormat, datefmt=logDateFormat))
+
+    return fileHandler
+
+#----------------------------------------------------------------------#
+def use_direct_file_handler():
+    global queueListener
+
+    rootLogger = logging.getLogger()
+    for handler in list(rootLogger.handlers):
+        if isinstance(handler, DeferredQueueHandler):
+            rootLogger.removeHandler(handler)
+
+    rootLogger.addHandler(create_file_handler(logFileName))
+    queueListener = None
+
+#----------------------------------------------------------------------#
+def set_log_level(logLevel):
+
+    logLevel = str(logLevel).upper()
+
+    if logLevel not in logLevels:
+        logger.error("Invalid log level %s.  Valid levels are %s" %(logLevel, ", ".join(logLevels)))
+        return
+
+    logger.info("Setting log level to %s" %logLevel)
+    logging.getLogger().setLevel(logLevel)
+
+#----------------------------------------------------------------------#
+def restart_log_file():
+
+    # A long running process (report daemon) starts an empty log file for each
+    # report.  Anything still queued is written before the file is emptied
+    if queueListener is not None:
+        queueListener.stop()
+
+    open(logFileName, "w").close()
+
+    if queueListener is not None:
+        queueListener.start()
+
+#----------------------------------------------------------------------#
+def stop_logging():
+    global queueListener
+
+    # Write out anything still queued
+    if queueListener is not None:
+        queueListener.stop()
+        queueListener = None
@@ -0,0 +1,100 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Author : sgeary
+Created On : Sun Oct 18 2026
+File : report_metrics.py
+'''
+import logging, json, math, threading, time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+#  Timings collected during the report run.  Each category (phases, endpoints
+#  etc.) maps a name to the list of durations recorded for it in seconds
+reportTimings = {}
+timingsLock = threading.Lock()
+
+#----------------------------------------------------------------------#
+@contextmanager
+def span(spanName, category="phases"):
+
+    startTime = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_timing(category, spanName, time.perf_counter() - startTime)
+
+#----------------------------------------------------------------------#
+def record_timing(category, timingName, duration):
+
+    with timingsLock:
+        reportTimings.setdefault(category, {}).setdefault(timingName, []).append(duration)
+
+#----------------------------------------------------------------------#
+def reset_metrics():
+
+    # A long running process (report daemon) starts each report with no timings
+    with timingsLock:
+        reportTimings.clear()
+
+#----------------------------------------------------------------------#
+def get_metrics_summary():
+
+    metricsSummary = {}
+
+    with timingsLock:
+        for category, categoryTimings in reportTimings.items():
+            metricsSummary[category] = {}
+            for timingName, durations in categoryTimings.items():
+                metricsSummary[category][timingName] = summarize_durations(durations)
+
+    return metricsSummary
+
+#----------------------------------------------------------------------#
+def summarize_durations(durations):
+
+    sortedDurations = sorted(durations)
+
+    return {
+        "count" : len(sortedDurations),
+        "total" : round(sum(sortedDurations), 6),
+        "p50" : round(get_percentile(sortedDurations, 50), 6),
+        "p95" : round(get_percentile(sortedDurations, 95), 6),
+        "max" : round(sortedDurations[-1], 6)
+    }
+
+#----------------------------------------------------------------------#
+def get_percentile(sortedDurations, percentile):
+    # Nearest rank percentile
+    rank = max(1, math.ceil(percentile / 100 * len(sortedDurations)))
+    return sortedDurations[rank - 1]
+
+#----------------------------------------------------------------------#
+def log_metrics_summary(metricsSummary):
+
+    for category, categorySummary in metricsSummary.items():
+        logger.info("Timing summary for %s:" %category)
+        for timingName, timingSummary in sorted(categorySummary.items(), key=lambda x: x[1]["total"], reverse=True):
+            logger.info("    %-70s count: %-6s total: %8.2fs  p50: %6.3fs  p95: %6.3fs  max: %6.3fs" %(timingName, timingSummary["count"], timingSummary["total"], timingSummary["p50"], timingSummary["p95"], timingSummary["max"]))
+
+#----------------------------------------------------------------------#
+def write_metrics_file(metricsFile, reportDetails):
+    logger.info("Entering write_metrics_file")
+
+    metricsSummary = get_metrics_summary()
+    log_metrics_summary(metricsSummary)
+
+    metricsData = dict(reportDetails)
+    metricsData.update(metricsSummary)
+
+    try:
+        with open(metricsFile, "w") as metrics_ptr:
+            json.dump(metricsData, metrics_ptr, indent=2)
+    except OSError as e:
+        logger.error("Unable to write metrics file %s: %s" %(metricsFile, e))
+        return
+
+    logger.info("    Metrics written to %s" %metricsFile)
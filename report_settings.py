@@ -0,0 +1,106 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Author : sgeary
+Created On : Sun Oct 18 2026
+File : report_settings.py
+'''
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Prefix used for any report specific tuning values within server_properties.json
+settingsPrefix = "sbom."
+
+#  Default values for the optional report settings.  Any of these can be
+#  overridden in the server_properties.json file by prefixing the name
+#  i.e.  "sbom.projectWorkers" : 4
+defaultReportSettings = {
+    "logLevel" : "DEBUG",  # DEBUG, INFO, WARNING or ERROR for the report log file
+    "projectWorkers" : 8,  # Max number of projects to collect data for concurrently
+    "inventoryPageSize" : 0,  # Inventory items per page for the paged inventory fetch (0 uses a single request)
+    "inventoryPageWorkers" : 4,  # Max number of inventory pages fetched concurrently
+    "cacheTTL" : 24,  # Hours to keep persistent cache entries (0 disables the cache)
+    "hierarchyCacheTTL" : 0,  # Minutes a project hierarchy can be reused from the persistent cache
+    "incrementalMode" : False,  # Reuse inventory snapshots for projects that have not changed
+    "snapshotMaxAge" : 24,  # Hours before a project inventory snapshot is always refreshed
+    "inventorySortOrder" : "component",  # component, project or license order for the inventory rows
+    "streamingPipeline" : False,  # Stream the inventory into sorted runs on disk rather than holding it in memory
+    "pipelineRunSize" : 50000,  # Inventory items held in memory before a sorted run is written to disk
+    "componentWorkers" : 8,  # Max number of concurrent component lookups for purl creation
+    "persistComponentCache" : False,  # Keep component details in the persistent cache across runs
+    "htmlDataMode" : "static",  # static, json or auto for how the HTML inventory table is created
+    "htmlJsonThreshold" : 10000,  # Inventory size above which the auto mode embeds json data
+    "htmlInlineAssets" : False,  # Embed the CDN stylesheets and scripts so the HTML report can be viewed offline
+    "htmlMetricsAppendix" : False,  # Add the report run timings collected so far to the end of the HTML report
+    "xlsxConstantMemory" : False,  # Flush each xlsx row to disk as it is written
+    "artifactWorkers" : 1,  # Number of processes used to create the report artifacts concurrently
+    "streamingUpload" : False,  # Create the report archive while it is uploaded rather than on disk
+    "reportDaemon" : False,  # Hand report requests to a running report daemon (report_daemon.py)
+    "daemonPort" : 8571,  # Local port the report daemon listens on
+    "batchWorkers" : 4,  # Max number of project reports created concurrently in batch mode
+    "httpPoolSize" : 16,  # Max number of pooled connections to the Code Insight server
+    "httpRetries" : 3,  # Retries for throttled (429) or failed (5xx) API requests
+    "httpBackoffFactor" : 0.5,  # Exponential backoff factor in seconds between retries
+    "apiRecordFile" : "",  # File to record the API responses to for later replay
+    "apiReplay" : False,  # Use the recorded API responses served at core.server.url by benchmarks/replay_server.py
+}
+
+#  Settings that must be one of a fixed set of values
+settingChoices = {
+    "htmlDataMode" : ["static", "json", "auto"],
+}
+
+trueOptions = ["true", "t", "yes", "y"]
+falseOptions = ["false", "f", "no", "n"]
+
+#----------------------------------------------------------------------#
+def get_report_settings(configData):
+    logger.info("Entering get_report_settings")
+
+    reportSettings = dict(defaultReportSettings)
+
+    for settingName, defaultValue in defaultReportSettings.items():
+
+        propertyName = settingsPrefix + settingName
+
+        if propertyName not in configData:
+            continue
+
+        settingValue = configData[propertyName]
+
+        try:
+            reportSettings[settingName] = convert_setting_value(settingValue, defaultValue)
+        except ValueError:
+            logger.error("Invalid value for %s: %s.  Using default value of %s" %(propertyName, settingValue, defaultValue))
+            continue
+
+        if settingName in settingChoices and reportSettings[settingName] not in settingChoices[settingName]:
+            logger.error("Invalid value for %s: %s.  Valid values are %s.  Using default value of %s" %(propertyName, settingValue, ", ".join(settingChoices[settingName]), defaultValue))
+            reportSettings[settingName] = defaultValue
+
+    logger.debug("    reportSettings: %s" %reportSettings)
+
+    return reportSettings
+
+#----------------------------------------------------------------------#
+def convert_setting_value(settingValue, defaultValue):
+
+    # Ensure the value matches the type of the default value
+    if isinstance(defaultValue, bool):
+        if isinstance(settingValue, bool):
+            return settingValue
+        elif str(settingValue).lower() in trueOptions:
+            return True
+        elif str(settingValue).lower() in falseOptions:
+            return False
+        else:
+            raise ValueError(settingValue)
+    elif isinstance(defaultValue, int):
+        return int(settingValue)
+    elif isinstance(defaultValue, float):
+        return float(settingValue)
+    else:
+        return str(settingValue)
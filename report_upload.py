@@ -0,0 +1,110 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Author : sgeary
+Created On : Sun Oct 18 2026
+File : report_upload.py
+'''
+import logging, os, threading, uuid, zipfile
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+uploadChunkSize = 64 * 1024
+
+#------------------------------------------------------------------#
+def stream_report_archive(baseURL, projectID, reportID, authToken, reports, reportFileNameBase):
+    logger.info("Entering stream_report_archive")
+
+    # Same archive layout as common.report_archive.create_report_zipfile.  The
+    # upload archive holds the viewable file and an archive of all formats
+    allFormatsArchiveName = reportFileNameBase + ".zip"
+    uploadArchiveName = reportFileNameBase + "_upload.zip"
+
+    # The archive is written into a pipe by one thread while the upload
+    # request reads the other end so nothing is written to disk
+    pipeReader, pipeWriter = os.pipe()
+    archiveReader = os.fdopen(pipeReader, "rb")
+    archiveWriter = os.fdopen(pipeWriter, "wb")
+
+    archiveErrors = []
+    archiveThread = threading.Thread(target=write_report_archive, args=(archiveWriter, reports, allFormatsArchiveName, archiveErrors))
+    archiveThread.start()
+
+    try:
+        uploadURL = baseURL + "/codeinsight/api/projects/" + str(projectID) + "/reports/" + str(reportID) + "/data"
+        boundary = uuid.uuid4().hex
+        headers = {"Authorization" : "Bearer " + authToken, "Content-Type" : "multipart/form-data; boundary=" + boundary}
+
+        logger.debug("    Streaming %s to %s" %(uploadArchiveName, uploadURL))
+        response = requests.post(uploadURL, headers=headers, data=create_multipart_body(archiveReader, boundary, uploadArchiveName, archiveThread, archiveErrors))
+    except Exception:
+        # The request is stopped before it is complete if the archive could not be created
+        if archiveErrors:
+            raise archiveErrors[0]
+        raise
+    finally:
+        archiveReader.close()
+        archiveThread.join()
+
+    if archiveErrors:
+        raise archiveErrors[0]
+
+    if response.status_code not in [200, 201]:
+        logger.error("Failed to upload %s.  Response code %s - %s" %(uploadArchiveName, response.status_code, response.text))
+        print("Failed to upload %s.  Response code %s" %(uploadArchiveName, response.status_code))
+        raise RuntimeError("Report upload failed with response code %s" %response.status_code)
+
+    logger.info("    %s uploaded" %uploadArchiveName)
+
+    # Remove the files since they have been uploaded to Code Insight
+    for reportFile in reports["allFormats"]:
+        try:
+            os.remove(reportFile)
+        except OSError:
+            logger.error("Error removing %s" %reportFile)
+
+#------------------------------------------------------------------#
+def write_report_archive(archiveWriter, reports, allFormatsArchiveName, archiveErrors):
+    logger.info("Entering write_report_archive")
+
+    try:
+        with archiveWriter:
+            with zipfile.ZipFile(archiveWriter, "w", zipfile.ZIP_DEFLATED) as uploadArchive:
+                uploadArchive.write(reports["viewable"])
+
+                # The all formats archive is streamed directly into its entry
+                with uploadArchive.open(allFormatsArchiveName, "w", force_zip64=True) as allFormatsEntry:
+                    with zipfile.ZipFile(allFormatsEntry, "w", zipfile.ZIP_DEFLATED) as allFormatsArchive:
+                        for reportFile in reports["allFormats"]:
+                            logger.debug("    Adding %s to %s" %(reportFile, allFormatsArchiveName))
+                            allFormatsArchive.write(reportFile)
+    except BrokenPipeError:
+        # The upload stopped reading so the request error will be reported
+        logger.error("Upload ended before the report archive was complete")
+    except Exception as archiveError:
+        logger.error("Unable to create report archive: %s" %archiveError)
+        archiveErrors.append(archiveError)
+
+#------------------------------------------------------------------#
+def create_multipart_body(archiveReader, boundary, uploadArchiveName, archiveThread, archiveErrors):
+
+    yield ("--%s\r\nContent-Disposition: form-data; name=\"file\"; filename=\"%s\"\r\nContent-Type: application/zip\r\n\r\n" %(boundary, uploadArchiveName)).encode("utf-8")
+
+    while True:
+        archiveChunk = archiveReader.read(uploadChunkSize)
+        if not archiveChunk:
+            break
+        yield archiveChunk
+
+    # The archive is closed (and so readable to its end) even when it failed part
+    # way through.  Without the closing boundary the upload is never completed so
+    # Code Insight doesn't store the partial archive as the report
+    archiveThread.join()
+    if archiveErrors:
+        raise archiveErrors[0]
+
+    yield ("\r\n--%s--\r\n" %boundary).encode("utf-8")
@@ -0,0 +1,44 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Author : sgeary
+Created On : Sun Oct 18 2026
+File : test_api_inventory.py
+'''
+import os, sys, threading, unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import api_inventory
+
+#----------------------------------------------------------------------#
+class PageExecutorTest(unittest.TestCase):
+
+    def test_pending_pages_are_cancelled(self):
+        pageExecutor = api_inventory.PageExecutor(max_workers=1)
+        releasePage = threading.Event()
+
+        # The only worker is busy so the later pages are still waiting to start
+        runningPage = pageExecutor.submit(releasePage.wait)
+        waitingPages = [pageExecutor.submit(int, pageNumber) for pageNumber in range(5)]
+
+        pageExecutor.cancel_pages()
+        releasePage.set()
+        pageExecutor.shutdown(wait=True)
+
+        self.assertTrue(runningPage.result())
+        self.assertTrue(all(waitingPage.cancelled() for waitingPage in waitingPages))
+        self.assertEqual(pageExecutor.pendingPages, set())
+
+    def test_fetched_pages_are_not_kept(self):
+        pageExecutor = api_inventory.PageExecutor(max_workers=2)
+        pageResults = [pageExecutor.submit(int, pageNumber).result() for pageNumber in range(5)]
+        pageExecutor.shutdown(wait=True)
+
+        self.assertEqual(pageResults, list(range(5)))
+        self.assertEqual(pageExecutor.pendingPages, set())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Author : sgeary
+Created On : Sun Oct 18 2026
+File : test_purl.py
+'''
+import importlib.util, os, sys, unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# purl imports the Code Insight common modules for the component lookups
+commonAvailable = importlib.util.find_spec("common") is not None
+if commonAvailable:
+    import purl
+
+#----------------------------------------------------------------------#
+@unittest.skipUnless(commonAvailable, "requires the Code Insight common modules")
+class CreatePurlStringTest(unittest.TestCase):
+
+    def test_packagist_vendor_package(self):
+        purlString = purl.create_purl_string("packagist", "laravel/framework - The Laravel Framework", "framework", "v5.5.0")
+        self.assertEqual(purlString, "pkg:composer/laravel/framework@v5.5.0")
+
+    def test_packagist_without_vendor(self):
+        purlString = purl.create_purl_string("packagist", "monolog - Logging for PHP", "monolog", "1.0")
+        self.assertEqual(purlString, "pkg:composer/monolog@1.0")
+
+    def test_github_owner_repository(self):
+        purlString = purl.create_purl_string("github", "owner/repo - description", "repo", "1.0")
+        self.assertEqual(purlString, "pkg:github/owner/repo@1.0")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+'''
+Copyright 2026 Flexera Software LLC
+See LICENSE.TXT for full license text
+SPDX-License-Identifier: MIT
+
+Author : sgeary
+Created On : Sun Oct 18 2026
+File : test_report_upload.py
+'''
+import io, os, shutil, sys, tempfile, unittest, zipfile
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import report_upload
+
+#----------------------------------------------------------------------#
+class FakeResponse(object):
+    status_code = 201
+    text = ""
+
+#----------------------------------------------------------------------#
+class StreamReportArchiveTest(unittest.TestCase):
+
+    def setUp(self):
+        self.reportDirectory = tempfile.mkdtemp()
+        self.currentDirectory = os.getcwd()
+        os.chdir(self.reportDirectory)
+
+        for reportFile in ["report.html", "report.xlsx"]:
+            with open(reportFile, "w") as reportOutput:
+                reportOutput.write("report content " * 1000)
+
+        # The body is read the same way the request would send it
+        self.uploadedBody = []
+        def post(uploadURL, headers, data):
+            for bodyChunk in data:
+                self.uploadedBody.append(bodyChunk)
+            return FakeResponse()
+
+        self.postPatch = mock.patch.object(report_upload.requests, "post", side_effect=post)
+        self.postPatch.start()
+
+    def tearDown(self):
+        self.postPatch.stop()
+        os.chdir(self.currentDirectory)
+        shutil.rmtree(self.reportDirectory)
+
+    def stream_reports(self, allFormats):
+        reports = {"viewable" : "report.html", "allFormats" : allFormats}
+        report_upload.stream_report_archive("http://localhost", 1, 2, "token", reports, "report")
+
+    def test_complete_archive_is_uploaded(self):
+        self.stream_reports(["report.html", "report.xlsx"])
+
+        uploadedBody = b"".join(self.uploadedBody)
+        self.assertTrue(uploadedBody.endswith(b"--\r\n"))
+
+        # The archive sits between the part headers and the closing boundary
+        archiveStart = uploadedBody.index(b"\r\n\r\n") + 4
+        archiveEnd = uploadedBody.rindex(b"\r\n--")
+        with zipfile.ZipFile(io.BytesIO(uploadedBody[archiveStart:archiveEnd])) as uploadArchive:
+            self.assertEqual(uploadArchive.namelist(), ["report.html", "report.zip"])
+
+        self.assertFalse(os.path.exists("report.xlsx"))
+
+    def test_failed_archive_is_not_completed(self):
+        with self.assertRaises(OSError):
+            self.stream_reports(["report.html", "missing.xlsx"])
+
+        # Without the closing boundary the partial archive is never a complete upload
+        uploadedBody = b"".join(self.uploadedBody)
+        self.assertFalse(uploadedBody.endswith(b"--\r\n"))
+
+        self.assertTrue(os.path.exists("report.xlsx"))
+
+if __name__ == "__main__":
+    unittest.main()